@@ -1,195 +1,129 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+"""
+マスターデータのキャラクター行の性別・種別を推定して一覧表示する
 
-import csv
-import re
+推定は gender_classifier.py のトークン単位の分類器で行い、各キャラクターに確信度を付ける。
+--mismatches を指定すると、現在の大項目（キャラクター(女性) など）と推定が食い違う行だけを
+確信度の高い順に表示する（gender_registry.tsv の見直し用）。
+
+    python3 analyze_character_gender.py
+    python3 analyze_character_gender.py --mismatches --min-confidence 0.5
+"""
+
+import argparse
 from collections import defaultdict
 
-def analyze_character_gender():
+from gender_classifier import FEMALE, MALE, NEUTRAL, NON_HUMAN, UNKNOWN, GenderClassifier
+from gender_registry import character_major, is_character_major
+from master_store import MASTER_FILE, MasterStore
+from tag_vectors import store_vectors
+
+# 推定の分類 -> 大項目の性別
+REGISTRY_GENDERS = {
+    FEMALE: '女性',
+    MALE: '男性',
+    NEUTRAL: '人外',
+    NON_HUMAN: '人外',
+}
+
+LABEL_NAMES = [
+    (FEMALE, '女性キャラクター'),
+    (MALE, '男性キャラクター'),
+    (NEUTRAL, '無性キャラクター（ロボット・AI・ポケモンなど）'),
+    (NON_HUMAN, '人外キャラクター（動物・妖怪・モンスターなど）'),
+    (UNKNOWN, '判定不能キャラクター'),
+]
+
+
+def analyze_character_gender(store, classifier=None):
     """
-    マスターデータからキャラクターを読み取り、性別・種別を分析する
+    キャラクター行（キャラクター / キャラクター(性別) / キャラクター再現）を1回の走査で分類する
+
+    分類 -> 中項目 -> [{'name', 'prompt', 'category', 'confidence', 'ranking'}] を返す
     """
-    
-    # 性別・種別分類用の辞書
-    female_keywords = {
-        # 明確な女性キーワード
-        'girl', 'woman', 'female', 'lady', 'maiden', 'princess', 'queen', 'goddess', 'witch', 'maid', 'nun', 'sister',
-        # 日本語名前の特徴的な終わりや要素
-        'chan', 'ko', 'mi', 'na', 'ka', 'ra', 'sa', 'ri', 'ki', 'yu', 'ai', 'ei', 'rei', 'mei',
-        # 作品固有の女性キャラクター
-        'saber', 'rin', 'sakura', 'illya', 'nero', 'artoria', 'jeanne', 'mash', 'nitocris', 'bb',
-        'reimu', 'marisa', 'cirno', 'remilia', 'flandre', 'patchouli', 'youmu', 'yuyuko', 'yukari',
-        'aqua', 'megumin', 'darkness', 'wiz', 'eris', 'yunyun',
-        'mikasa', 'historia', 'annie', 'sasha', 'pieck', 'ymir',
-        'ochako', 'tsuyu', 'momo', 'kyoka', 'mina', 'toru', 'nejire',
-        'nezuko', 'shinobu', 'mitsuri', 'kanao',
-        'zero_two', 'ichigo', 'kokoro',
-        'violet', 'cattleya', 'iris', 'erica',
-        'chika', 'kaguya', 'hayasaka', 'iino',
-        'raphtalia', 'filo', 'melty',
-        'emilia', 'rem', 'ram', 'beatrice', 'felt', 'priscilla', 'crusch', 'anastasia',
-        'albedo', 'shalltear', 'aura', 'mare', 'narberal', 'solution', 'lupusregina', 'yuri', 'entoma', 'cz',
-        'tanya', 'visha', 'mary',
-        'tohru', 'kanna', 'lucoa', 'elma', 'ilulu',
-        'chizuru', 'ruka', 'sumi', 'mami',
-        'nagatoro', 'gamo', 'yoshi', 'sakura',
-        'komi', 'tadano', 'najimi', 'yamai', 'agari',
-        'uzaki', 'hana', 'ami',
-        'maple', 'sally', 'kaede', 'risa', 'may', 'yui', 'chrome', 'izu',
-        'senku', 'kohaku', 'ruri', 'suika', 'minami', 'nikki',
-        'emma', 'norman', 'ray', 'gilda', 'anna', 'nat', 'lannion', 'thoma', 'conny',
-        'akane', 'kana', 'ruby', 'ai'
-    }
-    
-    male_keywords = {
-        # 明確な男性キーワード
-        'boy', 'man', 'male', 'king', 'prince', 'knight', 'warrior', 'hero', 'master', 'father', 'brother',
-        # 明確な男性キャラクター
-        'astolfo', 'gilgamesh', 'archer', 'lancer', 'berserker', 'rider', 'caster', 'assassin',
-        'shirou', 'kiritsugu', 'kirei', 'tokiomi',
-        'kazuma', 'subaru', 'ainz', 'momonga', 'naofumi', 'motoyasu', 'ren', 'itsuki',
-        'tanjiro', 'zenitsu', 'inosuke', 'giyu', 'rengoku', 'tengen', 'muichiro', 'gyomei', 'sanemi', 'obanai',
-        'deku', 'bakugo', 'todoroki', 'iida', 'kirishima', 'kaminari', 'sero', 'tokoyami', 'shoji', 'ojiro', 'sato', 'koda', 'aoyama', 'mineta',
-        'eren', 'armin', 'levi', 'erwin', 'jean', 'connie', 'reiner', 'bertholdt', 'zeke',
-        'gon', 'killua', 'kurapika', 'leorio',
-        'natsu', 'gray', 'erza', 'wendy', 'gajeel', 'levy', 'juvia',
-        'luffy', 'zoro', 'sanji', 'usopp', 'chopper', 'robin', 'franky', 'brook', 'jinbe',
-        'naruto', 'sasuke', 'kakashi', 'iruka', 'jiraiya', 'tsunade', 'orochimaru',
-        'ichigo', 'rukia', 'orihime', 'chad', 'ishida', 'renji', 'byakuya',
-        'goku', 'vegeta', 'gohan', 'piccolo', 'krillin', 'yamcha', 'tien', 'chiaotzu',
-        'yusuke', 'kuwabara', 'hiei', 'kurama',
-        'inuyasha', 'kagome', 'miroku', 'sango', 'shippo', 'sesshomaru',
-        'alucard', 'integra', 'seras',
-        'vash', 'wolfwood', 'meryl', 'milly',
-        'spike', 'jet', 'faye', 'ed', 'ein',
-        'shinji', 'rei', 'asuka', 'gendo', 'misato', 'ritsuko',
-        'kenshin', 'kaoru', 'yahiko', 'sanosuke', 'megumi',
-        'light', 'l', 'misa', 'near', 'mello', 'ryuk',
-        'edward', 'alphonse', 'winry', 'roy', 'riza', 'hughes',
-        'senku', 'chrome', 'gen', 'ukyo', 'tsukasa'
-    }
-    
-    neutral_keywords = {
-        # 無性・ロボット・AI
-        'robot', 'android', 'ai', 'machine', 'cyborg', 'automaton', 'golem', 'construct',
-        'pokemon', 'digimon', 'monster', 'creature', 'being', 'entity',
-        # ポケモン系
-        'pikachu', 'charizard', 'blastoise', 'venusaur', 'mewtwo', 'mew', 'lucario', 'gardevoir', 'lopunny',
-        'eevee', 'vaporeon', 'jolteon', 'flareon', 'espeon', 'umbreon', 'leafeon', 'glaceon', 'sylveon'
-    }
-    
-    non_human_keywords = {
-        # 人外・動物・妖怪・モンスター
-        'dragon', 'demon', 'devil', 'angel', 'spirit', 'ghost', 'zombie', 'vampire', 'werewolf',
-        'cat', 'dog', 'fox', 'wolf', 'bear', 'lion', 'tiger', 'rabbit', 'mouse', 'bird',
-        'youkai', 'oni', 'kitsune', 'tengu', 'kappa', 'yokai',
-        'slime', 'goblin', 'orc', 'elf', 'dwarf', 'fairy', 'pixie',
-        'anthro', 'furry', 'kemono', 'animal_ears', 'tail'
-    }
-    
-    # 結果格納用辞書
-    characters = {
-        'female': defaultdict(list),
-        'male': defaultdict(list),
-        'neutral': defaultdict(list),
-        'non_human': defaultdict(list),
-        'unknown': defaultdict(list)
-    }
-    
-    # TSVファイルを読み込み
-    try:
-        with open('/mnt/e/Project/Extension/Prompt/data-management/マスターデータ.tsv', 'r', encoding='utf-8') as file:
-            reader = csv.reader(file, delimiter='\t')
-            for row in reader:
-                if len(row) >= 4:
-                    category, subcategory, character_name, prompt = row[0], row[1], row[2], row[3]
-                    
-                    # キャラクター関連のカテゴリのみ処理
-                    if category in ['キャラクター', 'キャラクター再現']:
-                        # 分析用テキスト（小文字に変換して分析）
-                        text_to_analyze = f"{character_name} {prompt}".lower()
-                        
-                        # 性別・種別判定
-                        category_assigned = False
-                        
-                        # 1. 無性・ロボット判定（最優先）
-                        if any(keyword in text_to_analyze for keyword in neutral_keywords):
-                            characters['neutral'][subcategory].append({
-                                'name': character_name,
-                                'prompt': prompt,
-                                'category': category
-                            })
-                            category_assigned = True
-                        
-                        # 2. 人外判定
-                        elif any(keyword in text_to_analyze for keyword in non_human_keywords):
-                            characters['non_human'][subcategory].append({
-                                'name': character_name,
-                                'prompt': prompt,
-                                'category': category
-                            })
-                            category_assigned = True
-                        
-                        # 3. 男性判定
-                        elif any(keyword in text_to_analyze for keyword in male_keywords):
-                            characters['male'][subcategory].append({
-                                'name': character_name,
-                                'prompt': prompt,
-                                'category': category
-                            })
-                            category_assigned = True
-                        
-                        # 4. 女性判定（デフォルト的に最後に判定）
-                        elif any(keyword in text_to_analyze for keyword in female_keywords):
-                            characters['female'][subcategory].append({
-                                'name': character_name,
-                                'prompt': prompt,
-                                'category': category
-                            })
-                            category_assigned = True
-                        
-                        # 5. 判定不能
-                        if not category_assigned:
-                            characters['unknown'][subcategory].append({
-                                'name': character_name,
-                                'prompt': prompt,
-                                'category': category
-                            })
-    
-    except FileNotFoundError:
-        print("マスターデータファイルが見つかりません")
-        return None
-    except Exception as e:
-        print(f"エラーが発生しました: {e}")
-        return None
-    
+    classifier = classifier or GenderClassifier()
+    characters = {label: defaultdict(list) for label, _ in LABEL_NAMES}
+    vectors = store_vectors(store)
+
+    for row_id in store.ids():
+        category, subcategory, character_name, prompt = store.row(row_id)
+        if not (is_character_major(category) or category == 'キャラクター再現'):
+            continue
+        result = classifier.classify_vector(character_name, vectors[row_id])
+        characters[result.label][subcategory].append({
+            'name': character_name,
+            'prompt': prompt,
+            'category': category,
+            'confidence': result.confidence,
+            'ranking': result.ranking,
+        })
+
     return characters
 
-def print_results(characters):
+
+def find_mismatches(characters, min_confidence=0.0):
+    """現在の大項目と推定が食い違う行を確信度の高い順に返す"""
+    mismatches = []
+    for label, gender in REGISTRY_GENDERS.items():
+        expected = character_major(gender)
+        for subcategory, chars in characters[label].items():
+            for char in chars:
+                if (is_character_major(char['category']) and char['category'] != expected
+                        and char['confidence'] >= min_confidence):
+                    mismatches.append((subcategory, char, expected))
+    mismatches.sort(key=lambda item: (-item[1]['confidence'], item[0], item[1]['name']))
+    return mismatches
+
+
+def format_ranking(ranking):
+    return ', '.join(f"{label} {score:.1f}" for label, score in ranking)
+
+
+def print_results(characters, min_confidence=0.0):
     """結果を整形して出力"""
-    if not characters:
-        return
-    
-    for gender_type, type_name in [
-        ('female', '女性キャラクター'),
-        ('male', '男性キャラクター'),
-        ('neutral', '無性キャラクター（ロボット・AI・ポケモンなど）'),
-        ('non_human', '人外キャラクター（動物・妖怪・モンスターなど）'),
-        ('unknown', '判定不能キャラクター')
-    ]:
+    for gender_type, type_name in LABEL_NAMES:
+        groups = {subcategory: [char for char in chars if gender_type == UNKNOWN
+                                or char['confidence'] >= min_confidence]
+                  for subcategory, chars in characters[gender_type].items()}
         print(f"\n## {type_name}")
-        print(f"総数: {sum(len(chars) for chars in characters[gender_type].values())}件")
+        print(f"総数: {sum(len(chars) for chars in groups.values())}件")
         print("-" * 50)
-        
-        for subcategory in sorted(characters[gender_type].keys()):
-            chars = characters[gender_type][subcategory]
+
+        for subcategory in sorted(groups):
+            chars = groups[subcategory]
+            if not chars:
+                continue
             print(f"\n### {subcategory} ({len(chars)}件)")
-            for char in sorted(chars, key=lambda x: x['name']):
-                print(f"  - {char['name']} ({char['category']})")
+            for char in sorted(chars, key=lambda x: (-x['confidence'], x['name'])):
+                print(f"  - {char['name']} ({char['category']}) 確信度 {char['confidence']:.2f}")
                 if char['prompt'] != char['name']:
-                    print(f"    Prompt: {char['prompt'][:100]}...")
+                    print(f"    Prompt: {char['prompt'][:100]}")
+
+
+def print_mismatches(mismatches):
+    for subcategory, char, expected in mismatches:
+        print(f"{subcategory} / {char['name']}: {char['category']} -> {expected}？"
+              f" 確信度 {char['confidence']:.2f} [{format_ranking(char['ranking'])}]")
+        print(f"    Prompt: {char['prompt'][:100]}")
+    print(f"\n食い違い: {len(mismatches)}件")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='キャラクター性別・種別分析')
+    parser.add_argument('--mismatches', action='store_true',
+                        help='現在の大項目と推定が食い違う行だけを表示')
+    parser.add_argument('--min-confidence', type=float, default=0.0,
+                        help='これ未満の確信度の推定は表示しない')
+    args = parser.parse_args()
 
-if __name__ == "__main__":
     print("キャラクター性別・種別分析を開始します...")
-    characters = analyze_character_gender()
-    print_results(characters)
\ No newline at end of file
+    characters = analyze_character_gender(MasterStore.load(MASTER_FILE))
+    if args.mismatches:
+        print_mismatches(find_mismatches(characters, args.min_confidence))
+    else:
+        print_results(characters, args.min_confidence)
+
+
+if __name__ == "__main__":
+    main()
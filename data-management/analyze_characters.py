@@ -4,11 +4,13 @@
 import csv
 import re
 
-def analyze_character_extraction():
+from master_store import RAW_MASTER_FILE
+
+def analyze_character_extraction(input_file=RAW_MASTER_FILE):
     """キャラクター項目で問題のあるケースを分析"""
     problematic_cases = []
     
-    with open('/mnt/e/Project/Extension/Prompt/非整形マスター.tsv', 'r', encoding='utf-8') as f:
+    with open(input_file, 'r', encoding='utf-8') as f:
         reader = csv.reader(f, delimiter='\t')
         for row in reader:
             if len(row) >= 4:
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重複排除バックアップストア
+
+ファイル全体をコピーする代わりに、内容で区切った行チャンクを圧縮して
+ハッシュ名で保存する。数十行だけ変わったスナップショットは、変わったチャンク分
+（数KB）しか容量を使わない。
+
+使用法:
+    python3 backup_store.py snapshot マスターデータ.tsv --label before_translation
+    python3 backup_store.py list [--source マスターデータ.tsv]
+    python3 backup_store.py restore <スナップショットID> [--output 復元先]
+    python3 backup_store.py prune [--keep-last 20] [--keep-daily 30]
+    python3 backup_store.py import-legacy [--remove]
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import zlib
+from datetime import datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BASE_DIR)
+STORE_DIR = os.path.join(BASE_DIR, 'backups', 'store')
+
+# チャンク境界を決める行ハッシュの法（平均でこの行数ごとに区切る）
+CHUNK_MODULUS = 64
+# 1チャンクの最大行数（境界が現れない場合の上限）
+CHUNK_MAX_LINES = 512
+
+# 保持ポリシーの既定値
+DEFAULT_KEEP_LAST = 20
+DEFAULT_KEEP_DAILY = 30
+
+
+def _hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def split_chunks(data):
+    """
+    バイト列を行単位の内容定義チャンクに分割
+
+    行のハッシュで境界を決めるため、途中に行を追加・削除しても
+    前後のチャンクの区切りは変わらない
+    """
+    chunks = []
+    current = []
+    for line in data.splitlines(keepends=True):
+        current.append(line)
+        boundary = int.from_bytes(hashlib.blake2b(line, digest_size=4).digest(), 'big') % CHUNK_MODULUS == 0
+        if boundary or len(current) >= CHUNK_MAX_LINES:
+            chunks.append(b''.join(current))
+            current = []
+    if current:
+        chunks.append(b''.join(current))
+    return chunks
+
+
+class BackupStore:
+    """スナップショットとチャンクを管理するストア"""
+
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.snapshots_dir = os.path.join(root, 'snapshots')
+
+    # ============================================
+    # チャンク
+    # ============================================
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest + '.z')
+
+    def _put_chunk(self, chunk):
+        """チャンクを保存（既存なら何もしない）。新規に書いたバイト数を返す"""
+        digest = _hash(chunk)
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest, 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        compressed = zlib.compress(chunk, 9)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_path, path)
+        return digest, len(compressed)
+
+    def _get_chunk(self, digest):
+        with open(self._object_path(digest), 'rb') as f:
+            chunk = zlib.decompress(f.read())
+        if _hash(chunk) != digest:
+            raise ValueError(f"チャンクが破損しています: {digest}")
+        return chunk
+
+    # ============================================
+    # スナップショット
+    # ============================================
+
+    def snapshot(self, path, label='', created=None):
+        """
+        ファイルのスナップショットを作成
+
+        直前のスナップショットと内容が同じなら新規作成せずそれを返す。
+        戻り値は (スナップショット情報, 新規に書いたバイト数)
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        return self.snapshot_bytes(data, self._source_name(path), label, created)
+
+    def snapshot_bytes(self, data, source, label='', created=None):
+        """バイト列を source（リポジトリ相対パス）のスナップショットとして保存"""
+        digest = _hash(data)
+        latest = self.latest(source)
+        if latest and latest['sha256'] == digest:
+            return latest, 0
+
+        written = 0
+        chunk_ids = []
+        for chunk in split_chunks(data):
+            chunk_id, size = self._put_chunk(chunk)
+            chunk_ids.append(chunk_id)
+            written += size
+
+        created = created or datetime.now()
+        base_id = created.strftime('%Y%m%d_%H%M%S')
+        if label:
+            base_id += '_' + re.sub(r'[^\w\-]+', '_', label)
+        snapshot_id = base_id
+        suffix = 1
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        while os.path.exists(os.path.join(self.snapshots_dir, snapshot_id + '.json')):
+            snapshot_id = f'{base_id}_{suffix}'
+            suffix += 1
+
+        info = {
+            'id': snapshot_id,
+            'source': source,
+            'label': label,
+            'created': created.isoformat(timespec='seconds'),
+            'size': len(data),
+            'sha256': digest,
+            'chunks': chunk_ids,
+        }
+        with open(os.path.join(self.snapshots_dir, snapshot_id + '.json'), 'w', encoding='utf-8') as f:
+            json.dump(info, f, ensure_ascii=False, indent=1)
+        return info, written
+
+    def snapshots(self, source=None):
+        """スナップショット一覧（作成日時順）"""
+        result = []
+        for path in glob.glob(os.path.join(self.snapshots_dir, '*.json')):
+            with open(path, 'r', encoding='utf-8') as f:
+                info = json.load(f)
+            if source is None or info['source'] == source:
+                result.append(info)
+        result.sort(key=lambda info: (info['created'], info['id']))
+        return result
+
+    def latest(self, source):
+        snapshots = self.snapshots(source)
+        return snapshots[-1] if snapshots else None
+
+    def get(self, snapshot_id):
+        path = os.path.join(self.snapshots_dir, snapshot_id + '.json')
+        if not os.path.exists(path):
+            raise KeyError(f"スナップショットが見つかりません: {snapshot_id}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def read(self, snapshot_id):
+        """スナップショットの内容をバイト列で復元"""
+        info = self.get(snapshot_id)
+        data = b''.join(self._get_chunk(chunk_id) for chunk_id in info['chunks'])
+        if _hash(data) != info['sha256']:
+            raise ValueError(f"復元結果のハッシュが一致しません: {snapshot_id}")
+        return data
+
+    def restore(self, snapshot_id, output=None):
+        """スナップショットを復元（出力先省略時は元のファイルへ）"""
+        info = self.get(snapshot_id)
+        output = output or os.path.join(REPO_DIR, info['source'])
+        data = self.read(snapshot_id)
+        temp_path = output + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, output)
+        return output
+
+    # ============================================
+    # 保持ポリシー
+    # ============================================
+
+    def prune(self, keep_last=DEFAULT_KEEP_LAST, keep_daily=DEFAULT_KEEP_DAILY, now=None):
+        """
+        保持ポリシー外のスナップショットと参照されなくなったチャンクを削除
+
+        ファイルごとに最新 keep_last 件と、直近 keep_daily 日の各日最後の1件を残す。
+        戻り値は (削除したスナップショット数, 削除したチャンク数)
+        """
+        now = now or datetime.now()
+        daily_limit = (now - timedelta(days=keep_daily)).date()
+
+        by_source = {}
+        for info in self.snapshots():
+            by_source.setdefault(info['source'], []).append(info)
+
+        removed = 0
+        for infos in by_source.values():
+            keep = {info['id'] for info in infos[-keep_last:]} if keep_last > 0 else set()
+            last_of_day = {}
+            for info in infos:
+                day = datetime.fromisoformat(info['created']).date()
+                if day >= daily_limit:
+                    last_of_day[day] = info['id']
+            keep.update(last_of_day.values())
+
+            for info in infos:
+                if info['id'] not in keep:
+                    os.remove(os.path.join(self.snapshots_dir, info['id'] + '.json'))
+                    removed += 1
+
+        return removed, self.collect_garbage()
+
+    def collect_garbage(self):
+        """どのスナップショットからも参照されないチャンクを削除"""
+        referenced = set()
+        for info in self.snapshots():
+            referenced.update(info['chunks'])
+        removed = 0
+        for path in glob.glob(os.path.join(self.objects_dir, '*', '*.z')):
+            if os.path.basename(path)[:-2] not in referenced:
+                os.remove(path)
+                removed += 1
+        return removed
+
+    # ============================================
+    # 補助
+    # ============================================
+
+    @staticmethod
+    def _source_name(path):
+        """リポジトリ相対のパス（リポジトリ外ならファイル名）"""
+        absolute = os.path.abspath(path)
+        if absolute.startswith(REPO_DIR + os.sep):
+            return os.path.relpath(absolute, REPO_DIR).replace(os.sep, '/')
+        return os.path.basename(absolute)
+
+    def disk_usage(self):
+        total = 0
+        for directory in (self.objects_dir, self.snapshots_dir):
+            for root, _, files in os.walk(directory):
+                total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        return total
+
+
+def backup_file(path, label=''):
+    """変更処理前のバックアップ用ショートカット（スナップショットIDを返す）"""
+    if not os.path.exists(path):
+        return None
+    info, _ = BackupStore().snapshot(path, label)
+    return info['id']
+
+
+# ============================================
+# 旧形式バックアップの取り込み
+# ============================================
+
+LEGACY_PATTERNS = (
+    # (旧バックアップのglob, 元ファイル)
+    (os.path.join(BASE_DIR, 'backups', 'マスターデータ_*.tsv'), os.path.join(BASE_DIR, 'マスターデータ.tsv')),
+    (os.path.join(REPO_DIR, 'assets', 'master', 'default-master_backup_*.js'),
+     os.path.join(REPO_DIR, 'assets', 'master', 'default-master.js')),
+)
+
+LEGACY_TIMESTAMP = re.compile(r'(\d{8}_\d{6})')
+
+
+def import_legacy(store, remove=False):
+    """旧形式の全体コピーをスナップショットとして取り込む"""
+    imported = []
+    for pattern, original in LEGACY_PATTERNS:
+        source = store._source_name(original)
+        for path in sorted(glob.glob(pattern)):
+            name = os.path.splitext(os.path.basename(path))[0]
+            match = LEGACY_TIMESTAMP.search(name)
+            created = datetime.strptime(match.group(1), '%Y%m%d_%H%M%S') if match else datetime.now()
+            with open(path, 'rb') as f:
+                data = f.read()
+            info, written = store.snapshot_bytes(data, source, 'legacy', created)
+            imported.append((path, info['id'], written))
+            if remove:
+                os.remove(path)
+    return imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='重複排除バックアップストア')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    snapshot_parser = subparsers.add_parser('snapshot', help='スナップショットを作成')
+    snapshot_parser.add_argument('files', nargs='+')
+    snapshot_parser.add_argument('--label', default='')
+
+    list_parser = subparsers.add_parser('list', help='スナップショット一覧')
+    list_parser.add_argument('--source', help='元ファイル（リポジトリ相対パス）で絞り込み')
+
+    restore_parser = subparsers.add_parser('restore', help='スナップショットを復元')
+    restore_parser.add_argument('snapshot_id')
+    restore_parser.add_argument('--output', help='復元先（省略時は元のファイル）')
+
+    prune_parser = subparsers.add_parser('prune', help='保持ポリシー外のスナップショットを削除')
+    prune_parser.add_argument('--keep-last', type=int, default=DEFAULT_KEEP_LAST)
+    prune_parser.add_argument('--keep-daily', type=int, default=DEFAULT_KEEP_DAILY)
+
+    legacy_parser = subparsers.add_parser('import-legacy', help='旧形式の全体コピーを取り込む')
+    legacy_parser.add_argument('--remove', action='store_true', help='取り込んだ旧バックアップを削除')
+
+    args = parser.parse_args(argv)
+    store = BackupStore()
+
+    if args.command == 'snapshot':
+        for path in args.files:
+            info, written = store.snapshot(path, args.label)
+            print(f"スナップショット: {info['id']} ({info['source']}, 新規 {written:,} bytes)")
+
+    elif args.command == 'list':
+        for info in store.snapshots(args.source):
+            print(f"{info['id']}\t{info['source']}\t{info['size']:,} bytes\t{len(info['chunks'])} chunks")
+        print(f"ストア使用量: {store.disk_usage():,} bytes")
+
+    elif args.command == 'restore':
+        try:
+            output = store.restore(args.snapshot_id, args.output)
+        except (KeyError, ValueError) as e:
+            print(f"エラー: {e}")
+            sys.exit(1)
+        print(f"復元しました: {output}")
+
+    elif args.command == 'prune':
+        snapshots, chunks = store.prune(args.keep_last, args.keep_daily)
+        print(f"削除: スナップショット {snapshots}件, チャンク {chunks}個")
+        print(f"ストア使用量: {store.disk_usage():,} bytes")
+
+    elif args.command == 'import-legacy':
+        imported = import_legacy(store, args.remove)
+        for path, snapshot_id, written in imported:
+            print(f"取り込み: {os.path.basename(path)} -> {snapshot_id} (新規 {written:,} bytes)")
+        print(f"{len(imported)}件を取り込みました（ストア使用量: {store.disk_usage():,} bytes）")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,84 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-with open('マスターデータ.tsv', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-new_lines = []
-converted_count = 0
-
-# 次の10作品の性別振り分け設定
-series_gender = {
-    'その他': 'スキップ',  # その他はスキップ
-    'らんま1/2': '混合',
-    'わんだふるぷりきゅあ！': '女性',
-    'アイカツ!': '女性',
-    'アイカツスターズ！': '女性',
-    'アイカツ！': '女性',
-    'アイドルマスター': '女性',
-    'アイドルマスター シャイニーカラーズ': '女性',
-    'アイドルマスターシンデレラガールズ': '女性',
-    'アカメが斬る！': '混合'
-}
-
-# 混合作品の個別性別判定
-mixed_characters = {
-    # らんま1/2
-    '早乙女らんま': '男性',  # 男性キャラ（女性になる能力あり）
-    '天道あかね': '女性',
-    '天道なびき': '女性',
-    '天道かすみ': '女性',
-    'シャンプー': '女性',
-    
-    # アカメが斬る！
-    'アカメ': '女性',
-    'エスデス': '女性',
-    'マイン': '女性',
-    'レオーネ': '女性',
-    'タツミ': '男性',
-    'ブラート': '男性',
-    'ルボック': '男性'
-}
-
-for line in lines:
-    parts = line.strip().split('\t')
-    
-    if len(parts) >= 3 and line.startswith('キャラクター\t'):
-        series = parts[1]
-        character = parts[2]
-        
-        if series in series_gender:
-            if series_gender[series] == 'スキップ':
-                # その他はスキップ
-                new_lines.append(line)
-            elif series_gender[series] == '混合':
-                # 混合作品は個別判定
-                if character in mixed_characters:
-                    gender = mixed_characters[character]
-                    new_line = line.replace('キャラクター\t', f'キャラクター({gender})\t')
-                    new_lines.append(new_line)
-                    converted_count += 1
-                    print(f"変換: {character} ({gender})")
-                else:
-                    # 個別設定がない場合はデフォルト女性
-                    gender = '女性'
-                    new_line = line.replace('キャラクター\t', f'キャラクター({gender})\t')
-                    new_lines.append(new_line)
-                    converted_count += 1
-                    print(f"変換: {character} ({gender}) [デフォルト]")
-            else:
-                # 一律性別設定
-                gender = series_gender[series]
-                new_line = line.replace('キャラクター\t', f'キャラクター({gender})\t')
-                new_lines.append(new_line)
-                converted_count += 1
-                print(f"変換: {character} ({gender})")
-        else:
-            new_lines.append(line)
-    else:
-        new_lines.append(line)
-
-with open('マスターデータ.tsv', 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
-
-print(f"\n次の10作品一括変換完了: {converted_count}名")
\ No newline at end of file
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+データ管理パイプラインの合成データによる性能計測
+
+現在のマスターデータから大項目・中項目の出現比率、大項目ごとのタグの出現頻度とタグ数の分布を求め、
+同じ分布の合成マスターデータ・追加希望TSVを指定の行数（既定 1万・10万・100万行）で作る。
+それに対して次の処理を実行し、処理ごとの実行時間とPythonのメモリ使用量のピークを計測する。
+
+- load: MasterStore への読み込み
+- generate_master: default-master.js・シャード・検索インデックス・カテゴリ一覧の生成（一時ディレクトリに出力）
+- consolidate: sort_and_clean.sh のソート・重複削除・小項目統合（書き込みなし）
+- classify: 追加希望の stage1〜4 分類と取り込み（書き込みなし）
+- translate: en-ja のタグ単位翻訳（全行の Prompt、翻訳メモリは使わない）
+- gender: キャラクター行の性別・種別推定（タグベクトルの解析を含む）
+
+結果は benchmarks/baseline.json に保存でき、--compare で保存済みの結果と比べて遅くなった処理を報告する。
+実行時間とメモリは別々に計測する（tracemalloc を有効にすると処理自体が遅くなるため）。
+
+    python3 benchmark.py --sizes 10000
+    python3 benchmark.py --save              # 1万・10万・100万行で計測して基準値を保存
+    python3 benchmark.py --sizes 10000 100000 --compare
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from itertools import accumulate
+
+from analyze_character_gender import analyze_character_gender
+from consolidate import consolidate
+from generate_master import generate
+from import_additions import StagedClassifier, import_wish_lines
+from master_store import MASTER_FILE, MasterStore
+from tag_translator import DIRECTIONS, TagTranslator
+from tag_vectors import VOCABULARY, store_vectors
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BASE_DIR, 'benchmarks', 'baseline.json')
+BASELINE_VERSION = 1
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+SEED = 20250701
+# 追加希望の行数（マスターデータの行数に対する割合）
+WISH_RATIO = 0.1
+# 完全一致の重複行・同じキーで Prompt が違う行の割合（consolidate の対象）
+DUPLICATE_RATIO = 0.02
+SAME_KEY_RATIO = 0.01
+# 強調・"_" 表記にするタグの割合
+EMPHASIS_RATIO = 0.05
+UNDERSCORE_RATIO = 0.1
+# --compare で遅くなったとみなす比率
+DEFAULT_TOLERANCE = 1.5
+
+
+# ============================================
+# 合成データ
+# ============================================
+
+class DataProfile:
+    """マスターデータの分布（大項目・中項目・小項目・タグ・タグ数）"""
+
+    def __init__(self, store):
+        vectors = store_vectors(store)
+        majors = Counter()
+        middles = defaultdict(Counter)
+        smalls = defaultdict(list)
+        tags = defaultdict(Counter)
+        lengths = defaultdict(list)
+        for row_id in store.ids():
+            major, middle, small, _ = store.row(row_id)
+            majors[major] += 1
+            middles[major][middle] += 1
+            smalls[major].append(small)
+            vector = vectors[row_id]
+            lengths[major].append(max(1, len(vector)))
+            tags[major].update(VOCABULARY.tag(tag_id) for tag_id in vector.ids())
+
+        # random.choices に渡す (候補, 累積の重み)
+        self.majors = (list(majors), list(accumulate(majors.values())))
+        self.middles = {major: (list(counts), list(accumulate(counts.values())))
+                        for major, counts in middles.items()}
+        self.smalls = dict(smalls)
+        self.tags = {major: (list(counts), list(accumulate(counts.values()))) for major, counts in tags.items()}
+        self.lengths = dict(lengths)
+
+    def prompt(self, rng, major):
+        population, cum_weights = self.tags[major]
+        tags = []
+        for tag in rng.choices(population, cum_weights=cum_weights, k=rng.choice(self.lengths[major])):
+            if rng.random() < UNDERSCORE_RATIO:
+                tag = tag.replace(' ', '_')
+            if rng.random() < EMPHASIS_RATIO:
+                tag = '{' * rng.randint(1, 3) + tag + '}' * rng.randint(1, 3)
+            tags.append(tag)
+        return ','.join(tags)
+
+    def rows(self, count, seed=SEED):
+        """(大項目, 中項目, 小項目, Prompt) を count 行生成"""
+        rng = random.Random(seed)
+        rows = []
+        population, cum_weights = self.majors
+        for index, major in enumerate(rng.choices(population, cum_weights=cum_weights, k=count)):
+            if rows and rng.random() < DUPLICATE_RATIO:
+                rows.append(rng.choice(rows))
+                continue
+            if rows and rng.random() < SAME_KEY_RATIO:
+                base = rng.choice(rows)
+                rows.append((base[0], base[1], base[2], self.prompt(rng, base[0])))
+                continue
+            middles, middle_weights = self.middles[major]
+            middle = rng.choices(middles, cum_weights=middle_weights)[0]
+            small = f"{rng.choice(self.smalls[major])}{index}"
+            rows.append((major, middle, small, self.prompt(rng, major)))
+        return rows
+
+    def wish_lines(self, count, seed=SEED + 1):
+        """追加希望.tsv の省略形（小項目<TAB>Prompt）の行を count 行生成"""
+        rng = random.Random(seed)
+        lines = []
+        population, cum_weights = self.majors
+        for major in rng.choices(population, cum_weights=cum_weights, k=count):
+            lines.append(f"{rng.choice(self.smalls[major])}\t{self.prompt(rng, major)}\n")
+        return lines
+
+
+def write_tsv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for row in rows:
+            f.write('\t'.join(row) + '\n')
+
+
+# ============================================
+# 計測する処理
+# ============================================
+# 各処理は (準備, 計測対象) の組。準備の戻り値を計測対象に渡し、準備の時間は含めない
+
+def setup_load(workdir):
+    return os.path.join(workdir, 'master.tsv')
+
+
+def run_load(master_file):
+    MasterStore.load(master_file)
+
+
+def setup_generate(workdir):
+    # 前回の出力が残っているとマニフェストで省略されるため毎回作り直す
+    output_dir = os.path.join(workdir, 'generate')
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.makedirs(os.path.join(output_dir, 'assets'))
+    return os.path.join(workdir, 'master.tsv'), output_dir
+
+
+def run_generate(state):
+    master_file, output_dir = state
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate(master_file, os.path.join(output_dir, 'assets', 'default-master.js'), output_dir, force=True)
+
+
+def setup_store(workdir):
+    return MasterStore.load(os.path.join(workdir, 'master.tsv'))
+
+
+def run_consolidate(store):
+    consolidate(store)
+
+
+def setup_classify(workdir):
+    with open(os.path.join(workdir, 'wish.tsv'), 'r', encoding='utf-8') as f:
+        return setup_store(workdir), f.readlines()
+
+
+def run_classify(state):
+    store, wish_lines = state
+    import_wish_lines(store, wish_lines, StagedClassifier())
+
+
+def setup_translate(workdir):
+    load, _, source = DIRECTIONS['en-ja']
+    return load(), source, setup_store(workdir)
+
+
+def run_translate(state):
+    dictionary, source, store = state
+    translator = TagTranslator(dictionary, source)
+    for prompt in store.prompts:
+        translator.translate(prompt)
+
+
+def run_gender(store):
+    analyze_character_gender(store)
+
+
+STAGES = [
+    ('load', setup_load, run_load),
+    ('generate_master', setup_generate, run_generate),
+    ('consolidate', setup_store, run_consolidate),
+    ('classify', setup_classify, run_classify),
+    ('translate', setup_translate, run_translate),
+    ('gender', setup_store, run_gender),
+]
+
+
+def measure(setup, run, workdir, memory=True):
+    """(秒, ピークのメモリ MB) を返す（memory=False ならメモリは None）"""
+    state = setup(workdir)
+    start = time.perf_counter()
+    run(state)
+    seconds = time.perf_counter() - start
+    del state
+
+    peak = None
+    if memory:
+        state = setup(workdir)
+        tracemalloc.start()
+        try:
+            run(state)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak = round(peak_bytes / 1024 / 1024, 1)
+    return round(seconds, 3), peak
+
+
+def run_size(profile, size, stages, memory=True):
+    """合成データを size 行で作って各処理を計測し、{処理名: {'seconds', 'peak_mb'}} を返す"""
+    with tempfile.TemporaryDirectory(prefix='pgdata-bench-') as workdir:
+        write_tsv(os.path.join(workdir, 'master.tsv'), profile.rows(size))
+        with open(os.path.join(workdir, 'wish.tsv'), 'w', encoding='utf-8') as f:
+            f.writelines(profile.wish_lines(max(1, int(size * WISH_RATIO))))
+
+        results = {}
+        for name, setup, run in stages:
+            seconds, peak = measure(setup, run, workdir, memory)
+            results[name] = {'seconds': seconds, 'peak_mb': peak}
+            peak_text = f"  ピーク {peak:8.1f} MB" if peak is not None else ''
+            print(f"  {name:16s} {seconds:8.3f} 秒{peak_text}", flush=True)
+        return results
+
+
+# ============================================
+# 基準値
+# ============================================
+
+def load_baseline(path=BASELINE_FILE):
+    if not os.path.exists(path):
+        return {'version': BASELINE_VERSION, 'sizes': {}}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results, path=BASELINE_FILE):
+    """計測した行数の結果だけを基準値に上書きして保存"""
+    baseline = load_baseline(path)
+    baseline['version'] = BASELINE_VERSION
+    baseline['python'] = platform.python_version()
+    baseline['machine'] = platform.machine()
+    baseline['sizes'].update({str(size): stages for size, stages in results.items()})
+    baseline['sizes'] = dict(sorted(baseline['sizes'].items(), key=lambda item: int(item[0])))
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """基準値より tolerance 倍を超えて遅い・メモリを使う処理の (行数, 処理名, 項目, 基準値, 今回) リスト"""
+    regressions = []
+    for size, stages in results.items():
+        base_stages = baseline['sizes'].get(str(size), {})
+        for name, result in stages.items():
+            base = base_stages.get(name)
+            if base is None:
+                continue
+            for key in ('seconds', 'peak_mb'):
+                if result[key] is None or base.get(key) is None:
+                    continue
+                if result[key] > base[key] * tolerance:
+                    regressions.append((size, name, key, base[key], result[key]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='合成データによるデータ管理パイプラインの性能計測')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='合成するマスターデータの行数')
+    parser.add_argument('--stages', nargs='+', choices=[name for name, _, _ in STAGES],
+                        help='計測する処理（省略時はすべて）')
+    parser.add_argument('--no-memory', action='store_true', help='メモリのピークを計測しない（時間だけ計測）')
+    parser.add_argument('--save', action='store_true', help='結果を基準値（benchmarks/baseline.json）に保存')
+    parser.add_argument('--compare', action='store_true', help='基準値と比べて遅くなった処理を報告')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='遅くなったとみなす基準値に対する比率')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='基準値ファイル')
+    args = parser.parse_args()
+
+    stages = [stage for stage in STAGES if not args.stages or stage[0] in args.stages]
+    profile = DataProfile(MasterStore.load(MASTER_FILE))
+
+    results = {}
+    for size in args.sizes:
+        print(f"\n## {size:,}行")
+        results[size] = run_size(profile, size, stages, not args.no_memory)
+
+    if args.compare:
+        regressions = compare(results, load_baseline(args.baseline), args.tolerance)
+        print()
+        for size, name, key, base, current in regressions:
+            print(f"遅くなった処理: {size:,}行 {name} {key} {base} -> {current}")
+        print(f"基準値との比較: {len(regressions)}件（比率 {args.tolerance} 倍超）")
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"基準値を保存しました: {args.baseline}")
+
+    if args.compare and regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+既存のキャラクター行から作るキャラクター名の別名インデックス
+
+マスターデータの キャラクター(性別) 行の Prompt を正式なタグとし、次の表記を別名として登録する。
+
+- タグそのもの（大文字小文字・"_" と空白の違いは無視）
+- 末尾の " (作品名)" / "_(作品名)" を外した名前と、2語の名前の姓名を入れ替えたもの
+- 小項目（日本語名。"・" と空白は無視）
+
+検索は別名の完全一致を優先し、見つからなければ文字トライグラムの転置インデックスで
+Dice係数が閾値以上の別名を探す。作品を指定した場合は同じ作品の候補を優先するので、
+取り込み時に新しいキャラクター名を既存の正式なタグに自動で対応付けられる。
+
+    python3 character_aliases.py "hoshimachi suisei" --series Hololive
+    python3 character_aliases.py 星街すいせい
+"""
+
+import argparse
+import re
+import unicodedata
+from collections import namedtuple
+
+from gender_registry import is_character_major
+from master_store import MASTER_FILE, MasterStore
+
+# あいまい検索で一致とみなすDice係数の下限
+DEFAULT_THRESHOLD = 0.75
+
+# 末尾の作品名（"name (series)" / "name_(series)"）
+QUALIFIER = re.compile(r'\s*\([^()]*\)$')
+WHITESPACE = re.compile(r'\s+')
+# 日本語名の区切り（空白・中黒）
+NAME_SEPARATORS = re.compile(r'[\s・･=＝]+')
+
+AliasMatch = namedtuple('AliasMatch', 'tag series score alias')
+
+
+def normalize(text):
+    """照合用の正規化（NFKC・小文字化・"_" を空白に・連続空白を1つに）"""
+    text = unicodedata.normalize('NFKC', text).lower().replace('_', ' ')
+    return WHITESPACE.sub(' ', text).strip()
+
+
+def name_aliases(tag):
+    """タグから別名（正規化済み）を列挙"""
+    full = normalize(tag)
+    aliases = {full}
+    bare = QUALIFIER.sub('', full)
+    if bare:
+        aliases.add(bare)
+        words = bare.split(' ')
+        if len(words) == 2:
+            aliases.add(f"{words[1]} {words[0]}")
+    return aliases
+
+
+def japanese_alias(name):
+    """日本語名の別名（区切りを除いたもの）"""
+    return NAME_SEPARATORS.sub('', normalize(name))
+
+
+def trigrams(text):
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CharacterAliasIndex:
+    """別名 -> 正式なタグ の完全一致表とトライグラムによるあいまい検索"""
+
+    def __init__(self):
+        # 別名 -> [(正式なタグ, 作品)]
+        self._aliases = {}
+        # トライグラム -> 別名のセット
+        self._grams = {}
+        # 別名 -> トライグラム数
+        self._gram_counts = {}
+
+    @classmethod
+    def from_store(cls, store):
+        """ストアのキャラクター行からインデックスを作成"""
+        index = cls()
+        for major, series, name, tag in store:
+            if is_character_major(major) and tag:
+                index.add(tag, series, name)
+        return index
+
+    def __len__(self):
+        return len(self._aliases)
+
+    def add(self, tag, series, name=''):
+        """正式なタグと、その別名（タグ・日本語名から求める）を登録"""
+        aliases = name_aliases(tag)
+        if name:
+            aliases.add(japanese_alias(name))
+        entry = (tag, series)
+        for alias in aliases:
+            if not alias:
+                continue
+            entries = self._aliases.get(alias)
+            if entries is None:
+                self._aliases[alias] = [entry]
+                grams = trigrams(alias)
+                self._gram_counts[alias] = len(grams)
+                for gram in grams:
+                    self._grams.setdefault(gram, set()).add(alias)
+            elif entry not in entries:
+                entries.append(entry)
+
+    @staticmethod
+    def _pick(entries, series):
+        """同じ作品の候補を優先して1つ選ぶ"""
+        if series is not None:
+            for entry in entries:
+                if entry[1] == series:
+                    return entry
+        return entries[0]
+
+    def lookup(self, name, series=None):
+        """別名の完全一致で AliasMatch を返す（なければNone）"""
+        for alias in (normalize(name), japanese_alias(name)):
+            entries = self._aliases.get(alias)
+            if entries:
+                tag, entry_series = self._pick(entries, series)
+                return AliasMatch(tag, entry_series, 1.0, alias)
+        for alias in name_aliases(name):
+            entries = self._aliases.get(alias)
+            if entries:
+                tag, entry_series = self._pick(entries, series)
+                return AliasMatch(tag, entry_series, 1.0, alias)
+        return None
+
+    def search(self, name, series=None, threshold=DEFAULT_THRESHOLD, limit=5):
+        """
+        トライグラムのDice係数が threshold 以上の候補を類似度順に最大 limit 件（None で全件）返す
+
+        作品を指定した場合、同じ作品の候補を同じ類似度の他作品の候補より前に並べる
+        """
+        query = normalize(name)
+        grams = trigrams(query)
+        shared = {}
+        for gram in grams:
+            for alias in self._grams.get(gram, ()):
+                shared[alias] = shared.get(alias, 0) + 1
+
+        # (正式なタグ, 作品) -> 最も類似度の高い別名での AliasMatch
+        best = {}
+        total = len(grams)
+        for alias, count in shared.items():
+            score = 2 * count / (total + self._gram_counts[alias])
+            if score < threshold:
+                continue
+            for entry in self._aliases[alias]:
+                current = best.get(entry)
+                if current is None or score > current.score:
+                    best[entry] = AliasMatch(entry[0], entry[1], score, alias)
+        results = sorted(best.values(), key=lambda match: (-match.score, match.series != series, match.tag))
+        return results[:limit]
+
+    def resolve(self, name, series=None, threshold=DEFAULT_THRESHOLD):
+        """
+        キャラクター名を既存の正式なタグに対応付ける（見つからなければNone）
+
+        完全一致がなければあいまい検索を行い、作品を指定した場合は同じ作品の候補だけを採用する
+        """
+        match = self.lookup(name, series)
+        if match is not None and (series is None or match.series == series):
+            return match
+        for candidate in self.search(name, series, threshold, limit=None):
+            if series is None or candidate.series == series:
+                return candidate
+        return None
+
+
+def resolve_character(index, series, character, name):
+    """
+    抽出したキャラクター名 name、なければ日本語名 character（小項目）を
+    同じ作品の既存の正式なタグに対応付ける（見つからなければNone）
+    """
+    return index.resolve(name, series) or index.resolve(character, series)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='キャラクター名の別名検索')
+    parser.add_argument('names', nargs='+', help='キャラクター名（ローマ字・タグ・日本語名）')
+    parser.add_argument('--series', help='作品名（中項目）')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='あいまい検索の類似度の下限')
+    args = parser.parse_args()
+
+    index = CharacterAliasIndex.from_store(MasterStore.load(MASTER_FILE))
+    for name in args.names:
+        match = index.lookup(name, args.series)
+        candidates = [match] if match else index.search(name, args.series, args.threshold)
+        if not candidates:
+            print(f"{name}: 該当なし")
+        for candidate in candidates:
+            print(f"{name}: {candidate.tag}（{candidate.series}、類似度 {candidate.score:.2f}、別名 {candidate.alias}）")
+
+
+if __name__ == '__main__':
+    main()
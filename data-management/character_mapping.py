@@ -1,259 +1,25 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
 import csv
-import re
 
-# 手動でキャラクター名をマッピング
-character_name_mapping = {
-    # アイドルマスター
-    ('アイドルマスター', '三浦あずさ（ロングヘア）'): 'miura azusa',
-    ('アイドルマスター', '我那覇響'): 'ganaha hibiki',
-    ('アイドルマスター', '水瀬伊織'): 'minase iori',
-    ('アイドルマスター', '秋月律子'): 'akizuki ritsuko',
-    ('アイドルマスター', '萩原雪歩'): 'hagiwara yukiho',
-    
-    # アイドルマスター シャイニーカラーズ
-    ('アイドルマスター シャイニーカラーズ', '八宮めぐる'): 'hachimiya meguru',
-    ('アイドルマスター シャイニーカラーズ', '樋口円香'): 'higuchi madoka',
-    ('アイドルマスター シャイニーカラーズ', '浅倉透'): 'asakura toru',
-    ('アイドルマスター シャイニーカラーズ', '西城樹里'): 'saijou juri',
-    ('アイドルマスター シャイニーカラーズ', '黛冬優子'): 'mayuzumi fuyuko',
-    
-    # アイドルマスターシンデレラガールズ
-    ('アイドルマスターシンデレラガールズ', 'アナスタシア'): 'anastasia',
-    ('アイドルマスターシンデレラガールズ', 'エミリー'): 'emily stewart',
-    ('アイドルマスターシンデレラガールズ', 'ナターリア'): 'natalia',
-    ('アイドルマスターシンデレラガールズ', '中谷育'): 'nakatani iku',
-    ('アイドルマスターシンデレラガールズ', '伊吹翼'): 'ibuki tsubasa',
-    ('アイドルマスターシンデレラガールズ', '佐城雪美'): 'sajo yukimi',
-    ('アイドルマスターシンデレラガールズ', '佐藤心'): 'satou shin',
-    ('アイドルマスターシンデレラガールズ', '北条加蓮'): 'houjou karen',
-    ('アイドルマスターシンデレラガールズ', '千川ちひろ'): 'senkawa chihiro',
-    ('アイドルマスターシンデレラガールズ', '双葉杏'): 'futaba anzu',
-    ('アイドルマスターシンデレラガールズ', '向井拓海'): 'mukai takumi',
-    ('アイドルマスターシンデレラガールズ', '周防桃子'): 'suou momoko',
-    ('アイドルマスターシンデレラガールズ', '新田美波'): 'nitta minami',
-    ('アイドルマスターシンデレラガールズ', '本田未央'): 'honda mio',
-    ('アイドルマスターシンデレラガールズ', '的場梨沙'): 'matoba risa',
-    ('アイドルマスターシンデレラガールズ', '神谷奈緒'): 'kamiya nao',
-    ('アイドルマスターシンデレラガールズ', '福山舞'): 'fukuyama mai',
-    ('アイドルマスターシンデレラガールズ', '遊佐こずえ'): 'yusa kozue',
-    ('アイドルマスターシンデレラガールズ', '龍崎薫'): 'ryuzaki kaoru',
-    
-    # To LOVEる
-    ('To LOVEる -とらぶる', 'ティアーユ・ルナティーク'): 'teayu lunatique',
-    ('To LOVEる -とらぶる', 'ララ・サタリン・デビルーク'): 'lala satalin deviluke',
-    ('To LOVEる -とらぶる', '天条院沙姫'): 'tenjouin saki',
-    ('To LOVEる -とらぶる', '小手川唯'): 'kotegawa yui',
-    ('To LOVEる -とらぶる', '金色の闇（ヤミ）'): 'konjiki no yami',
-    
-    # ぼっち・ざ・ろっく！
-    ('ぼっち・ざ・ろっく！', '伊地知虹夏'): 'ijichi nijika',
-    ('ぼっち・ざ・ろっく！', '後藤ひとり'): 'gotou hitori',
-    
-    # VOICE BOX
-    ('VOICE BOX', 'ずんだもん'): 'zundamon',
-    
-    # ポケモン
-    ('ポケモン', 'ヒカリ'): 'hikari (pokemon)',
-    
-    # ラブライブ！サンシャイン！！
-    ('ラブライブ！サンシャイン！！', '鹿角理亞'): 'kazuno ria',
-    
-    # ラブライブ！スーパースター!!
-    ('ラブライブ！スーパースター!!', 'ウィーン・マルガレーテ'): 'wien margarete',
-    ('ラブライブ！スーパースター!!', '嵐 千砂都'): 'arashi chisato',
-    ('ラブライブ！スーパースター!!', '平安名 すみれ'): 'heanna sumire',
-    ('ラブライブ！スーパースター!!', '葉月 恋'): 'hazuki ren',
-    
-    # ラブライブ！虹ヶ咲学園スクールアイドル同好会
-    ('ラブライブ！虹ヶ咲学園スクールアイドル同好会', 'ショウ・ランジュ'): 'zhong lanzhu',
-    
-    # 中二病でも恋がしたい！
-    ('中二病でも恋がしたい！', '小鳥遊六花'): 'takanashi rikka',
-    
-    # 原神
-    ('原神', '胡桃'): 'hu tao',
-    
-    # 物語シリーズ
-    ('物語シリーズ', '忍野忍'): 'oshino shinobu',
-    
-    # 艦隊これくしょん
-    ('艦隊これくしょん', '望月'): 'mochizuki (kancolle)',
-    ('艦隊これくしょん', '霧島'): 'kirishima (kancolle)',
-    
-    # 魔法少女まどか☆マギカ
-    ('魔法少女まどか☆マギカ', '佐倉杏子'): 'sakura kyouko',
-    ('魔法少女まどか☆マギカ', '巴マミ'): 'tomoe mami',
-    ('魔法少女まどか☆マギカ', '暁美ほむら'): 'akemi homura',
-    ('魔法少女まどか☆マギカ', '美樹さやか'): 'miki sayaka',
-    
-    # セーラームーン
-    ('セーラームーン', 'ちびうさ'): 'chibiusa',
-    
-    # ゼロの使い魔
-    ('ゼロの使い魔', 'ルイズ'): 'louise francoise le blanc de la valliere',
-    
-    # ノーゲーム・ノーライフ
-    ('ノーゲーム・ノーライフ', 'ジブリール'): 'jibril',
-    ('ノーゲーム・ノーライフ', '白'): 'shiro',
-    
-    # ボーカロイド
-    ('ボーカロイド', '鏡音レン'): 'kagamine ren',
-    
-    # GTA V
-    ('GTA V', 'トレバー・フィリップス'): 'trevor philips',
-    
-    # けものフレンズ
-    ('けものフレンズ', 'フェネック'): 'fennec (kemono friends)',
-    ('けものフレンズ', 'コウテイペンギン'): 'emperor penguin (kemono friends)',
-    ('けものフレンズ', 'サーバル'): 'serval (kemono friends)',
-    ('けものフレンズ', 'かばん'): 'kaban (kemono friends)',
-    
-    # アカメが斬る！
-    ('アカメが斬る！', 'アカメ'): 'akame (akame ga kill!)',
-    
-    # ラブライブ！サンシャイン！！
-    ('ラブライブ！サンシャイン！！', '小原鞠莉'): 'ohara mari',
-    
-    # この素晴らしい世界に祝福を
-    ('この素晴らしい世界に祝福を', 'ウィズ'): 'wiz (konosuba)',
-    ('この素晴らしい世界に祝福を', 'ダクネス'): 'darkness (konosuba)',
-    
-    # Hololive (追加)
-    ('Hololive', 'トワ様'): 'tokoyami towa',
-    ('Hololive', 'るーちゃん'): 'uruha rushia',
-    
-    # アトリエ
-    ('アトリエ', 'ライザ'): 'reisalin stout',
-    
-    # サノバウィッチ
-    ('サノバウィッチ', '因幡めぐる'): 'inaba meguru',
-    
-    # ダンガンロンパ
-    ('ダンガンロンパ', '朝日奈葵'): 'asahina aoi',
-    ('ダンガンロンパ', '朝日奈葵(水着)'): 'asahina aoi',
-    
-    # ラブライブ！虹ヶ咲学園スクールアイドル同好会
-    ('ラブライブ！虹ヶ咲学園スクールアイドル同好会', '中須かすみ'): 'nakasu kasumi',
-    
-    # 艦隊これくしょん (追加)
-    ('艦隊これくしょん', '武蔵'): 'musashi (kancolle)',
-    
-    # 原神 (追加)
-    ('原神', '刻晴'): 'keqing (genshin impact)',
-    
-    # 俺の妹がこんなに可愛いわけがない
-    ('俺の妹がこんなに可愛いわけがない', '高坂桐乃'): 'kousaka kirino',
-    
-    # 艦隊これくしょん (追加分)
-    ('艦隊これくしょん', 'z1 レーベレヒト・マース'): 'z1 leberecht maass (kancolle)',
-    ('艦隊これくしょん', 'コンテ・ディ・カブール'): 'conte di cavour (kancolle)',
-    ('艦隊これくしょん', '荒潮'): 'arashio (kancolle)',
-    ('艦隊これくしょん', '初春'): 'hatsuharu (kancolle)',
-    ('艦隊これくしょん', '雷'): 'ikazuchi (kancolle)',
-    
-    # 魔法少女まどか☆マギカ (追加)
-    ('魔法少女まどか☆マギカ', '環いろは'): 'tamaki iroha',
-    
-    # ゼルダの伝説シリーズ
-    ('ゼルダの伝説シリーズ', 'リンク'): 'link (zelda)',
-    
-    # マリオブラザーズ
-    ('マリオブラザーズ', 'ルイージ'): 'luigi',
-    
-    # メイドインアビス
-    ('メイドインアビス', 'リコ'): 'riko (made in abyss)',
-    ('メイドインアビス', 'レグ'): 'reg (made in abyss)',
-    
-    # わんだふるぷりきゅあ！
-    ('わんだふるぷりきゅあ！', '犬飼こむぎ（犬）'): 'inukai komugi',
-    ('わんだふるぷりきゅあ！', '猫屋敷ユキ（猫）'): 'nekoyashiki yuki',
-    
-    # 怪談
-    ('怪談', '八尺様風'): 'hachishaku-sama',
-    
-    # 艦隊これくしょん (さらに追加)
-    ('艦隊これくしょん', '霞'): 'kasumi (kancolle)',
-    ('艦隊これくしょん', '雪風'): 'yukikaze (kancolle)',
-    
-    # 東方
-    ('東方', 'ルーミア'): 'rumia (touhou)',
-    ('東方', '橙（チェン）'): 'chen (touhou)',
-}
+from character_aliases import CharacterAliasIndex, resolve_character
+from character_names import get_character_name
+from master_store import MASTER_FILE, RAW_MASTER_EDITED_FILE, RAW_MASTER_FILE, MasterStore
 
-def remove_emphasis(text):
-    """強調表現を削除する"""
-    # {{{}}}、{}、[]などの強調記号を削除
-    # ただし、作品名が括弧に含まれる場合は保持
-    result = text
-    
-    # {{}} や {{{{}}}} を削除
-    result = re.sub(r'\{\{+([^}]+)\}\}+', r'\1', result)
-    
-    # 単一の {} を削除
-    result = re.sub(r'\{([^}]+)\}', r'\1', result)
-    
-    # [] を削除
-    result = re.sub(r'\[+([^\]]+)\]+', r'\1', result)
-    
-    # 余分なスペースを削除
-    result = re.sub(r'\s+', ' ', result).strip()
-    
-    return result
+def process_tsv_with_mapping(input_file, output_file, master_file=MASTER_FILE):
+    """
+    TSVファイルをマッピング付きで処理
 
-def get_character_name(title, subtitle, original_prompt):
-    """キャラクター名を取得（マッピングまたは元の抽出ロジック）"""
-    # マッピングを最初にチェック
-    key = (title, subtitle)
-    if key in character_name_mapping:
-        return character_name_mapping[key]
-    
-    # マッピングにない場合は元のロジックを使用
-    extracted = extract_character_name_fallback(original_prompt, subtitle)
-    
-    # 強調表現を削除
-    return remove_emphasis(extracted)
-
-def extract_character_name_fallback(prompt, subtitle=""):
-    """フォールバック用のキャラクター名抽出ロジック"""
-    # 最初に {} で囲まれた部分を探す（単一の波括弧）
-    single_brace_match = re.search(r'^\{([^}]+)\}', prompt.strip())
-    if single_brace_match:
-        candidate = single_brace_match.group(1).strip()
-        # 作品名が括弧で含まれている場合はそのまま保持
-        # 例: fennec (kemono friends) -> そのまま
-        return candidate
-    
-    # {{{}}} で囲まれた最初の適切な候補を探す
-    matches = re.findall(r'\{\{+([^}]+)\}\}+', prompt)
-    
-    if matches:
-        for match in matches:
-            candidate = match.strip()
-            # 明らかにキャラクター名でない場合をスキップ
-            if re.search(r'(tareme|tsurime|hair|eyes|breasts|idolmaster|cinderella|fate|series)', candidate.lower()):
-                continue
-            # アンダースコア+括弧の場合は保持、スペース+括弧の場合のみ削除
-            if not re.search(r'_\([^)]+\)$', candidate) and not re.search(r'\s+\([^)]+\)$', candidate):
-                candidate = re.sub(r'\s+\([^)]+\)', '', candidate)
-            return candidate.strip()
-    
-    # 波括弧がない場合、最初のカンマまでの部分
-    parts = prompt.split(',')
-    if parts:
-        first_part = parts[0].strip()
-        if not re.search(r'_\([^)]+\)$', first_part) and not re.search(r'\s+\([^)]+\)$', first_part):
-            first_part = re.sub(r'\s+\([^)]+\)', '', first_part)
-        return first_part.strip()
-    
-    return prompt
-
-def process_tsv_with_mapping(input_file, output_file):
-    """TSVファイルをマッピング付きで処理"""
+    通常版のPromptは、抽出したキャラクター名（なければ日本語名）が master_file の
+    既存のキャラクター行のタグに対応付けられればそのタグにそろえる。
+    戻り値は (通常版の行数, 既存タグに対応付けた行数)
+    """
+    aliases = CharacterAliasIndex.from_store(MasterStore.load(master_file))
     non_character_rows = []
     character_rows = []
+    matched_count = 0
     
     with open(input_file, 'r', encoding='utf-8') as f:
         reader = csv.reader(f, delimiter='\t')
@@ -268,8 +34,12 @@ def process_tsv_with_mapping(input_file, output_file):
                     # キャラクター再現版（オリジナル）
                     character_rows.append(['キャラクター再現', title, subtitle, prompt])
                     
-                    # 通常版（マッピングまたは抽出）
+                    # 通常版（マッピングまたは抽出）、既存のキャラクタータグがあればそちらにそろえる
                     simplified_name = get_character_name(title, subtitle, prompt)
+                    match = resolve_character(aliases, title, subtitle, simplified_name)
+                    if match is not None:
+                        simplified_name = match.tag
+                        matched_count += 1
                     character_rows.append(['キャラクター', title, subtitle, simplified_name])
                 else:
                     non_character_rows.append(row)
@@ -291,10 +61,16 @@ def process_tsv_with_mapping(input_file, output_file):
     with open(output_file, 'w', encoding='utf-8', newline='') as f:
         writer = csv.writer(f, delimiter='\t')
         writer.writerows(all_rows)
+    
+    return len(character_rows) // 2, matched_count
 
 if __name__ == '__main__':
-    input_file = '/mnt/e/Project/Extension/Prompt/非整形マスター.tsv'
-    output_file = '/mnt/e/Project/Extension/Prompt/非整形マスター_編集済み.tsv'
-    
-    process_tsv_with_mapping(input_file, output_file)
-    print(f"処理完了: {output_file}")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='キャラクター名マッピング付きでキャラクター行を整理')
+    parser.add_argument('input_file', nargs='?', default=RAW_MASTER_FILE)
+    parser.add_argument('output_file', nargs='?', default=RAW_MASTER_EDITED_FILE)
+    parser.add_argument('--master', default=MASTER_FILE,
+                        help='既存のキャラクタータグを読むマスターデータ（既定: data-management/マスターデータ.tsv）')
+    args = parser.parse_args()
+    
+    character_count, matched_count = process_tsv_with_mapping(args.input_file, args.output_file, args.master)
+    print(f"処理完了: {args.output_file}（キャラクター {character_count}件、既存タグに対応付け {matched_count}件）")
\ No newline at end of file
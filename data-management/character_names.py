@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+キャラクター再現プロンプトからキャラクター名（通常版のPrompt）を取り出す処理
+
+process_characters_clean.py・character_mapping.py で共通の抽出処理。
+正規表現はすべてモジュール読み込み時にコンパイルし、抽出結果は (Prompt, 小項目) を
+キーに LRU キャッシュするので、同じプロンプトが何度出てきても1回しか解析しない。
+
+抽出結果は benchmarks/character_names.tsv（マスターデータのバックアップにあった
+キャラクター再現 -> キャラクター の対応から作成）と照合できる。プロンプトにキャラクター名が
+ないなどで食い違うことを確認済みの行は benchmarks/character_names_expected_failures.tsv に
+理由とともに記録し、それ以外の食い違いと確認済みの行の変化だけを失敗とする。
+
+作品名のタグ（"yuru yuri" など）は、マスターデータのタグに付いている作品名
+（"name (series)" の series）から判定する。
+
+    python3 character_names.py check    # 対応表と照合し、食い違いを表示
+    python3 character_names.py bench    # 抽出速度の計測
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+
+from gender_registry import is_character_major
+from master_store import MASTER_FILE, MasterStore
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_FILE = os.path.join(BASE_DIR, 'benchmarks', 'character_names.tsv')
+# 食い違うことを確認済みの行（作品<TAB>小項目<TAB>抽出結果<TAB>理由）
+EXPECTED_FAILURES_FILE = os.path.join(BASE_DIR, 'benchmarks', 'character_names_expected_failures.tsv')
+
+# 手動マッピング（抽出では正しく取り出せないキャラクター名）
+CHARACTER_NAME_MAPPING = {
+    # アイドルマスター
+    ('アイドルマスター', '三浦あずさ（ロングヘア）'): 'miura azusa',
+    ('アイドルマスター', '我那覇響'): 'ganaha hibiki',
+    ('アイドルマスター', '水瀬伊織'): 'minase iori',
+    ('アイドルマスター', '秋月律子'): 'akizuki ritsuko',
+    ('アイドルマスター', '萩原雪歩'): 'hagiwara yukiho',
+    
+    # アイドルマスター シャイニーカラーズ
+    ('アイドルマスター シャイニーカラーズ', '八宮めぐる'): 'hachimiya meguru',
+    ('アイドルマスター シャイニーカラーズ', '樋口円香'): 'higuchi madoka',
+    ('アイドルマスター シャイニーカラーズ', '浅倉透'): 'asakura toru',
+    ('アイドルマスター シャイニーカラーズ', '西城樹里'): 'saijou juri',
+    ('アイドルマスター シャイニーカラーズ', '黛冬優子'): 'mayuzumi fuyuko',
+    
+    # アイドルマスターシンデレラガールズ
+    ('アイドルマスターシンデレラガールズ', 'アナスタシア'): 'anastasia',
+    ('アイドルマスターシンデレラガールズ', 'エミリー'): 'emily stewart',
+    ('アイドルマスターシンデレラガールズ', 'ナターリア'): 'natalia',
+    ('アイドルマスターシンデレラガールズ', '中谷育'): 'nakatani iku',
+    ('アイドルマスターシンデレラガールズ', '伊吹翼'): 'ibuki tsubasa',
+    ('アイドルマスターシンデレラガールズ', '佐城雪美'): 'sajo yukimi',
+    ('アイドルマスターシンデレラガールズ', '佐藤心'): 'satou shin',
+    ('アイドルマスターシンデレラガールズ', '北条加蓮'): 'houjou karen',
+    ('アイドルマスターシンデレラガールズ', '千川ちひろ'): 'senkawa chihiro',
+    ('アイドルマスターシンデレラガールズ', '双葉杏'): 'futaba anzu',
+    ('アイドルマスターシンデレラガールズ', '向井拓海'): 'mukai takumi',
+    ('アイドルマスターシンデレラガールズ', '周防桃子'): 'suou momoko',
+    ('アイドルマスターシンデレラガールズ', '新田美波'): 'nitta minami',
+    ('アイドルマスターシンデレラガールズ', '春日未来'): 'kasuga mirai',
+    ('アイドルマスターシンデレラガールズ', '本田未央'): 'honda mio',
+    ('アイドルマスターシンデレラガールズ', '的場梨沙'): 'matoba risa',
+    ('アイドルマスターシンデレラガールズ', '神谷奈緒'): 'kamiya nao',
+    ('アイドルマスターシンデレラガールズ', '福山舞'): 'fukuyama mai',
+    ('アイドルマスターシンデレラガールズ', '遊佐こずえ'): 'yusa kozue',
+    ('アイドルマスターシンデレラガールズ', '龍崎薫'): 'ryuzaki kaoru',
+    
+    # To LOVEる
+    ('To LOVEる -とらぶる', 'ティアーユ・ルナティーク'): 'teayu lunatique',
+    ('To LOVEる -とらぶる', 'ララ・サタリン・デビルーク'): 'lala satalin deviluke',
+    ('To LOVEる -とらぶる', '天条院沙姫'): 'tenjouin saki',
+    ('To LOVEる -とらぶる', '小手川唯'): 'kotegawa yui',
+    ('To LOVEる -とらぶる', '金色の闇（ヤミ）'): 'konjiki no yami',
+    
+    # ぼっち・ざ・ろっく！
+    ('ぼっち・ざ・ろっく！', '伊地知虹夏'): 'ijichi nijika',
+    ('ぼっち・ざ・ろっく！', '後藤ひとり'): 'gotou hitori',
+    
+    # この素晴らしい世界に祝福を
+    ('この素晴らしい世界に祝福を', 'ウィズ'): 'wiz (konosuba)',
+    ('この素晴らしい世界に祝福を', 'ダクネス'): 'darkness (konosuba)',
+    
+    # Hololive
+    ('Hololive', 'トワ様'): 'tokoyami towa',
+    ('Hololive', 'るーちゃん'): 'uruha rushia',
+    
+    # けものフレンズ
+    ('けものフレンズ', 'フェネック'): 'fennec (kemono friends)',
+    ('けものフレンズ', 'コウテイペンギン'): 'emperor penguin (kemono friends)',
+    ('けものフレンズ', 'サーバル'): 'serval (kemono friends)',
+    ('けものフレンズ', 'かばん'): 'kaban (kemono friends)',
+    
+    # 原神
+    ('原神', '胡桃'): 'hu tao',
+    ('原神', '刻晴'): 'keqing (genshin impact)',
+    
+    # アトリエ
+    ('アトリエ', 'ライザ'): 'reisalin stout',
+    
+    # その他
+    ('VOICE BOX', 'ずんだもん'): 'zundamon',
+    ('ポケモン', 'ヒカリ'): 'hikari (pokemon)',
+    ('ラブライブ！サンシャイン！！', '鹿角理亞'): 'kazuno ria',
+    ('ラブライブ！サンシャイン！！', '小原鞠莉'): 'ohara mari',
+    ('ラブライブ！スーパースター!!', 'ウィーン・マルガレーテ'): 'wien margarete',
+    ('ラブライブ！スーパースター!!', '嵐 千砂都'): 'arashi chisato',
+    ('ラブライブ！スーパースター!!', '平安名 すみれ'): 'heanna sumire',
+    ('ラブライブ！スーパースター!!', '葉月 恋'): 'hazuki ren',
+    ('ラブライブ！虹ヶ咲学園スクールアイドル同好会', 'ショウ・ランジュ'): 'zhong lanzhu',
+    ('ラブライブ！虹ヶ咲学園スクールアイドル同好会', '中須かすみ'): 'nakasu kasumi',
+    ('中二病でも恋がしたい！', '小鳥遊六花'): 'takanashi rikka',
+    ('物語シリーズ', '忍野忍'): 'oshino shinobu',
+    ('艦隊これくしょん', '望月'): 'mochizuki (kancolle)',
+    ('艦隊これくしょん', '霧島'): 'kirishima (kancolle)',
+    ('艦隊これくしょん', '武蔵'): 'musashi (kancolle)',
+    ('艦隊これくしょん', 'z1 レーベレヒト・マース'): 'z1 leberecht maass (kancolle)',
+    ('艦隊これくしょん', 'コンテ・ディ・カブール'): 'conte di cavour (kancolle)',
+    ('艦隊これくしょん', '荒潮'): 'arashio (kancolle)',
+    ('艦隊これくしょん', '初春'): 'hatsuharu (kancolle)',
+    ('艦隊これくしょん', '雷'): 'ikazuchi (kancolle)',
+    ('艦隊これくしょん', '霞'): 'kasumi (kancolle)',
+    ('艦隊これくしょん', '雪風'): 'yukikaze (kancolle)',
+    ('魔法少女まどか☆マギカ', '佐倉杏子'): 'sakura kyouko',
+    ('魔法少女まどか☆マギカ', '巴マミ'): 'tomoe mami',
+    ('魔法少女まどか☆マギカ', '暁美ほむら'): 'akemi homura',
+    ('魔法少女まどか☆マギカ', '美樹さやか'): 'miki sayaka',
+    ('魔法少女まどか☆マギカ', '環いろは'): 'tamaki iroha',
+    ('セーラームーン', 'ちびうさ'): 'chibiusa',
+    ('ゼロの使い魔', 'ルイズ'): 'louise francoise le blanc de la valliere',
+    ('ノーゲーム・ノーライフ', 'ジブリール'): 'jibril',
+    ('ノーゲーム・ノーライフ', '白'): 'shiro',
+    ('ボーカロイド', '鏡音レン'): 'kagamine ren',
+    ('GTA V', 'トレバー・フィリップス'): 'trevor philips',
+    ('アカメが斬る！', 'アカメ'): 'akame (akame ga kill!)',
+    ('ゼルダの伝説シリーズ', 'リンク'): 'link (zelda)',
+    ('マリオブラザーズ', 'ルイージ'): 'luigi',
+    ('メイドインアビス', 'リコ'): 'riko (made in abyss)',
+    ('メイドインアビス', 'レグ'): 'reg (made in abyss)',
+    ('わんだふるぷりきゅあ！', '犬飼こむぎ（犬）'): 'inukai komugi',
+    ('わんだふるぷりきゅあ！', '猫屋敷ユキ（猫）'): 'nekoyashiki yuki',
+    ('怪談', '八尺様風'): 'hachishaku-sama',
+    ('東方', 'ルーミア'): 'rumia (touhou)',
+    ('東方', '橙（チェン）'): 'chen (touhou)',
+    ('サノバウィッチ', '因幡めぐる'): 'inaba meguru',
+    ('ダンガンロンパ', '朝日奈葵'): 'asahina aoi',
+    ('ダンガンロンパ', '朝日奈葵(水着)'): 'asahina aoi',
+    ('俺の妹がこんなに可愛いわけがない', '高坂桐乃'): 'kousaka kirino',
+}
+
+# 強調記号（{} / []）
+EMPHASIS = re.compile(r'[{}\[\]]+')
+WHITESPACE = re.compile(r'\s+')
+# キャラクター名ではないタグ（髪・目などの外見、作品名、人数・年齢など）
+NOT_NAME_WORDS = re.compile(
+    r'tareme|tsurime|hair|eyes|breasts|skirt|jacket|blazer|suit|vest|bangs|sidelock|forehead|'
+    r'necktie|wings|uniform|detailed|illustration|series')
+NOT_NAME_TAGS = re.compile(
+    r'^(?:\d+(?:girl|boy)s?|(?:fe)?male|solo|loli|child|nsfw|precure|official art|game cg|'
+    r'masterpiece|(?:best|high) quality|highres|absurdres|year \d+)$')
+# 末尾の作品名（"name (series)" の " (series)"）
+SERIES_SUFFIX = re.compile(r'\s*\([^()]*\)$')
+SERIES_QUALIFIER = re.compile(r'\(([^()]*)\)$')
+TAG_SEPARATORS = re.compile(r'[_;]')
+
+# 作品名とみなす最短の長さ（"(f)" のような短い補足を除く）
+MIN_SERIES_LENGTH = 3
+
+# 抽出結果のキャッシュ件数
+CACHE_SIZE = 8192
+
+
+def remove_emphasis(text):
+    """強調表現（{{{}}}、{}、[] など）と余分な空白を削除する"""
+    return WHITESPACE.sub(' ', EMPHASIS.sub('', text)).strip(' _')
+
+
+def trim_unbalanced(text):
+    """
+    対応しない括弧の外側を取り除く
+
+    "a girl_have_(helena (kancolle)" のように文の途中にタグを埋め込んだものから
+    "helena (kancolle)" を取り出す
+    """
+    while text.count('(') > text.count(')'):
+        text = text[text.index('(') + 1:]
+    while text.count(')') > text.count('('):
+        text = text[:text.rindex(')')]
+    return text.strip(' _')
+
+
+@lru_cache(maxsize=None)
+def series_qualifiers(path=MASTER_FILE):
+    """
+    マスターデータのタグに付いている作品名（"name (series)" の series）
+
+    (全タグの作品名の集合, キャラクター行の 中項目 -> そのキャラクタータグの作品名の集合) を返す。
+    前者は作品名を並べたタグ（"yuru yuri" など）をキャラクター名と区別するため、
+    後者は同じ作品のキャラクタータグ（"power (chainsaw man)" など）を優先するために使う
+    """
+    names = set()
+    by_title = {}
+    for major, middle, _, prompt in MasterStore.load(path):
+        character = is_character_major(major)
+        for tag in prompt.split(','):
+            match = SERIES_QUALIFIER.search(normalize_tag(tag))
+            if not match or len(match.group(1).strip()) < MIN_SERIES_LENGTH:
+                continue
+            qualifier = match.group(1).strip()
+            names.add(qualifier)
+            if character:
+                by_title.setdefault(middle, set()).add(qualifier)
+    return frozenset(names), {title: frozenset(values) for title, values in by_title.items()}
+
+
+def normalize_tag(tag):
+    """照合用のタグ（強調を外し、小文字化して "_" / ";" を空白に）"""
+    return WHITESPACE.sub(' ', TAG_SEPARATORS.sub(' ', remove_emphasis(tag).lower())).strip()
+
+
+def is_series_tag(tag):
+    """作品名のタグか（既知の作品名そのもの、または作品名で始まる・終わるもの）"""
+    body = SERIES_SUFFIX.sub('', normalize_tag(tag))
+    if not body:
+        return False
+    series = series_qualifiers()[0]
+    if body in series:
+        return True
+    # "idolmaster shiny colors" のように作品名で始まるもの、"mahou shoujo madoka magica" のように
+    # 2語以上の作品名で終わるもの
+    words = body.split(' ')
+    return (any(' '.join(words[:end]) in series for end in range(1, len(words)))
+            or any(' '.join(words[start:]) in series for start in range(1, len(words) - 1)))
+
+
+def is_name_tag(tag):
+    """キャラクター名として使えるタグか"""
+    lowered = tag.lower()
+    return (not NOT_NAME_WORDS.search(lowered) and not NOT_NAME_TAGS.match(lowered)
+            and not is_series_tag(tag))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def extract_character_name(prompt, title=""):
+    """
+    プロンプトからキャラクター名を抽出
+
+    作品 title のキャラクタータグと同じ作品名が付いたタグ（"name (series)"）があれば最初のもの、
+    なければ {{ }} 以上で強調されたタグのうち最初のキャラクター名らしいもの、なければ
+    最初のキャラクター名らしいタグ、それもなければ最初のタグを強調を外して返す
+    """
+    title_series = series_qualifiers()[1].get(title, ())
+    first = first_name = emphasized = None
+    for tag in prompt.split(','):
+        tag = tag.strip()
+        if not tag:
+            continue
+        body = trim_unbalanced(remove_emphasis(tag))
+        if not body:
+            continue
+        if first is None:
+            first = body
+        if not is_name_tag(body):
+            continue
+        match = SERIES_QUALIFIER.search(normalize_tag(body))
+        if match and match.group(1).strip() in title_series:
+            return body
+        if emphasized is None and tag.startswith('{{'):
+            emphasized = body
+        if first_name is None:
+            first_name = body
+    for name in (emphasized, first_name, first):
+        if name is not None:
+            return name
+    return prompt.strip()
+
+
+def get_character_name(title, subtitle, original_prompt):
+    """キャラクター名を取得（マッピングまたは抽出）"""
+    mapped = CHARACTER_NAME_MAPPING.get((title, subtitle))
+    if mapped is not None:
+        return mapped
+    return extract_character_name(original_prompt, title)
+
+
+# ============================================
+# 対応表との照合
+# ============================================
+
+def read_corpus(path=CORPUS_FILE):
+    """対応表（作品<TAB>小項目<TAB>再現Prompt<TAB>キャラクター名）を読み込む"""
+    cases = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            cases.append(tuple(line.split('\t')))
+    return cases
+
+
+def read_expected_failures(path=EXPECTED_FAILURES_FILE):
+    """確認済みの食い違い (作品, 小項目) -> 抽出結果"""
+    return {(title, subtitle): name for title, subtitle, name, _ in read_corpus(path)}
+
+
+def matches_expected(name, expected):
+    """
+    抽出結果が期待値と一致するか
+
+    大文字小文字と "_" / 空白の違い、2語の名前の姓名の順は無視し、
+    期待値末尾の " (作品名)" は省略されていてもよい
+    """
+    name = normalize_tag(name)
+    expected = normalize_tag(trim_unbalanced(expected))
+    candidates = {expected, SERIES_SUFFIX.sub('', expected)}
+    words = SERIES_SUFFIX.sub('', expected).split(' ')
+    if len(words) == 2:
+        candidates.add(f"{words[1]} {words[0]}")
+    return name in candidates
+
+
+def check(cases):
+    """食い違った (作品, 小項目, 期待値, 抽出結果) のリストを返す"""
+    failures = []
+    for title, subtitle, prompt, expected in cases:
+        name = get_character_name(title, subtitle, prompt)
+        if not matches_expected(name, expected):
+            failures.append((title, subtitle, expected, name))
+    return failures
+
+
+def compare_expected(failures, expected_failures):
+    """
+    食い違いを確認済みのものと比べる
+
+    (確認済みにない食い違い, 抽出結果が変わった確認済みの (作品, 小項目, 今回の抽出結果)) を返す。
+    一致するようになった確認済みの行は、今回の抽出結果が None
+    """
+    found = {(title, subtitle): name for title, subtitle, _, name in failures}
+    new = [failure for failure in failures if failure[:2] not in expected_failures]
+    changed = [(*key, found.get(key)) for key, name in expected_failures.items() if found.get(key) != name]
+    return new, changed
+
+
+def bench(cases, repeat):
+    """キャッシュなし・ありの抽出時間（秒）を返す"""
+    extract_character_name.cache_clear()
+    # 作品名の一覧（マスターデータの読み込み）は計測に含めない
+    series_qualifiers()
+    start = time.perf_counter()
+    for title, subtitle, prompt, _ in cases:
+        extract_character_name.__wrapped__(prompt, title)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for title, subtitle, prompt, _ in cases:
+            get_character_name(title, subtitle, prompt)
+    warm = time.perf_counter() - start
+    return cold, warm
+
+
+def main():
+    parser = argparse.ArgumentParser(description='キャラクター名抽出の照合・計測')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('check', help='対応表と照合')
+    bench_parser = subparsers.add_parser('bench', help='抽出速度の計測')
+    bench_parser.add_argument('--repeat', type=int, default=20, help='対応表を処理する回数')
+    args = parser.parse_args()
+
+    cases = read_corpus()
+    if args.command == 'check':
+        failures = check(cases)
+        new, changed = compare_expected(failures, read_expected_failures())
+        for title, subtitle, expected, name in new:
+            print(f"{title} / {subtitle}: 期待値 {expected} / 抽出結果 {name}")
+        for title, subtitle, name in changed:
+            result = '期待値と一致' if name is None else f'抽出結果 {name}'
+            print(f"{title} / {subtitle}: 確認済みの食い違いから変わりました（{result}。"
+                  f"{os.path.basename(EXPECTED_FAILURES_FILE)} を見直してください）")
+        print(f"{len(cases)}件中 {len(cases) - len(failures)}件一致"
+              f"（確認済みの食い違い {len(failures) - len(new)}件）")
+        # 手動マッピングで答えが決まる行を除いた、抽出処理だけの一致率
+        extracted = [case for case in cases if (case[0], case[1]) not in CHARACTER_NAME_MAPPING]
+        extracted_failures = sum(1 for failure in failures if (failure[0], failure[1]) not in CHARACTER_NAME_MAPPING)
+        print(f"手動マッピングを除く抽出のみ: {len(extracted)}件中 {len(extracted) - extracted_failures}件一致")
+        sys.exit(1 if new or changed else 0)
+
+    cold, warm = bench(cases, args.repeat)
+    rows = len(cases) * args.repeat
+    print(f"キャッシュなし: {len(cases)}件 {cold * 1000:.1f} ms（{len(cases) / cold:,.0f} 件/秒）")
+    print(f"キャッシュあり: {rows}件 {warm * 1000:.1f} ms（{rows / warm:,.0f} 件/秒）")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+from master_store import MasterStore
+
 # 削除対象のキャラクター再現項目（独断と偏見）
 characters_to_remove = [
     # 古い作品で現在需要が少ないもの
@@ -71,26 +73,16 @@ characters_to_remove = [
     ("キャラクター再現", "おジャ魔女どれみ", "飛鳥ももこ"),
 ]
 
-with open('マスターデータ.tsv', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-new_lines = []
+store = MasterStore.load()
 removed_count = 0
 
-for line in lines:
-    parts = line.strip().split('\t')
-    
-    # キャラクター再現の削除対象チェック
-    if len(parts) >= 3:
-        key = (parts[0], parts[1], parts[2])
-        if key in characters_to_remove:
-            removed_count += 1
-            print(f"削除: {parts[1]} - {parts[2]}")
-            continue
-    
-    new_lines.append(line)
+# キャラクター再現の削除対象をキーインデックスで直接引く
+for major, middle, small in characters_to_remove:
+    for row_id in store.find(major, middle, small):
+        store.delete(row_id)
+        removed_count += 1
+        print(f"削除: {middle} - {small}")
 
-with open('マスターデータ.tsv', 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
+store.commit()
 
-print(f"\n削除完了: {removed_count}項目を削除しました")
\ No newline at end of file
+print(f"\n削除完了: {removed_count}項目を削除しました")
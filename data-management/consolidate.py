@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+マスターデータのソート・重複削除・同一プロンプト項目統合（sort_and_clean.sh の置き換え）
+
+1. Prompt 末尾のカンマ・空白を削除
+2. 完全一致行を削除してソート
+3. 大項目・中項目・Prompt が同じ行の小項目をカンマ区切りで統合
+
+ファイルは一度だけ読み込み、集合で重複判定するため行数に対して線形で処理する。
+書き込みは一時ファイル経由で置き換えるため、途中ファイルは残らない。
+"""
+
+import argparse
+import re
+
+from backup_store import backup_file
+from master_store import MASTER_FILE, MasterStore
+from run_report import RunReport, add_arguments
+
+TRAILING_COMMA = re.compile(r',\s*$')
+
+
+def consolidate_rows(rows):
+    """
+    行を整形・ソートし、同じ (大項目, 中項目, Prompt) の小項目を統合した行リストを返す
+
+    統合後の行は、統合キーがソート順で最初に現れた位置に並ぶ
+    """
+    # 末尾カンマ削除と完全一致行の削除
+    unique_rows = {
+        (major, middle, small, TRAILING_COMMA.sub('', prompt))
+        for major, middle, small, prompt in rows
+    }
+
+    # 行全体での並べ替え（タブ区切り行の sort と同じ順序）
+    merged = {}
+    for major, middle, small, prompt in sorted(unique_rows):
+        key = (major, middle, prompt)
+        entry = merged.get(key)
+        if entry is None:
+            merged[key] = ([small], set(small.split(',')))
+            continue
+        smalls, seen = entry
+        if small not in seen:
+            smalls.append(small)
+            seen.update(small.split(','))
+
+    return [(major, middle, ','.join(smalls), prompt)
+            for (major, middle, prompt), (smalls, _) in merged.items()]
+
+
+def consolidate(store):
+    """ストアの内容を整形・統合して置き換える。(処理前の行数, 処理後の行数) を返す"""
+    before = len(store)
+    store.replace(consolidate_rows(store))
+    return before, len(store)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='マスターデータのソート・重複削除・小項目統合')
+    parser.add_argument('file', nargs='?', default=MASTER_FILE, help='対象のTSV（既定: マスターデータ.tsv）')
+    parser.add_argument('--no-backup', action='store_true', help='処理前のバックアップを作成しない')
+    add_arguments(parser)
+    args = parser.parse_args()
+    report = RunReport.from_args('consolidate', args)
+
+    print("マスターデータソート・クリーニング開始...")
+    if not args.no_backup:
+        with report.stage('backup'):
+            snapshot_id = backup_file(args.file, 'before_consolidate')
+        print(f"バックアップ作成: {snapshot_id}")
+
+    with report.stage('load'):
+        store = MasterStore.load(args.file)
+    with report.stage('consolidate'):
+        before, after = consolidate(store)
+    with report.stage('write'):
+        store.commit()
+    report.count('rows_before', before)
+    report.count('rows_after', after)
+
+    print(f"処理完了: {before} 行 -> {after} 行")
+    print("ソート・クリーニング完了!")
+    report.finish(args.file)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,54 +1,29 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import re
-
-def is_mostly_english(text):
-    """テキストが主に英語かどうかを判定"""
-    if not text:
-        return False
-    
-    # 英語以外の文字（日本語、記号など）を除去
-    english_chars = re.sub(r'[^a-zA-Z\s]', '', text)
-    # 全体の文字数
-    total_chars = re.sub(r'\s', '', text)
-    
-    if len(total_chars) == 0:
-        return False
-    
-    # 英語の文字が50%以上で、かつ3文字以上の場合
-    return len(english_chars.replace(' ', '')) / len(total_chars) > 0.5 and len(total_chars) >= 3
+from master_store import MasterStore
+from script_profile import ScriptProfile, select
 
 def main():
     try:
         # マスターデータを読み込み
-        with open('マスターデータ.tsv', 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        store = MasterStore.load()
         
         english_items = []
         
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-                
-            parts = line.split('\t')
-            if len(parts) >= 4:
-                大項目 = parts[0]
-                中項目 = parts[1]
-                小項目 = parts[2]
-                prompt = parts[3]
-                
-                # 小項目とPromptが両方とも英語の場合
-                if is_mostly_english(小項目) and is_mostly_english(prompt):
-                    english_items.append({
-                        'line_num': line_num,
-                        '大項目': 大項目,
-                        '中項目': 中項目,
-                        '小項目': 小項目,
-                        'prompt': prompt,
-                        'full_line': line
-                    })
+        # 小項目とPromptが両方とも英語の場合（文字種構成はストアの派生列としてキャッシュ）
+        for row_id in select(store,
+                             小項目=ScriptProfile.is_mostly_english,
+                             Prompt=ScriptProfile.is_mostly_english):
+            大項目, 中項目, 小項目, prompt = store.row(row_id)
+            english_items.append({
+                'line_num': row_id + 1,
+                '大項目': 大項目,
+                '中項目': 中項目,
+                '小項目': 小項目,
+                'prompt': prompt,
+                'full_line': '\t'.join(store.row(row_id))
+            })
         
         print(f"小項目とPromptが両方とも英語の項目: {len(english_items)}個")
         print()
@@ -1,54 +1,29 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import re
-
-def is_mostly_japanese(text):
-    """テキストが主に日本語（ひらがな、カタカナ、漢字）かどうかを判定"""
-    if not text:
-        return False
-    
-    # 日本語文字（ひらがな、カタカナ、漢字）をカウント
-    japanese_chars = re.findall(r'[ひらがなカタカナ一-龯]', text)
-    # 全体の文字数（スペースを除く）
-    total_chars = re.sub(r'\s', '', text)
-    
-    if len(total_chars) == 0:
-        return False
-    
-    # 日本語の文字が50%以上で、かつ2文字以上の場合
-    return len(japanese_chars) / len(total_chars) > 0.5 and len(total_chars) >= 2
+from master_store import MasterStore
+from script_profile import ScriptProfile, select
 
 def main():
     try:
         # マスターデータを読み込み
-        with open('マスターデータ.tsv', 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        store = MasterStore.load()
         
         japanese_prompt_items = []
         
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-                
-            parts = line.split('\t')
-            if len(parts) >= 4:
-                大項目 = parts[0]
-                中項目 = parts[1]
-                小項目 = parts[2]
-                prompt = parts[3]
-                
-                # 小項目とPromptが両方とも日本語の場合
-                if is_mostly_japanese(小項目) and is_mostly_japanese(prompt):
-                    japanese_prompt_items.append({
-                        'line_num': line_num,
-                        '大項目': 大項目,
-                        '中項目': 中項目,
-                        '小項目': 小項目,
-                        'prompt': prompt,
-                        'full_line': line
-                    })
+        # 小項目とPromptが両方とも日本語の場合（文字種構成はストアの派生列としてキャッシュ）
+        for row_id in select(store,
+                             小項目=ScriptProfile.is_mostly_japanese,
+                             Prompt=ScriptProfile.is_mostly_japanese):
+            大項目, 中項目, 小項目, prompt = store.row(row_id)
+            japanese_prompt_items.append({
+                'line_num': row_id + 1,
+                '大項目': 大項目,
+                '中項目': 中項目,
+                '小項目': 小項目,
+                'prompt': prompt,
+                'full_line': '\t'.join(store.row(row_id))
+            })
         
         print(f"小項目とPromptが両方とも日本語の項目: {len(japanese_prompt_items)}個")
         print()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+キャラクター名・Promptから性別・種別を推定するトークン単位の分類器
+
+文字列を英単語のトークンに一度だけ分割し、各トークンをキーワード表（キーワード -> (分類, 重み)）で
+引いて分類ごとに点数を合計する。部分文字列では照合しないので、"ai" や "l" のような短い
+キーワードが "rail" や "lily" の中で一致することはない。
+
+- 点数はキーワードの種類（一般語 > キャラクター名 > 名前の語尾）と位置で重み付けする
+- 先頭タグの括弧内（作品名）は数えず、2つ目以降のタグでは一般語だけを低い重みで数える
+  （"(naruto)" を男性キャラクター名、"(chainsaw man)" を男性を表す語とはみなさない）
+- 結果は点数順の順位と確信度（1位の点数 / (全分類の合計点 + CONFIDENCE_PRIOR)）で返す
+
+    python3 gender_classifier.py "tomori nao (charlotte)" "gardevoir (pokemon)"
+"""
+
+import re
+import sys
+from collections import namedtuple
+
+from tag_vectors import VOCABULARY
+
+# 分類（同点の場合は前のものを優先）
+NEUTRAL = 'neutral'
+NON_HUMAN = 'non_human'
+MALE = 'male'
+FEMALE = 'female'
+UNKNOWN = 'unknown'
+LABELS = (NEUTRAL, NON_HUMAN, MALE, FEMALE)
+
+# キーワードの種類ごとの重み
+TERM_WEIGHT = 3.0      # girl / robot / dragon のような一般語
+NAME_WEIGHT = 2.0      # 特定のキャラクター名
+SUFFIX_WEIGHT = 0.5    # 日本人名の語尾（-ko / -mi など）
+
+# 2つ目以降のタグでの一般語の一致に掛ける係数
+CONTEXT_FACTOR = 0.5
+
+# 確信度の分母に加える値（一致が弱い場合は1位しかなくても確信度を低くする）
+CONFIDENCE_PRIOR = 1.0
+
+TERMS = {
+    NEUTRAL: {
+        'robot', 'android', 'machine', 'cyborg', 'automaton', 'golem', 'construct',
+        'monster', 'creature', 'entity',
+    },
+    NON_HUMAN: {
+        'dragon', 'demon', 'devil', 'angel', 'spirit', 'ghost', 'zombie', 'vampire', 'werewolf',
+        'cat', 'dog', 'fox', 'wolf', 'bear', 'lion', 'tiger', 'rabbit', 'mouse', 'bird',
+        'youkai', 'oni', 'kitsune', 'tengu', 'kappa', 'yokai',
+        'slime', 'goblin', 'orc', 'elf', 'dwarf', 'fairy', 'pixie',
+        'anthro', 'furry', 'kemono', 'animal ears', 'tail',
+    },
+    MALE: {
+        'boy', 'man', 'male', 'king', 'prince', 'knight', 'warrior', 'hero', 'master', 'father', 'brother',
+    },
+    FEMALE: {
+        'girl', 'woman', 'female', 'lady', 'maiden', 'princess', 'queen', 'goddess', 'witch', 'maid', 'nun', 'sister',
+    },
+}
+
+NAMES = {
+    NEUTRAL: {
+        'pikachu', 'charizard', 'blastoise', 'venusaur', 'mewtwo', 'mew', 'lucario', 'gardevoir', 'lopunny',
+        'eevee', 'vaporeon', 'jolteon', 'flareon', 'espeon', 'umbreon', 'leafeon', 'glaceon', 'sylveon',
+    },
+    NON_HUMAN: set(),
+    MALE: {
+        'astolfo', 'gilgamesh', 'archer', 'lancer', 'berserker', 'rider', 'caster', 'assassin',
+        'shirou', 'kiritsugu', 'kirei', 'tokiomi',
+        'kazuma', 'subaru', 'ainz', 'momonga', 'naofumi', 'motoyasu', 'ren', 'itsuki',
+        'tanjiro', 'zenitsu', 'inosuke', 'giyu', 'rengoku', 'tengen', 'muichiro', 'gyomei', 'sanemi', 'obanai',
+        'deku', 'bakugo', 'todoroki', 'iida', 'kirishima', 'kaminari', 'sero', 'tokoyami', 'shoji', 'ojiro',
+        'sato', 'koda', 'aoyama', 'mineta',
+        'eren', 'armin', 'levi', 'erwin', 'jean', 'connie', 'reiner', 'bertholdt', 'zeke',
+        'gon', 'killua', 'kurapika', 'leorio',
+        'natsu', 'gray', 'gajeel',
+        'luffy', 'zoro', 'sanji', 'usopp', 'chopper', 'franky', 'brook', 'jinbe',
+        'naruto', 'sasuke', 'kakashi', 'iruka', 'jiraiya', 'orochimaru',
+        'chad', 'ishida', 'renji', 'byakuya',
+        'goku', 'vegeta', 'gohan', 'piccolo', 'krillin', 'yamcha', 'tien', 'chiaotzu',
+        'yusuke', 'kuwabara', 'hiei', 'kurama',
+        'inuyasha', 'miroku', 'shippo', 'sesshomaru',
+        'alucard', 'vash', 'wolfwood', 'spike', 'jet', 'ein',
+        'shinji', 'gendo', 'kenshin', 'yahiko', 'sanosuke',
+        'light', 'l', 'near', 'mello', 'ryuk',
+        'edward', 'alphonse', 'roy', 'hughes',
+        'senku', 'chrome', 'gen', 'ukyo', 'tsukasa',
+        'tadano', 'norman', 'ray', 'nat', 'lannion', 'thoma', 'conny',
+    },
+    FEMALE: {
+        'saber', 'rin', 'sakura', 'illya', 'nero', 'artoria', 'jeanne', 'mash', 'nitocris', 'bb',
+        'reimu', 'marisa', 'cirno', 'remilia', 'flandre', 'patchouli', 'youmu', 'yuyuko', 'yukari',
+        'aqua', 'megumin', 'darkness', 'wiz', 'eris', 'yunyun',
+        'mikasa', 'historia', 'annie', 'sasha', 'pieck', 'ymir',
+        'ochako', 'tsuyu', 'momo', 'kyoka', 'mina', 'toru', 'nejire',
+        'nezuko', 'shinobu', 'mitsuri', 'kanao',
+        'zero two', 'ichigo', 'kokoro',
+        'violet', 'cattleya', 'iris', 'erica',
+        'chika', 'kaguya', 'hayasaka', 'iino',
+        'raphtalia', 'filo', 'melty',
+        'emilia', 'rem', 'ram', 'beatrice', 'felt', 'priscilla', 'crusch', 'anastasia',
+        'albedo', 'shalltear', 'aura', 'mare', 'narberal', 'solution', 'lupusregina', 'yuri', 'entoma', 'cz',
+        'tanya', 'visha', 'mary',
+        'tohru', 'kanna', 'lucoa', 'elma', 'ilulu',
+        'chizuru', 'ruka', 'sumi', 'mami',
+        'nagatoro', 'gamo', 'yoshi',
+        'komi', 'najimi', 'yamai', 'agari',
+        'uzaki', 'hana', 'ami',
+        'maple', 'sally', 'kaede', 'risa', 'may', 'yui', 'izu',
+        'kohaku', 'ruri', 'suika', 'minami', 'nikki',
+        'emma', 'gilda', 'anna',
+        'akane', 'kana', 'ruby', 'ai',
+        'erza', 'wendy', 'levy', 'juvia', 'robin', 'tsunade', 'rukia', 'orihime',
+        'kagome', 'sango', 'integra', 'seras', 'meryl', 'milly', 'faye', 'ed',
+        'rei', 'asuka', 'misato', 'ritsuko', 'kaoru', 'megumi', 'misa', 'winry', 'riza',
+    },
+}
+
+# 語尾（キャラクター名のトークンがこれで終わり、語尾より2文字以上長い場合に一致）
+SUFFIXES = {
+    FEMALE: ('chan', 'ko', 'mi', 'na', 'ka', 'ra', 'sa', 'ri', 'ki', 'yu', 'ai', 'ei', 'rei', 'mei'),
+}
+
+TOKEN = re.compile(r'[a-z]+')
+
+GenderResult = namedtuple('GenderResult', 'label confidence ranking')
+
+
+def tokenize(text):
+    """小文字の英字トークンに分割（"1girl" -> girl、"zero_two" -> zero, two）"""
+    return TOKEN.findall(text.lower())
+
+
+def split_name(prompt):
+    """
+    Promptを (キャラクター名, 2つ目以降のタグ) に分ける
+
+    "name (series), 1girl" -> ("name ", " 1girl")。先頭タグの括弧内は作品名なので含めない
+    """
+    head, _, tags = prompt.partition(',')
+    bracket = head.find('(')
+    if bracket > 0:
+        head = head[:bracket]
+    return head, tags
+
+
+class GenderClassifier:
+    """キーワード表によるトークン単位の重み付き分類"""
+
+    def __init__(self, terms=TERMS, names=NAMES, suffixes=SUFFIXES):
+        # キーワード（複数語は空白区切り）-> [(分類, 重み)]
+        self._keywords = {}
+        # 一般語のみ（キャラクター名以外の部分で使う）
+        self._terms = {}
+        for table, weight, targets in ((terms, TERM_WEIGHT, (self._keywords, self._terms)),
+                                       (names, NAME_WEIGHT, (self._keywords,))):
+            for label, keywords in table.items():
+                for keyword in keywords:
+                    for target in targets:
+                        target.setdefault(keyword, []).append((label, weight))
+        # 複数語のキーワードの最大語数
+        self._max_words = max(len(keyword.split()) for keyword in self._keywords)
+        # 語尾 -> [(分類, 重み)]（長い語尾から照合）
+        self._suffixes = {}
+        for label, endings in suffixes.items():
+            for ending in endings:
+                self._suffixes.setdefault(ending, []).append((label, SUFFIX_WEIGHT))
+        self._suffix_lengths = sorted({len(ending) for ending in self._suffixes}, reverse=True)
+        # トークン列 -> 点数（同じ名前の行が多いため共有）
+        self._cache = {}
+        # タグID -> トークン列 / 作品名を除いたトークン列（タグベクトルの分類用）
+        self._tag_tokens = {}
+        self._name_tokens = {}
+
+    def _score_tokens(self, tokens, keywords, factor, scores, seen):
+        for size in range(1, self._max_words + 1):
+            for start in range(len(tokens) - size + 1):
+                word = tokens[start] if size == 1 else ' '.join(tokens[start:start + size])
+                hits = keywords.get(word)
+                # 同じキーワードは1回だけ数える
+                if hits is None or word in seen:
+                    continue
+                seen.add(word)
+                for label, weight in hits:
+                    scores[label] = scores.get(label, 0.0) + weight * factor
+
+    def _score_suffixes(self, tokens, scores):
+        for token in tokens:
+            if token in self._keywords:
+                continue
+            for length in self._suffix_lengths:
+                if len(token) < length + 2:
+                    continue
+                hits = self._suffixes.get(token[-length:])
+                if hits:
+                    for label, weight in hits:
+                        scores[label] = scores.get(label, 0.0) + weight
+                    break
+
+    def scores(self, name, context=''):
+        """キャラクター名とそれ以外の文字列から {分類: 点数} を求める"""
+        return self._scores(tuple(tokenize(name)), tuple(tokenize(context)))
+
+    def _scores(self, name_tokens, context_tokens):
+        key = (name_tokens, context_tokens)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        scores = {}
+        seen = set()
+        self._score_tokens(name_tokens, self._keywords, 1.0, scores, seen)
+        self._score_tokens(context_tokens, self._terms, CONTEXT_FACTOR, scores, seen)
+        self._score_suffixes(name_tokens, scores)
+        self._cache[key] = scores
+        return scores
+
+    @staticmethod
+    def _result(scores):
+        if not scores:
+            return GenderResult(UNKNOWN, 0.0, [])
+        ranking = sorted(scores.items(), key=lambda item: (-item[1], LABELS.index(item[0])))
+        confidence = ranking[0][1] / (sum(scores.values()) + CONFIDENCE_PRIOR)
+        return GenderResult(ranking[0][0], confidence, ranking)
+
+    def classify(self, name, prompt=''):
+        """
+        小項目とPromptから GenderResult(分類, 確信度, [(分類, 点数), ...]) を返す
+
+        どのキーワードにも一致しない場合は分類 unknown・確信度 0
+        """
+        prompt_name, context = split_name(prompt)
+        return self._result(self.scores(f"{name} {prompt_name}", context))
+
+    def _tokens_of(self, tag_id, vocabulary):
+        tokens = self._tag_tokens.get(tag_id)
+        if tokens is None:
+            tokens = self._tag_tokens[tag_id] = tuple(tokenize(vocabulary.tag(tag_id)))
+        return tokens
+
+    def _name_tokens_of(self, tag_id, vocabulary):
+        tokens = self._name_tokens.get(tag_id)
+        if tokens is None:
+            tokens = self._name_tokens[tag_id] = tuple(tokenize(split_name(vocabulary.tag(tag_id))[0]))
+        return tokens
+
+    def classify_vector(self, name, vector, vocabulary=VOCABULARY):
+        """
+        小項目とPromptのタグベクトル（tag_vectors.TagVector）から GenderResult を返す
+
+        classify と同じ規則で、タグのトークン分割はタグIDごとに1回だけ行う
+        """
+        first, rest = vector.split_first()
+        name_tokens = tuple(tokenize(name))
+        for tag_id in first:
+            name_tokens += self._name_tokens_of(tag_id, vocabulary)
+        context_tokens = ()
+        for tag_id in rest:
+            context_tokens += self._tokens_of(tag_id, vocabulary)
+        return self._result(self._scores(name_tokens, context_tokens))
+
+def main():
+    """引数のPromptを分類して表示"""
+    classifier = GenderClassifier()
+    for prompt in sys.argv[1:]:
+        result = classifier.classify('', prompt)
+        ranking = ', '.join(f"{label} {score:.1f}" for label, score in result.ranking)
+        print(f"{prompt}: {result.label}（確信度 {result.confidence:.2f}）[{ranking}]")
+
+
+if __name__ == '__main__':
+    main()
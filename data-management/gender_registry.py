@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+キャラクターの性別分類レジストリ（gender_registry.tsv）の読み込みと適用
+
+作品ごとの既定の性別と、キャラクターごとの個別設定を1つのTSVで管理し、
+マスターデータの キャラクター / キャラクター(性別) 行の大項目を1回の走査で書き換える。
+何度実行しても同じ結果になるので、作品を追加したらレジストリに1行足して apply するだけでよい。
+
+    python3 gender_registry.py apply --dry-run
+    python3 gender_registry.py apply
+    python3 gender_registry.py check        # レジストリにない作品・キャラクターを表示
+"""
+
+import argparse
+import os
+from collections import Counter
+
+from backup_store import backup_file
+from master_store import MASTER_FILE, MasterStore
+from run_report import RunReport, add_arguments
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REGISTRY_FILE = os.path.join(BASE_DIR, 'gender_registry.tsv')
+
+GENDERS = ('女性', '男性', '人外')
+# この作品の行は変更しない
+SKIP = 'スキップ'
+
+CHARACTER_MAJOR = 'キャラクター'
+
+
+def character_major(gender):
+    """性別から大項目名を返す（例: 女性 -> キャラクター(女性)）"""
+    return f"{CHARACTER_MAJOR}({gender})"
+
+
+def is_character_major(major):
+    """キャラクター行の大項目か（未分類の キャラクター を含む）"""
+    return major == CHARACTER_MAJOR or (
+        major.startswith(CHARACTER_MAJOR + '(') and major.endswith(')'))
+
+
+class GenderRegistry:
+    """作品 -> 既定の性別 と (作品, キャラクター) -> 性別 の対応"""
+
+    def __init__(self, series=None, characters=None):
+        self.series = dict(series or {})
+        self.characters = dict(characters or {})
+
+    @classmethod
+    def load(cls, path=REGISTRY_FILE):
+        """レジストリTSV（作品<TAB>キャラクター<TAB>性別、# で始まる行はコメント）を読み込む"""
+        registry = cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.rstrip('\r\n')
+                if not line or line.startswith('#'):
+                    continue
+                parts = line.split('\t')
+                if len(parts) != 3:
+                    raise ValueError(f"{os.path.basename(path)}:{line_num}: 3列のTSVではありません: {line}")
+                series, character, gender = parts
+                if gender not in GENDERS and not (gender == SKIP and not character):
+                    raise ValueError(f"{os.path.basename(path)}:{line_num}: 不明な性別です: {gender}")
+                if character:
+                    registry.characters[(series, character)] = gender
+                else:
+                    registry.series[series] = gender
+        return registry
+
+    def gender_of(self, series, character, default=None):
+        """
+        キャラクターの性別を返す
+
+        個別設定 -> 作品の既定 -> default の順に引く。作品が スキップ の場合と、
+        どこにも見つからない場合は None
+        """
+        gender = self.characters.get((series, character))
+        if gender is not None:
+            return gender
+        gender = self.series.get(series, default)
+        return None if gender == SKIP else gender
+
+
+def apply_registry(store, registry, default=None):
+    """
+    レジストリに従ってキャラクター行の大項目を書き換える
+
+    (変更した行の (行ID, 変更前の大項目) リスト, 作品ごとの未登録行数 Counter) を返す
+    """
+    majors = store.majors
+    middles = store.middles
+    smalls = store.smalls
+    changed = []
+    unmapped = Counter()
+
+    for row_id in store.ids():
+        major = majors[row_id]
+        if not is_character_major(major):
+            continue
+        series = middles[row_id]
+        gender = registry.gender_of(series, smalls[row_id], default)
+        if gender is None:
+            if series not in registry.series:
+                unmapped[series] += 1
+            continue
+        new_major = character_major(gender)
+        if new_major != major:
+            store.update(row_id, major=new_major)
+            changed.append((row_id, major))
+
+    return changed, unmapped
+
+
+def check_registry(store, registry):
+    """マスターデータにない作品・キャラクターの登録と、未登録の作品を表示"""
+    series_seen = set()
+    characters_seen = set()
+    for row_id in store.ids():
+        if is_character_major(store.majors[row_id]):
+            series_seen.add(store.middles[row_id])
+            characters_seen.add((store.middles[row_id], store.smalls[row_id]))
+
+    for series in sorted(series_seen - set(registry.series)):
+        print(f"未登録の作品: {series}")
+    for series, character in sorted(set(registry.characters) - characters_seen):
+        print(f"マスターデータにないキャラクター: {series} / {character}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='キャラクターの性別分類レジストリ')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    apply_parser = subparsers.add_parser('apply', help='レジストリの分類をマスターデータに反映')
+    apply_parser.add_argument('--default', choices=GENDERS,
+                              help='レジストリにない作品に使う性別（省略時は変更しない）')
+    apply_parser.add_argument('--dry-run', action='store_true', help='変更内容を表示するだけで書き込まない')
+    apply_parser.add_argument('--no-backup', action='store_true', help='処理前のバックアップを作成しない')
+
+    add_arguments(apply_parser)
+
+    subparsers.add_parser('check', help='レジストリとマスターデータの食い違いを表示')
+
+    args = parser.parse_args()
+    registry = GenderRegistry.load()
+    store = MasterStore.load(MASTER_FILE)
+
+    if args.command == 'check':
+        check_registry(store, registry)
+        return
+
+    # --dry-run は変更内容の確認が目的なので、行ごとの変更を常に表示する
+    args.verbose = args.verbose or args.dry_run
+    report = RunReport.from_args('gender_registry', args)
+    with report.stage('apply'):
+        changed, unmapped = apply_registry(store, registry, args.default)
+    report.count('changed', len(changed))
+    report.count('unmapped_series', len(unmapped))
+    for row_id, before in changed:
+        major, middle, small, _ = store.row(row_id)
+        report.detail(f"{middle} / {small}: {before} -> {major}")
+    for series, count in sorted(unmapped.items()):
+        print(f"レジストリ未登録（変更なし）: {series}（{count}行）")
+    print(f"\n変更 {len(changed)} 行 / 未登録の作品 {len(unmapped)} 件")
+
+    if not args.dry_run and changed:
+        if not args.no_backup:
+            with report.stage('backup'):
+                snapshot_id = backup_file(MASTER_FILE, 'before_gender_registry')
+            print(f"バックアップ作成: {snapshot_id}")
+        with report.stage('write'):
+            store.commit()
+        print("マスターデータ.tsvを更新しました")
+    report.finish(MASTER_FILE)
+
+
+if __name__ == '__main__':
+    main()
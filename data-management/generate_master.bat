@@ -12,7 +12,7 @@ if errorlevel 1 (
 )
 
 echo Pythonスクリプトを実行中...
-python "%~dp0generate_master.py"
+python "%~dp0pgdata.py" generate %*
 
 if errorlevel 1 (
     echo エラー: スクリプトの実行に失敗しました
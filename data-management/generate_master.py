@@ -4,137 +4,419 @@
 TSVファイルからdefault-master.jsを生成するスクリプト
 """
 
-import csv
+import argparse
+import hashlib
 import json
 import os
 from datetime import datetime
-from collections import OrderedDict
 
-def tsv_to_js(tsv_file, js_file):
+from backup_store import backup_file
+from master_delta import DELTA_DIR, current_release, read_shard_rows, update_release
+from master_store import BASE_DIR, MASTER_FILE, REPO_DIR, MasterStore
+from run_report import RunReport, add_arguments
+from search_index import build_search_index
+
+# default-master.jsのデータ形式バージョン
+# 2: 行ごとのオブジェクト形式 / 3: 文字列テーブル + 行タプルのコンパクト形式
+LEGACY_VERSION = 2
+COMPACT_VERSION = 3
+
+JS_FOOTER = (
+    '\n'
+    '// 互換性のためのエクスポート\n'
+    'if (typeof module !== "undefined" && module.exports) {\n'
+    '  module.exports = defaultMaster;\n'
+    '}\n'
+)
+
+OUTPUT_FILE = os.path.join(REPO_DIR, 'assets', 'master', 'default-master.js')
+
+def _dumps(value):
+    """JS出力用のJSON文字列（日本語はそのまま、区切りは最小）"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+def _release_line(release):
+    """リリース番号の行（差分パッケージの適用元の判定に使う）"""
+    return '' if release is None else f'  release: {release},\n'
+
+def build_legacy_js(store, release=None):
+    """従来形式（行ごとに"0".."4"キーのオブジェクト）のJSソースを生成"""
+    parts = ['let defaultMaster = {\n', f'  version: {LEGACY_VERSION},\n', _release_line(release), '  data: [\n']
+    rows = []
+    for major_category, minor_category, small, prompt in store:
+        rows.append(
+            '  {\n'
+            f'    "0": {json.dumps(major_category, ensure_ascii=False)},\n'
+            f'    "1": {json.dumps(minor_category, ensure_ascii=False)},\n'
+            f'    "2": {json.dumps(small, ensure_ascii=False)},\n'
+            f'    "3": {json.dumps(prompt, ensure_ascii=False)},\n'
+            '    "4": ""\n'
+            '  }'
+        )
+    parts.append(',\n'.join(rows))
+    parts.append('\n  ]\n};\n')
+    parts.append(JS_FOOTER)
+    return ''.join(parts)
+
+def build_compact_js(store, release=None):
+    """
+    コンパクト形式のJSソースを生成
+
+    大項目・中項目は strings テーブルに一度だけ出力し、
+    各行は [大項目ID, 中項目ID, 小項目, Prompt] のタプルで表す
+    """
+    strings = []
+    string_ids = {}
+    rows = []
+    for major_category, minor_category, small, prompt in store:
+        major_id = string_ids.get(major_category)
+        if major_id is None:
+            major_id = string_ids[major_category] = len(strings)
+            strings.append(major_category)
+        minor_id = string_ids.get(minor_category)
+        if minor_id is None:
+            minor_id = string_ids[minor_category] = len(strings)
+            strings.append(minor_category)
+        rows.append(_dumps([major_id, minor_id, small, prompt]))
+
+    parts = [
+        'let defaultMaster = {\n',
+        f'  version: {COMPACT_VERSION},\n',
+        _release_line(release),
+        '  format: "compact",\n',
+        f'  strings: {_dumps(strings)},\n',
+        '  data: [\n',
+        ',\n'.join(rows),
+        '\n  ]\n};\n',
+        JS_FOOTER,
+    ]
+    return ''.join(parts)
+
+def tsv_to_source(store, output_format='compact', release=None):
+    """出力形式に応じたdefault-master.jsの内容を生成"""
+    if output_format == 'legacy':
+        return build_legacy_js(store, release)
+    return build_compact_js(store, release)
+
+def tsv_to_js(tsv_file, js_file, store=None, output_format='compact'):
     """TSVファイルをJavaScriptファイルに変換"""
     
-    data_objects = []
-    categories = OrderedDict()  # 大項目 -> 中項目のセット
-    
-    # TSVファイルを読み込み
-    with open(tsv_file, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter='\t')
-        
-        for row in reader:
-            if len(row) >= 4:
-                major_category = row[0]  # 大項目
-                minor_category = row[1]  # 中項目
-                
-                # カテゴリ情報を記録
-                if major_category not in categories:
-                    categories[major_category] = set()
-                categories[major_category].add(minor_category)
-                
-                # 各行をJavaScriptオブジェクト形式に変換
-                obj = {
-                    "0": major_category,  # 大項目
-                    "1": minor_category,  # 中項目
-                    "2": row[2],  # 小項目
-                    "3": row[3],  # Prompt
-                    "4": ""       # 空の5番目のフィールド
-                }
-                data_objects.append(obj)
-    
-    # JavaScriptファイルとして出力
+    # 読み込み済みのストアがあればそれを使う
+    if store is None:
+        store = MasterStore.load(tsv_file)
+    
+    # JavaScriptファイルとして一括出力
     with open(js_file, 'w', encoding='utf-8') as f:
-        f.write('let defaultMaster = {\n')
-        f.write('  version: 2,\n')
-        f.write('  data: [\n')
-        
-        for i, obj in enumerate(data_objects):
-            f.write('  {\n')
-            f.write(f'    "0": {json.dumps(obj["0"], ensure_ascii=False)},\n')
-            f.write(f'    "1": {json.dumps(obj["1"], ensure_ascii=False)},\n')
-            f.write(f'    "2": {json.dumps(obj["2"], ensure_ascii=False)},\n')
-            f.write(f'    "3": {json.dumps(obj["3"], ensure_ascii=False)},\n')
-            f.write(f'    "4": {json.dumps(obj["4"], ensure_ascii=False)}\n')
-            
-            if i < len(data_objects) - 1:
-                f.write('  },\n')
-            else:
-                f.write('  }\n')
-        
-        f.write('  ]\n')
-        f.write('};\n')
-        f.write('\n')
-        f.write('// 互換性のためのエクスポート\n')
-        f.write('if (typeof module !== "undefined" && module.exports) {\n')
-        f.write('  module.exports = defaultMaster;\n')
-        f.write('}\n')
-    
-    return categories
-
-def generate_category_files(categories, base_path):
-    """カテゴリ一覧ファイルを生成"""
+        f.write(tsv_to_source(store, output_format))
     
-    # JSON形式でカテゴリ一覧を生成
+    # カテゴリ情報（大項目 -> 中項目のセット）
+    return store.categories()
+
+def build_category_json(categories):
+    """カテゴリ一覧JSON（プログラム用）の内容を生成"""
     categories_dict = {}
     for major, minors in categories.items():
         categories_dict[major] = sorted(list(minors))
-    
-    # カテゴリ一覧JSONファイル
+    return json.dumps(categories_dict, ensure_ascii=False, indent=2)
+
+def build_category_txt(categories):
+    """カテゴリ一覧テキスト（人間用）の内容を生成"""
+    lines = ['# カテゴリ一覧\n', f'生成日時: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n\n']
+    for major, minors in categories.items():
+        lines.append(f'## {major} ({len(minors)}個)\n')
+        for minor in sorted(minors):
+            lines.append(f'  - {minor}\n')
+        lines.append('\n')
+    lines.append(f'合計: {len(categories)}個の大項目\n')
+    return ''.join(lines)
+
+def generate_category_files(categories, base_path):
+    """カテゴリ一覧ファイルを生成"""
     json_file = os.path.join(base_path, 'categories.json')
     with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(categories_dict, f, ensure_ascii=False, indent=2)
+        f.write(build_category_json(categories))
     
-    # 人間が読みやすいテキストファイル
     txt_file = os.path.join(base_path, 'categories.txt')
     with open(txt_file, 'w', encoding='utf-8') as f:
-        f.write('# カテゴリ一覧\n')
-        f.write(f'生成日時: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n\n')
-        
-        for major, minors in categories.items():
-            f.write(f'## {major} ({len(minors)}個)\n')
-            for minor in sorted(minors):
-                f.write(f'  - {minor}\n')
-            f.write('\n')
-        
-        f.write(f'合計: {len(categories)}個の大項目\n')
+        f.write(build_category_txt(categories))
     
     return json_file, txt_file
 
-def main():
-    """メイン処理"""
-    input_file = '/mnt/e/Project/Extension/Prompt/data-management/マスターデータ.tsv'
-    output_file = '/mnt/e/Project/Extension/Prompt/assets/master/default-master.js'
+# ============================================
+# 大項目ごとのシャード
+# ============================================
+
+# default-master.js と同じディレクトリ配下に出力する
+SHARD_DIR = 'shards'
+SHARD_INDEX = 'index.json'
+SEARCH_INDEX_FILE = 'search-index.json'
+
+def shard_file_name(major):
+    """大項目名から安定したシャードファイル名を作る（大項目の追加・削除で他がずれない）"""
+    return f'shard-{hashlib.sha1(major.encode("utf-8")).hexdigest()[:12]}.json'
+
+def group_rows_by_major(store, categories):
+    """大項目 -> 行タプルのリスト（大項目はカテゴリ一覧の順、行はTSVの順）"""
+    rows_by_major = {major: [] for major in categories}
+    for row in store:
+        rows_by_major[row[0]].append(row)
+    return rows_by_major
+
+def rows_in_shard_order(store, categories):
+    """シャードを index.json の順に連結したときの行の並び（検索インデックスの行ID順）"""
+    for rows in group_rows_by_major(store, categories).values():
+        yield from rows
+
+def build_shards(store, categories):
+    """
+    大項目ごとのシャードとインデックスを生成
+
+    シャードは {"major", "strings": 中項目テーブル, "data": [[中項目ID, 小項目, Prompt], ...]}、
+    インデックスは大項目ごとのファイル名・件数・中項目一覧と、全シャードの内容から求めた build を持つ
+    （検索インデックスも同じ build を持ち、拡張機能は一致する場合だけ検索インデックスを使う）。
+    戻り値は (ファイル名 -> 内容 の辞書（インデックスを含む）, build)
+    """
+    rows_by_major = group_rows_by_major(store, categories)
+
+    files = {}
+    entries = []
+    for major, minors in categories.items():
+        middles = sorted(minors)
+        middle_ids = {middle: i for i, middle in enumerate(middles)}
+        rows = rows_by_major[major]
+        file_name = shard_file_name(major)
+        files[file_name] = (
+            '{"major":' + _dumps(major) + ',"strings":' + _dumps(middles) + ',"data":[\n'
+            + ',\n'.join(_dumps([middle_ids[middle], small, prompt]) for _, middle, small, prompt in rows)
+            + '\n]}\n'
+        )
+        entries.append({'major': major, 'file': file_name, 'count': len(rows), 'middles': middles})
+
+    build = content_hash(''.join(files.values()))[:16]
+    files[SHARD_INDEX] = (
+        f'{{"version":{COMPACT_VERSION},"format":"shards","build":"{build}","total":{len(store)},"shards":[\n'
+        + ',\n'.join(_dumps(entry) for entry in entries)
+        + '\n]}\n'
+    )
+    return files, build
+
+# ============================================
+# 差分ビルド用マニフェスト
+# ============================================
+
+# 出力ロジックを変更したら上げる（全成果物が再生成される）
+GENERATOR_VERSION = 5
+
+MANIFEST_FILE = '.generate_master_manifest.json'
+
+def content_hash(data):
+    """文字列またはバイト列のSHA-256"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+def file_hash(path):
+    """ファイル内容のSHA-256（存在しなければNone）"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class BuildManifest:
+    """入力ハッシュ・生成器バージョン・成果物ハッシュを記録するマニフェスト"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {'generator_version': GENERATOR_VERSION, 'inputs': {}, 'outputs': {}, 'paths': {}}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            # 生成器バージョンが変わった場合は記録を破棄して全再生成
+            if loaded.get('generator_version') == GENERATOR_VERSION:
+                self.data = loaded
+
+    def is_fresh(self, name, path, input_key):
+        """成果物の入力が前回と同じで、ファイルも前回出力のままか"""
+        return (self.data['inputs'].get(name) == input_key
+                and self.data['outputs'].get(name) is not None
+                and self.data['outputs'][name] == file_hash(path))
+
+    def all_fresh(self):
+        """記録済みの成果物がすべて前回出力のまま残っているか"""
+        outputs = self.data['outputs']
+        return bool(outputs) and all(
+            outputs[name] == file_hash(path) for name, path in self.data['paths'].items())
+
+    def record(self, name, path, input_key, output_hash):
+        self.data['inputs'][name] = input_key
+        self.data['outputs'][name] = output_hash
+        self.data['paths'][name] = path
+
+    def forget(self, name):
+        """成果物の記録を削除し、そのパスを返す"""
+        self.data['inputs'].pop(name, None)
+        self.data['outputs'].pop(name, None)
+        return self.data['paths'].pop(name, None)
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+def write_artifact(manifest, name, path, input_key, build):
+    """
+    入力が変わった成果物だけを書き出す
+
+    build は内容文字列を返す関数で、入力が変わっていない場合は呼ばれない。
+    書き込んだ場合は True を返す。
+    """
+    if manifest.is_fresh(name, path, input_key):
+        return False
+    content = build()
+    output_hash = content_hash(content)
+    if file_hash(path) != output_hash:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    manifest.record(name, path, input_key, output_hash)
+    return True
+
+def backup_output(output_file):
+    """既存の出力ファイルを重複排除バックアップストアに保存（スナップショットIDを返す）"""
+    return backup_file(output_file, 'before_generate')
+
+def generate(input_file, output_file, data_management_path, output_format='compact', force=False,
+             report=None):
+    """
+    マスターデータから各成果物を差分生成
+
+    入力TSVと生成器バージョンが前回と同じなら何もしない。
+    戻り値は書き出した成果物名のリスト。report（RunReport）を指定すると処理段階ごとの時間を記録する。
+    """
+    report = report or RunReport('generate_master', write=False)
+    manifest = BuildManifest(os.path.join(data_management_path, MANIFEST_FILE))
+    if force:
+        manifest.data['inputs'] = {}
     
-    # バックアップファイル名を生成
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    backup_file = f'/mnt/e/Project/Extension/Prompt/assets/master/default-master_backup_{timestamp}.js'
+    with report.stage('hash'):
+        tsv_hash = file_hash(input_file)
+    json_file = os.path.join(data_management_path, 'categories.json')
+    txt_file = os.path.join(data_management_path, 'categories.txt')
     
-    # 既存ファイルのバックアップ
-    if os.path.exists(output_file):
-        print(f"既存ファイルをバックアップ: {backup_file}")
-        with open(output_file, 'r', encoding='utf-8') as src:
-            with open(backup_file, 'w', encoding='utf-8') as dst:
-                dst.write(src.read())
+    # 入力も出力形式も変わっていなければTSVを読み込まずに終了
+    # （TSVが同じならリリース番号も上がらないため、現在のリリース番号でキーを作って比べる）
+    master_dir = os.path.dirname(output_file)
+    js_key = f'{tsv_hash}:{output_format}:{current_release(master_dir)}'
+    if (manifest.data.get('tsv_hash') == tsv_hash
+            and manifest.is_fresh('default-master.js', output_file, js_key)
+            and manifest.all_fresh()):
+        print("マスターデータに変更がないため、生成をスキップしました")
+        return []
     
-    # TSVからJSファイルを生成
     print(f"TSVファイルを読み込み: {input_file}")
-    categories = tsv_to_js(input_file, output_file)
-    print(f"default-master.jsを生成: {output_file}")
+    with report.stage('load'):
+        store = MasterStore.load(input_file)
+    report.count('rows', len(store))
+    written = []
+    
+    # 前回のリリース（書き換える前のシャード）との差分パッケージ
+    shard_dir = os.path.join(master_dir, SHARD_DIR)
+    with report.stage('delta'):
+        previous_rows = read_shard_rows(shard_dir, SHARD_INDEX)
+        release, delta = update_release(store, master_dir, previous_rows, COMPACT_VERSION)
+    if delta:
+        written.append(f"{DELTA_DIR}/{delta['file']}")
+        report.count('delta_rows', delta['rows'])
+        print(f"差分パッケージを生成: リリース {delta['from']} -> {delta['to']}"
+              f"（追加 {delta['added']} / 削除 {delta['removed']} / 変更 {delta['changed']}）")
+    js_key = f'{tsv_hash}:{output_format}:{release}'
+    
+    # default-master.js（書き換える場合のみバックアップ）
+    if not manifest.is_fresh('default-master.js', output_file, js_key):
+        with report.stage('default-master.js'):
+            source = tsv_to_source(store, output_format, release)
+            if file_hash(output_file) != content_hash(source):
+                snapshot_id = backup_output(output_file)
+                if snapshot_id:
+                    print(f"既存ファイルをバックアップ: {snapshot_id}")
+            write_artifact(manifest, 'default-master.js', output_file, js_key, lambda: source)
+        written.append('default-master.js')
+        print(f"default-master.jsを生成: {output_file}")
+    
+    # カテゴリ一覧（カテゴリ構成が変わった場合のみ）
+    with report.stage('categories'):
+        categories = store.categories()
+        categories_key = content_hash(build_category_json(categories))
+        if write_artifact(manifest, 'categories.json', json_file, categories_key,
+                          lambda: build_category_json(categories)):
+            written.append('categories.json')
+            print(f"カテゴリ一覧を生成: {json_file}")
+        if write_artifact(manifest, 'categories.txt', txt_file, categories_key,
+                          lambda: build_category_txt(categories)):
+            written.append('categories.txt')
+            print(f"カテゴリ一覧を生成: {txt_file}")
     
-    # カテゴリファイルを生成
-    data_management_path = '/mnt/e/Project/Extension/Prompt/data-management'
-    json_file, txt_file = generate_category_files(categories, data_management_path)
-    print(f"カテゴリ一覧を生成: {json_file}")
-    print(f"カテゴリ一覧を生成: {txt_file}")
+    # 大項目ごとのシャード（内容が変わったシャードのみ）
+    os.makedirs(shard_dir, exist_ok=True)
+    with report.stage('shards'):
+        shard_files, build = build_shards(store, categories)
+        for file_name, content in shard_files.items():
+            name = f'{SHARD_DIR}/{file_name}'
+            if write_artifact(manifest, name, os.path.join(shard_dir, file_name),
+                              content_hash(content), lambda: content):
+                written.append(name)
+                report.detail(f"シャードを更新: {file_name}")
     
-    # 統計情報を表示
-    with open(input_file, 'r', encoding='utf-8') as f:
-        line_count = sum(1 for line in f)
+    # 大項目がなくなったシャードを削除
+    for name in [n for n in manifest.data['paths'] if n.startswith(f'{SHARD_DIR}/')]:
+        if name.split('/', 1)[1] not in shard_files:
+            stale_path = manifest.forget(name)
+            if stale_path and os.path.exists(stale_path):
+                os.remove(stale_path)
     
+    shard_count = len([n for n in written if n.startswith(f'{SHARD_DIR}/')])
+    if shard_count:
+        print(f"シャードを生成: {shard_dir} ({shard_count}ファイル)")
+    
+    # 検索用バイグラムインデックス（行IDはシャード順）
+    index_file = os.path.join(os.path.dirname(output_file), SEARCH_INDEX_FILE)
+    with report.stage('search-index'):
+        if write_artifact(manifest, SEARCH_INDEX_FILE, index_file, build,
+                          lambda: build_search_index(rows_in_shard_order(store, categories), COMPACT_VERSION,
+                                                     build)):
+            written.append(SEARCH_INDEX_FILE)
+            print(f"検索インデックスを生成: {index_file}")
+    
+    manifest.data['tsv_hash'] = tsv_hash
+    manifest.save()
+    report.count('written', len(written))
+    
+    # 統計情報を表示（ストアの行数を使い、TSVを再度開かない）
     total_minor_categories = sum(len(minors) for minors in categories.values())
     
     print(f"\n=== 処理完了 ===")
-    print(f"データ行数: {line_count}")
+    print(f"データ行数: {len(store)}")
     print(f"大項目数: {len(categories)}")
     print(f"中項目数: {total_minor_categories}")
+    return written
+
+def main():
+    """メイン処理"""
+    parser = argparse.ArgumentParser(description='TSVからdefault-master.jsを生成')
+    parser.add_argument('--format', choices=['compact', 'legacy'], default='compact',
+                        help='出力形式（compact: 文字列テーブル形式 / legacy: 従来のオブジェクト形式）')
+    parser.add_argument('--force', action='store_true',
+                        help='マニフェストを無視してすべて再生成')
+    parser.add_argument('--input', default=MASTER_FILE, help='入力TSV（既定: data-management/マスターデータ.tsv）')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='出力先（既定: assets/master/default-master.js）')
+    add_arguments(parser)
+    args = parser.parse_args()
+    report = RunReport.from_args('generate_master', args)
+    
+    generate(args.input, args.output, BASE_DIR, args.format, args.force, report)
+    # レポートは成果物（拡張機能に含まれる assets/）ではなくマニフェストの隣に置く
+    report.finish(os.path.join(BASE_DIR, MANIFEST_FILE))
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
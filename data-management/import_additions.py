@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+追加希望.tsv をマスターデータに取り込む一括インポート（stage1〜4 の置き換え）
+
+stage1_additions_simple.py → stage2 → stage3 → stage4 を順に実行した場合と同じ分類を、
+追加希望.tsv を一度読み込むだけのメモリ上のパイプラインで行う。
+
+- 全段階のキーワードを段階順・定義順に並べて1つのオートマトンにまとめるため、
+  「前の段階で一致しなかった行だけが次の段階に進む」動作と同じ結果になる
+- マスターデータに同じ (大項目, 中項目, 小項目, Prompt) の行があれば追加しない
+  （追加希望.tsv 内の重複も同様）
+- どの段階にも一致しなかった行は 未登録項目.tsv に移す
+- マスターデータ・追加希望.tsv・未登録項目.tsv はすべて一時ファイルに書き終えてから
+  まとめて置き換えるため、途中で失敗しても中途半端な状態にならない
+"""
+
+import argparse
+import bisect
+import os
+
+from backup_store import backup_file
+from keyword_classifier import KeywordClassifier
+from master_store import BASE_DIR, MASTER_FILE, MasterStore
+from run_report import RunReport, add_arguments
+from stage1_additions_simple import ACTION_KEYWORDS
+from stage2_additions import EXPRESSION_CLOTHING_KEYWORDS
+from stage3_additions import ADULT_SITUATION_KEYWORDS
+from stage4_additions import OTHER_KEYWORDS
+
+WISH_FILE = os.path.join(BASE_DIR, '追加希望.tsv')
+UNREGISTERED_FILE = os.path.join(BASE_DIR, '未登録項目.tsv')
+
+# (段階名, キーワード辞書) の適用順
+STAGES = [
+    ('第1段階（動作・ポーズ）', ACTION_KEYWORDS),
+    ('第2段階（表情・服装）', EXPRESSION_CLOTHING_KEYWORDS),
+    ('第3段階（成人向け・シチュエーション）', ADULT_SITUATION_KEYWORDS),
+    ('第4段階（その他・修正）', OTHER_KEYWORDS),
+]
+
+
+def parse_wish_line(line):
+    """
+    追加希望.tsv の1行から (小項目, Prompt) を取り出す（空行・1列の行はNone）
+
+    4列以上: 大項目, 中項目, 小項目, Prompt / 3列: 中項目, 小項目, Prompt / 2列: 小項目, Prompt
+    """
+    line = line.strip()
+    if not line:
+        return None
+    parts = line.split('\t')
+    if len(parts) >= 4:
+        return parts[2], parts[3]
+    if len(parts) >= 2:
+        return parts[-2], parts[-1]
+    return None
+
+
+class StagedClassifier:
+    """全段階のルールを1つにまとめ、一致したルールの段階も返す分類器"""
+
+    def __init__(self, stages=STAGES):
+        self.names = [name for name, _ in stages]
+        self.offsets = []
+        rules = []
+        for _, keywords in stages:
+            self.offsets.append(len(rules))
+            rules.extend(keywords.items())
+        self.classifier = KeywordClassifier(rules)
+
+    def classify(self, small, prompt):
+        """(段階番号, (大項目, 中項目)) を返す（どの段階にも一致しなければNone）"""
+        rule_id = self.classifier.best_rule(small, prompt)
+        if rule_id is None:
+            return None
+        stage = bisect.bisect_right(self.offsets, rule_id) - 1
+        return stage, self.classifier.targets[rule_id]
+
+
+class ImportResult:
+    """インポート結果の集計"""
+
+    def __init__(self, stage_count):
+        self.added = [0] * stage_count
+        self.duplicates = 0
+        self.unregistered = []
+
+    @property
+    def total_added(self):
+        return sum(self.added)
+
+
+def import_wish_lines(store, lines, classifier=None, report=None):
+    """
+    追加希望の行を分類してストアに追加し、ImportResult を返す
+
+    ストアのハッシュインデックスで重複を判定するため、追加済みの行とも比較される。
+    report（RunReport）を指定すると、行ごとの分類結果を詳細ログに出力する
+    """
+    classifier = classifier or StagedClassifier()
+    result = ImportResult(len(classifier.names))
+
+    for line in lines:
+        parsed = parse_wish_line(line)
+        if parsed is None:
+            continue
+        small, prompt = parsed
+
+        match = classifier.classify(small, prompt)
+        if match is None:
+            result.unregistered.append(line.strip())
+            if report is not None:
+                report.detail(f"未登録: {small}")
+            continue
+
+        stage, (major, middle) = match
+        if store.contains(major, middle, small, prompt):
+            result.duplicates += 1
+            if report is not None:
+                report.detail(f"重複: {major} / {middle} / {small}")
+            continue
+        store.append(major, middle, small, prompt)
+        result.added[stage] += 1
+        if report is not None:
+            report.detail(f"追加: {major} / {middle} / {small}")
+
+    return result
+
+
+def write_lines(f, lines):
+    for line in lines:
+        f.write(line + '\n')
+
+
+def commit_import(store, result, wish_file=WISH_FILE, unregistered_file=UNREGISTERED_FILE,
+                  keep_unregistered=False):
+    """
+    マスターデータ・追加希望.tsv（クリア）・未登録項目.tsv をまとめて書き込む
+
+    keep_unregistered=True なら一致しなかった行は 未登録項目.tsv に移さず追加希望.tsv に残す
+    （次の段階で分類する stage1〜3 の個別実行）。
+    すべて一時ファイルに書き終えてから置き換え、失敗時は一時ファイルを削除する
+    """
+    outputs = [(store.path, store.write)]
+    if keep_unregistered:
+        outputs.append((wish_file, lambda f: write_lines(f, result.unregistered)))
+    else:
+        outputs.append((wish_file, lambda f: None))
+        if result.unregistered:
+            outputs.append((unregistered_file, lambda f: write_lines(f, result.unregistered)))
+
+    temp_paths = []
+    try:
+        for path, write in outputs:
+            temp_path = path + '.tmp'
+            temp_paths.append(temp_path)
+            with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+                write(f)
+    except Exception:
+        for temp_path in temp_paths:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+
+    for (path, _), temp_path in zip(outputs, temp_paths):
+        os.replace(temp_path, path)
+    store.compact()
+    store.dirty = False
+
+
+def run_stage(name, keywords, keep_unregistered=True, label='before_import'):
+    """
+    1段階分のキーワードだけで追加希望.tsvを取り込む（stage1〜4_additions.py の個別実行用）
+
+    マスターデータはストアに1回だけ読み込み、追加した行と合わせて commit_import でまとめて書き込む。
+    一致しなかった行は keep_unregistered なら追加希望.tsv に残し、そうでなければ 未登録項目.tsv に移す
+    """
+    with open(WISH_FILE, 'r', encoding='utf-8') as f:
+        wish_lines = f.readlines()
+    store = MasterStore.load(MASTER_FILE)
+
+    result = import_wish_lines(store, wish_lines, StagedClassifier([(name, keywords)]))
+    print(f"{name}: {result.total_added}個の項目を抽出しました")
+    if result.duplicates:
+        print(f"マスターデータと重複: {result.duplicates}個")
+
+    if result.total_added:
+        snapshot_id = backup_file(MASTER_FILE, label)
+        if snapshot_id:
+            print(f"バックアップ作成: {snapshot_id}")
+    commit_import(store, result, keep_unregistered=keep_unregistered)
+    if result.total_added:
+        print(f"マスターデータに{result.total_added}個の項目を追加しました")
+
+    if keep_unregistered:
+        print(f"残り項目数: {len(result.unregistered)}")
+    else:
+        if result.unregistered:
+            print(f"残り{len(result.unregistered)}個の項目を未登録項目.tsvに移動しました")
+        print("追加希望.tsvをクリアしました")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='追加希望.tsvを分類してマスターデータに取り込む')
+    parser.add_argument('file', nargs='?', default=WISH_FILE, help='追加希望のTSV（既定: 追加希望.tsv）')
+    parser.add_argument('--master', default=MASTER_FILE, help='取り込み先のマスターデータ')
+    parser.add_argument('--dry-run', action='store_true', help='分類結果を表示するだけで書き込まない')
+    parser.add_argument('--no-backup', action='store_true', help='処理前のバックアップを作成しない')
+    add_arguments(parser)
+    args = parser.parse_args()
+    report = RunReport.from_args('import_additions', args)
+
+    with report.stage('load'):
+        with open(args.file, 'r', encoding='utf-8') as f:
+            wish_lines = f.readlines()
+        store = MasterStore.load(args.master)
+    with report.stage('classify'):
+        classifier = StagedClassifier()
+        result = import_wish_lines(store, wish_lines, classifier, report)
+    report.count('wish_lines', len(wish_lines))
+    report.count('added', result.total_added)
+    report.count('duplicates', result.duplicates)
+    report.count('unregistered', len(result.unregistered))
+
+    for name, count in zip(classifier.names, result.added):
+        print(f"{name}: {count}個の項目を抽出しました")
+    print(f"マスターデータと重複: {result.duplicates}個")
+    print(f"未登録: {len(result.unregistered)}個")
+
+    if not wish_lines:
+        print("追加希望.tsvに項目がありません")
+        report.finish(args.master)
+        return
+
+    if args.dry_run:
+        print("--dry-run のため書き込みは行いません")
+        report.finish(args.master)
+        return
+
+    if not args.no_backup:
+        with report.stage('backup'):
+            snapshot_id = backup_file(args.master, 'before_import')
+        print(f"バックアップ作成: {snapshot_id}")
+
+    unregistered_file = os.path.join(os.path.dirname(os.path.abspath(args.file)), '未登録項目.tsv')
+    with report.stage('write'):
+        commit_import(store, result, args.file, unregistered_file)
+
+    print(f"マスターデータに{result.total_added}個の項目を追加しました")
+    if result.unregistered:
+        print(f"残り{len(result.unregistered)}個の項目を未登録項目.tsvに移動しました")
+    print("追加希望.tsvをクリアしました")
+    report.finish(args.master)
+
+
+if __name__ == '__main__':
+    main()
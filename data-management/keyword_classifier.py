@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+追加項目をキーワードで分類するための複数キーワード同時照合エンジン
+
+stage1〜4 の各スクリプトは「キーワード -> (大項目, 中項目)」の辞書を先頭から順に
+`keyword in 小項目 or keyword in prompt` で調べ、最初に一致したルールを採用していた。
+ここでは全キーワードを1つの Aho–Corasick オートマトンにまとめ、小項目とPromptを
+それぞれ1回走査するだけで一致したルールをすべて求める。
+
+複数のルールに一致した場合は辞書の定義順（ルール番号）が最も小さいものを採用するので、
+分類結果は従来のループと同じになる。
+"""
+
+from collections import deque
+
+
+class KeywordClassifier:
+    """キーワード -> (大項目, 中項目) のルール群をまとめて照合する分類器"""
+
+    def __init__(self, rules):
+        """
+        rules は {キーワード: (大項目, 中項目)} の辞書、または
+        (キーワード, (大項目, 中項目)) のイテラブル。並び順が優先順位になる
+        """
+        items = rules.items() if hasattr(rules, 'items') else rules
+        self.keywords = []
+        self.targets = []
+        # 空文字のキーワードはどの文字列にも含まれる（`'' in s` と同じ扱い）
+        self._always = None
+
+        # 状態ごとの遷移・失敗リンク・出力（一致するルール番号の最小値）
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [None]
+
+        for keyword, target in items:
+            rule_id = len(self.keywords)
+            self.keywords.append(keyword)
+            self.targets.append(tuple(target))
+            if not keyword:
+                if self._always is None:
+                    self._always = rule_id
+                continue
+            self._add(keyword, rule_id)
+
+        self._build_links()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    # ============================================
+    # 構築
+    # ============================================
+
+    def _add(self, keyword, rule_id):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._goto[state][char] = next_state
+            state = next_state
+        # 同じキーワードが重複していれば先に定義されたルールを残す
+        if self._output[state] is None:
+            self._output[state] = rule_id
+
+    def _build_links(self):
+        """幅優先で失敗リンクを張り、出力を失敗先と合成する"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        # 状態ごとの全出力（その状態で終わるすべてのキーワード）
+        self._all_outputs = [() if rule_id is None else (rule_id,) for rule_id in output]
+        all_outputs = self._all_outputs
+
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                target = goto[link].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+
+                inherited = output[fail[next_state]]
+                if inherited is not None and (output[next_state] is None
+                                              or inherited < output[next_state]):
+                    output[next_state] = inherited
+                if all_outputs[fail[next_state]]:
+                    all_outputs[next_state] = all_outputs[next_state] + all_outputs[fail[next_state]]
+
+    # ============================================
+    # 照合
+    # ============================================
+
+    def _step(self, state, char):
+        goto = self._goto
+        while state and char not in goto[state]:
+            state = self._fail[state]
+        return goto[state].get(char, 0)
+
+    def best_rule(self, *texts):
+        """いずれかの文字列に含まれるキーワードのうち最優先のルール番号（なければNone）"""
+        best = self._always
+        output = self._output
+        for text in texts:
+            if not text:
+                continue
+            state = 0
+            for char in text:
+                state = self._step(state, char)
+                rule_id = output[state]
+                if rule_id is not None and (best is None or rule_id < best):
+                    best = rule_id
+                    if best == 0:
+                        return 0
+        return best
+
+    def classify(self, *texts):
+        """最優先ルールの (大項目, 中項目) を返す（一致しなければNone）"""
+        rule_id = self.best_rule(*texts)
+        return None if rule_id is None else self.targets[rule_id]
+
+    def matches(self, *texts):
+        """一致したすべてのルールを優先順に (キーワード, (大項目, 中項目)) で返す"""
+        found = set()
+        if self._always is not None:
+            found.update(i for i, keyword in enumerate(self.keywords) if not keyword)
+        all_outputs = self._all_outputs
+        for text in texts:
+            if not text:
+                continue
+            state = 0
+            for char in text:
+                state = self._step(state, char)
+                found.update(all_outputs[state])
+        return [(self.keywords[i], self.targets[i]) for i in sorted(found)]
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+マスターデータのSQLiteバックエンド（任意）
+
+正本は マスターデータ.tsv のまま変えず、その内容を master_data.sqlite に取り込んで
+インデックス付きの検索・重複チェック・分類表との結合に使う。
+
+- rows: 1行1レコード（大項目・中項目・小項目・Prompt、Promptのハッシュ、元の行順）。
+  大項目・中項目・Promptのハッシュにインデックスを張る
+- rows_fts: 小項目・Prompt の FTS5 全文検索（trigram トークナイザで日本語も部分一致で引ける）
+- meta: 取り込んだTSVのハッシュ（TSVが変わったら sync で取り込み直す）
+
+取り込みと書き出しは可逆で、書き出したTSVは元のファイルとバイト単位で一致する
+（MasterStore の書き込みと同じ形式にならない行は元の行をそのまま保存する）。
+
+    python3 master_db.py import
+    python3 master_db.py search 笑顔
+    python3 master_db.py duplicates
+    python3 master_db.py export /tmp/マスターデータ.tsv
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import os
+import sqlite3
+import sys
+
+from master_store import BASE_DIR, MASTER_FILE, MasterStore
+
+DB_FILE = os.path.join(BASE_DIR, 'master_data.sqlite')
+SCHEMA_VERSION = 1
+
+# FTS5 の trigram は3文字以上の語だけを索引で引ける（短い語は LIKE で全件を調べる）
+TRIGRAM = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    major TEXT,
+    middle TEXT,
+    small TEXT,
+    prompt TEXT,
+    prompt_hash INTEGER,
+    -- 5列目以降（タブ区切りのまま）
+    extra TEXT,
+    -- MasterStore の書き込み形式で再現できない行の元の文字列
+    raw TEXT
+);
+CREATE INDEX IF NOT EXISTS rows_major ON rows (major, middle);
+CREATE INDEX IF NOT EXISTS rows_middle ON rows (middle);
+CREATE INDEX IF NOT EXISTS rows_prompt_hash ON rows (prompt_hash);
+CREATE INDEX IF NOT EXISTS rows_position ON rows (position);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS rows_fts USING fts5(
+    small, prompt, content='rows', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS rows_ai AFTER INSERT ON rows BEGIN
+    INSERT INTO rows_fts (rowid, small, prompt) VALUES (new.id, new.small, new.prompt);
+END;
+CREATE TRIGGER IF NOT EXISTS rows_ad AFTER DELETE ON rows BEGIN
+    INSERT INTO rows_fts (rows_fts, rowid, small, prompt) VALUES ('delete', old.id, old.small, old.prompt);
+END;
+CREATE TRIGGER IF NOT EXISTS rows_au AFTER UPDATE ON rows BEGIN
+    INSERT INTO rows_fts (rows_fts, rowid, small, prompt) VALUES ('delete', old.id, old.small, old.prompt);
+    INSERT INTO rows_fts (rowid, small, prompt) VALUES (new.id, new.small, new.prompt);
+END;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 4列の行の列名
+COLUMNS = 'major, middle, small, prompt'
+
+
+def prompt_hash(prompt):
+    """Prompt の安定したハッシュ（SQLiteの INTEGER に収まる符号付き64bit）"""
+    digest = hashlib.blake2b(prompt.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def render_line(fields):
+    """MasterStore.write と同じ形式の1行（改行なし）"""
+    buffer = io.StringIO()
+    csv.writer(buffer, delimiter='\t', lineterminator='\n').writerow(fields)
+    return buffer.getvalue()[:-1]
+
+
+def parse_line(line):
+    """TSVの1行を (列のリスト, 元の行を保存する必要があるか) に分ける"""
+    fields = next(csv.reader([line], delimiter='\t'), [])
+    return fields, render_line(fields) != line
+
+
+class MasterDB:
+    """マスターデータのSQLiteコピー"""
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _meta(self, key):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    # ============================================
+    # 取り込み・書き出し
+    # ============================================
+
+    def import_tsv(self, tsv_path=MASTER_FILE):
+        """TSVの内容で置き換え、取り込んだ行数を返す（書き出して元と一致しなければ ValueError）"""
+        with open(tsv_path, 'rb') as f:
+            data = f.read()
+        text = data.decode('utf-8')
+        lines = text.split('\n')
+        final_newline = lines[-1] == ''
+        if final_newline:
+            lines.pop()
+
+        records = []
+        for position, line in enumerate(lines):
+            fields, needs_raw = parse_line(line)
+            major, middle, small, prompt = (fields + [None] * 4)[:4]
+            extra = '\t'.join(fields[4:]) if len(fields) > 4 else None
+            records.append((position, major, middle, small, prompt,
+                            prompt_hash(prompt) if prompt is not None else None,
+                            extra, line if needs_raw or len(fields) < 4 else None))
+
+        with self.conn:
+            self.conn.execute('DELETE FROM rows')
+            self.conn.executemany(
+                f'INSERT INTO rows (position, {COLUMNS}, prompt_hash, extra, raw) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                records)
+            source_hash = hashlib.sha256(data).hexdigest()
+            self.conn.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', [
+                ('schema_version', str(SCHEMA_VERSION)),
+                ('source', os.path.abspath(tsv_path)),
+                ('source_hash', source_hash),
+                ('final_newline', '1' if final_newline else '0'),
+            ])
+            if hashlib.sha256(self.export_text().encode('utf-8')).hexdigest() != source_hash:
+                raise ValueError(f"{os.path.basename(tsv_path)} を可逆に取り込めませんでした")
+        return len(records)
+
+    def export_text(self):
+        """取り込んだTSVと同じ内容の文字列"""
+        lines = []
+        for major, middle, small, prompt, extra, raw in self.conn.execute(
+                f'SELECT {COLUMNS}, extra, raw FROM rows ORDER BY position'):
+            if raw is not None:
+                lines.append(raw)
+                continue
+            fields = [major, middle, small, prompt]
+            if extra is not None:
+                fields.extend(extra.split('\t'))
+            lines.append(render_line(fields))
+        text = '\n'.join(lines)
+        if lines and self._meta('final_newline') != '0':
+            text += '\n'
+        return text
+
+    def export_tsv(self, path):
+        """一時ファイル経由でTSVに書き出す"""
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(self.export_text())
+        os.replace(temp_path, path)
+
+    def is_fresh(self, tsv_path=MASTER_FILE):
+        """TSVが前回取り込んだときから変わっていないか"""
+        return os.path.exists(tsv_path) and self._meta('source_hash') == file_hash(tsv_path)
+
+    def sync(self, tsv_path=MASTER_FILE):
+        """TSVが変わっていれば取り込み直す（取り込み直した場合True）"""
+        if self.is_fresh(tsv_path):
+            return False
+        self.import_tsv(tsv_path)
+        return True
+
+    # ============================================
+    # 参照
+    # ============================================
+
+    def rows(self):
+        """4列以上の行を (大項目, 中項目, 小項目, Prompt) で元の順に返す"""
+        return self.conn.execute(
+            f'SELECT {COLUMNS} FROM rows WHERE prompt IS NOT NULL ORDER BY position')
+
+    def load_store(self, tsv_path=MASTER_FILE):
+        """MasterStore を作成（書き込み先は tsv_path）"""
+        store = MasterStore(tsv_path)
+        store.extend(self.rows())
+        store.dirty = False
+        return store
+
+    def find(self, major, middle, small):
+        """(大項目, 中項目, 小項目) が一致する行"""
+        return self.conn.execute(
+            f'SELECT {COLUMNS} FROM rows WHERE major = ? AND middle = ? AND small = ? ORDER BY position',
+            (major, middle, small)).fetchall()
+
+    def find_prompt(self, prompt):
+        """Promptが一致する行（Promptのハッシュのインデックスで引く）"""
+        return self.conn.execute(
+            f'SELECT {COLUMNS} FROM rows WHERE prompt_hash = ? AND prompt = ? ORDER BY position',
+            (prompt_hash(prompt), prompt)).fetchall()
+
+    def contains(self, major, middle, small, prompt=None):
+        """同じキー（Prompt指定時はPromptも一致）の行が存在するか"""
+        if prompt is None:
+            return bool(self.find(major, middle, small))
+        return self.conn.execute(
+            'SELECT 1 FROM rows WHERE prompt_hash = ? AND major = ? AND middle = ? AND small = ? AND prompt = ?',
+            (prompt_hash(prompt), major, middle, small, prompt)).fetchone() is not None
+
+    def query(self, major=None, middle=None):
+        """大項目・中項目で絞り込んだ行"""
+        conditions = ['prompt IS NOT NULL']
+        params = []
+        if major is not None:
+            conditions.append('major = ?')
+            params.append(major)
+        if middle is not None:
+            conditions.append('middle = ?')
+            params.append(middle)
+        return self.conn.execute(
+            f'SELECT {COLUMNS} FROM rows WHERE {" AND ".join(conditions)} ORDER BY position',
+            params).fetchall()
+
+    def search(self, text, limit=50):
+        """
+        小項目・Promptに text を含む行（大文字小文字は区別しない）
+
+        3文字以上は FTS5 の trigram 索引で引き、それより短い語は LIKE で全行を調べる
+        """
+        if len(text) >= TRIGRAM:
+            phrase = '"' + text.replace('"', '""') + '"'
+            return self.conn.execute(
+                f'SELECT {", ".join("rows." + c for c in COLUMNS.split(", "))} FROM rows_fts '
+                'JOIN rows ON rows.id = rows_fts.rowid WHERE rows_fts MATCH ? ORDER BY rows.position LIMIT ?',
+                (phrase, limit)).fetchall()
+        pattern = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        return self.conn.execute(
+            f"SELECT {COLUMNS} FROM rows WHERE small LIKE ? ESCAPE '\\' OR prompt LIKE ? ESCAPE '\\' "
+            'ORDER BY position LIMIT ?', (pattern, pattern, limit)).fetchall()
+
+    def exact_duplicates(self, across_categories=False):
+        """
+        同じPromptの行のグループ（行のリストのリスト）
+
+        既定では同じ (大項目, 中項目) の中での重複、across_categories=True ならカテゴリをまたいだ重複も返す
+        """
+        scope = '' if across_categories else ', major, middle'
+        groups = []
+        for key in self.conn.execute(
+                f'SELECT prompt_hash{scope} FROM rows WHERE prompt IS NOT NULL '
+                f'GROUP BY prompt_hash{scope} HAVING COUNT(*) > 1').fetchall():
+            condition = 'prompt_hash = ?' + ('' if across_categories else ' AND major = ? AND middle = ?')
+            rows = self.conn.execute(
+                f'SELECT {COLUMNS} FROM rows WHERE {condition} ORDER BY position', key).fetchall()
+            # ハッシュの衝突を除く
+            by_prompt = {}
+            for row in rows:
+                by_prompt.setdefault(row[3], []).append(row)
+            groups.extend(group for group in by_prompt.values() if len(group) > 1)
+        return groups
+
+    def registry_mismatches(self, registry):
+        """
+        性別レジストリと大項目が食い違うキャラクター行を (中項目, 小項目, 現在の大項目, レジストリの大項目) で返す
+
+        レジストリを一時テーブルに入れ、個別設定 -> 作品の既定 の順に結合する
+        """
+        from gender_registry import SKIP, character_major, is_character_major
+
+        self.conn.create_function('is_character_major', 1, is_character_major, deterministic=True)
+        self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS registry (series TEXT, character TEXT, major TEXT)')
+        self.conn.execute('DELETE FROM registry')
+        entries = [(series, '', None if gender == SKIP else character_major(gender))
+                   for series, gender in registry.series.items()]
+        entries += [(series, character, character_major(gender))
+                    for (series, character), gender in registry.characters.items()]
+        self.conn.executemany('INSERT INTO registry VALUES (?, ?, ?)', entries)
+        return self.conn.execute("""
+            SELECT rows.middle, rows.small, rows.major, COALESCE(own.major, series.major) AS expected
+            FROM rows
+            LEFT JOIN registry AS own ON own.series = rows.middle AND own.character = rows.small
+            LEFT JOIN registry AS series ON series.series = rows.middle AND series.character = ''
+            WHERE rows.prompt IS NOT NULL AND is_character_major(rows.major)
+              AND expected IS NOT NULL AND expected != rows.major
+            ORDER BY rows.position
+        """).fetchall()
+
+    def count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM rows WHERE prompt IS NOT NULL').fetchone()[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='マスターデータのSQLiteバックエンド')
+    parser.add_argument('--db', default=DB_FILE, help='データベースファイル')
+    parser.add_argument('--master', default=MASTER_FILE, help='マスターデータ（TSV）')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('import', help='TSVを取り込む（変更がなければ何もしない）')
+    export_parser = subparsers.add_parser('export', help='TSVに書き出す')
+    export_parser.add_argument('output', help='書き出し先')
+    search_parser = subparsers.add_parser('search', help='小項目・Promptの部分一致検索')
+    search_parser.add_argument('text')
+    search_parser.add_argument('--limit', type=int, default=50)
+    duplicates_parser = subparsers.add_parser('duplicates', help='同じPromptの行を表示')
+    duplicates_parser.add_argument('--across-categories', action='store_true', help='カテゴリをまたいだ重複も表示')
+    subparsers.add_parser('registry', help='性別レジストリと大項目が食い違う行を表示')
+
+    args = parser.parse_args(argv)
+    with MasterDB(args.db) as db:
+        if args.command == 'import':
+            if db.sync(args.master):
+                print(f"取り込みました: {db.count()}行 -> {args.db}")
+            else:
+                print("マスターデータに変更がないため、取り込みをスキップしました")
+            return
+
+        if args.command == 'export':
+            db.export_tsv(args.output)
+            print(f"書き出しました: {args.output}")
+            return
+
+        if db.sync(args.master):
+            print(f"マスターデータを取り込み直しました（{db.count()}行）", file=sys.stderr)
+        if args.command == 'search':
+            for major, middle, small, prompt in db.search(args.text, args.limit):
+                print(f"{major} / {middle} / {small}: {prompt[:100]}")
+        elif args.command == 'duplicates':
+            groups = db.exact_duplicates(args.across_categories)
+            for rows in groups:
+                print(f"\n{rows[0][3][:100]}")
+                for major, middle, small, _ in rows:
+                    print(f"  {major} / {middle} / {small}")
+            print(f"\n同じPromptのグループ: {len(groups)}件")
+        elif args.command == 'registry':
+            from gender_registry import GenderRegistry
+            mismatches = db.registry_mismatches(GenderRegistry.load())
+            for middle, small, major, expected in mismatches:
+                print(f"{middle} / {small}: {major} -> {expected}")
+            print(f"食い違い: {len(mismatches)}件")
+
+
+if __name__ == '__main__':
+    main()
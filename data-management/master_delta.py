@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+マスターデータのリリース間の差分パッケージ
+
+generate_master.py がマスターデータを生成し直すたびに、前回のリリース（既存のシャード）との差分を
+(大項目, 中項目, 小項目) をキーに求め、assets/master/delta/ に出力する。
+拡張機能はストレージに保存済みの行（インポートしたマスターなど）にこの差分を順に当て、
+全行を作り直さずに最新リリースに更新する。
+
+- index.json: {"format": "delta-index", "release": 最新のリリース番号, "deltas": [{"from", "to", "file", ...}]}
+- delta-<from>-<to>.json: {"format": "delta", "from", "to", "added", "removed", "changed",
+  "rows": [[大項目, 中項目, 小項目, [新しいPrompt, ...], [前のPrompt, ...]], ...]}
+
+rows はPromptの並びが変わったキーだけを持ち、リストはそのキーの新旧リリースでの全Prompt
+（同じキーの行が複数ある場合はTSVの順、空なら追加または削除）。
+拡張機能は保存済みの行が前のPromptと一致するキーだけを書き換え、利用者が編集した行は残す。
+"""
+
+import json
+import os
+
+DELTA_DIR = 'delta'
+DELTA_INDEX = 'index.json'
+
+# 残しておく差分の数（これより古いリリースの拡張機能は全行を読み込み直す）
+DELTA_HISTORY = 20
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def delta_file_name(from_release, to_release):
+    return f'delta-{from_release}-{to_release}.json'
+
+
+def read_shard_rows(shard_dir, index_name='index.json'):
+    """
+    既存のシャードから前回のリリースの行を (大項目, 中項目, 小項目, Prompt) で返す
+
+    シャードがない（初回の生成）場合は None
+    """
+    index_path = os.path.join(shard_dir, index_name)
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    rows = []
+    for entry in index['shards']:
+        with open(os.path.join(shard_dir, entry['file']), 'r', encoding='utf-8') as f:
+            shard = json.load(f)
+        major = shard['major']
+        middles = shard['strings']
+        rows.extend((major, middles[middle_id], small, prompt) for middle_id, small, prompt in shard['data'])
+    return rows
+
+
+def keyed_prompts(rows):
+    """(大項目, 中項目, 小項目) -> Promptのリスト（行の順）"""
+    prompts = {}
+    for major, middle, small, prompt in rows:
+        prompts.setdefault((major, middle, small), []).append(prompt)
+    return prompts
+
+
+def diff_releases(old_rows, new_rows):
+    """
+    2つのリリースのキーごとの差分
+
+    (Promptの並びが変わったキーの [大項目, 中項目, 小項目, [新しいPrompt, ...], [前のPrompt, ...]] のリスト,
+    {"added", "removed", "changed"} の行数) を返す。キーは新しいリリースの順、削除されたキーはその後
+    """
+    old = keyed_prompts(old_rows)
+    new = keyed_prompts(new_rows)
+    rows = []
+    counts = {'added': 0, 'removed': 0, 'changed': 0}
+
+    def add(key, old_prompts, new_prompts):
+        rows.append([*key, new_prompts, old_prompts])
+        shared = min(len(old_prompts), len(new_prompts))
+        counts['changed'] += sum(1 for a, b in zip(old_prompts[:shared], new_prompts[:shared]) if a != b)
+        counts['added'] += len(new_prompts) - shared
+        counts['removed'] += len(old_prompts) - shared
+
+    for key, new_prompts in new.items():
+        old_prompts = old.get(key, [])
+        if old_prompts != new_prompts:
+            add(key, old_prompts, new_prompts)
+    for key, old_prompts in old.items():
+        if key not in new:
+            add(key, old_prompts, [])
+    return rows, counts
+
+
+def load_delta_index(delta_dir):
+    """差分のインデックス（まだリリースがなければ None）"""
+    path = os.path.join(delta_dir, DELTA_INDEX)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def current_release(master_dir):
+    """配布中のリリース番号（まだリリースがなければ None）"""
+    index = load_delta_index(os.path.join(master_dir, DELTA_DIR))
+    return None if index is None else index['release']
+
+
+def build_delta_index(release, deltas, version):
+    entries = ''.join(f'\n{_dumps(entry)},' for entry in deltas).rstrip(',')
+    return (
+        f'{{"version":{version},"format":"delta-index","release":{release},"deltas":['
+        + entries + ('\n' if deltas else '') + ']}\n'
+    )
+
+
+def build_delta(from_release, to_release, rows, counts, version):
+    return (
+        f'{{"version":{version},"format":"delta","from":{from_release},"to":{to_release},'
+        f'"added":{counts["added"]},"removed":{counts["removed"]},"changed":{counts["changed"]},"rows":[\n'
+        + ',\n'.join(_dumps(row) for row in rows)
+        + '\n]}\n'
+    )
+
+
+def update_release(store, master_dir, previous_rows, version):
+    """
+    前回のリリースの行 previous_rows と比べ、変更があれば差分パッケージを書き出してリリース番号を上げる
+
+    previous_rows が None（前回の行がわからない）なら差分は作らずリリース番号もそのまま。
+    戻り値は (新しいリリース番号, 書き出した差分の情報または None)
+    """
+    delta_dir = os.path.join(master_dir, DELTA_DIR)
+    index = load_delta_index(delta_dir)
+    os.makedirs(delta_dir, exist_ok=True)
+    index_path = os.path.join(delta_dir, DELTA_INDEX)
+
+    # 初回は差分なしでリリース1とする
+    if index is None:
+        with open(index_path, 'w', encoding='utf-8') as f:
+            f.write(build_delta_index(1, [], version))
+        return 1, None
+
+    release = index['release']
+    if previous_rows is None:
+        return release, None
+
+    rows, counts = diff_releases(previous_rows, store)
+    if not rows:
+        return release, None
+
+    new_release = release + 1
+    entry = {'from': release, 'to': new_release, 'file': delta_file_name(release, new_release),
+             'rows': sum(counts.values())}
+    with open(os.path.join(delta_dir, entry['file']), 'w', encoding='utf-8') as f:
+        f.write(build_delta(release, new_release, rows, counts, version))
+
+    deltas = index['deltas'] + [entry]
+    for stale in deltas[:-DELTA_HISTORY]:
+        stale_path = os.path.join(delta_dir, stale['file'])
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+    deltas = deltas[-DELTA_HISTORY:]
+
+    with open(index_path, 'w', encoding='utf-8') as f:
+        f.write(build_delta_index(new_release, deltas, version))
+    return new_release, dict(entry, **counts)
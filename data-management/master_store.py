@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+マスターデータ.tsvをメモリ上に一度だけ読み込み、各スクリプトで共有するためのストア
+
+列ごとの配列（大項目・中項目は intern 済み）と
+(大項目, 中項目, 小項目) / Prompt のハッシュインデックスを保持し、
+query / update / commit で連続した処理をファイルI/Oなしで実行できる。
+"""
+
+import csv
+import os
+import sys
+from collections import OrderedDict
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BASE_DIR)
+MASTER_FILE = os.path.join(BASE_DIR, 'マスターデータ.tsv')
+# キャラクター整理スクリプトの入力（旧形式の非整形マスター）
+RAW_MASTER_FILE = os.path.join(REPO_DIR, '非整形マスター.tsv')
+RAW_MASTER_EDITED_FILE = os.path.join(REPO_DIR, '非整形マスター_編集済み.tsv')
+
+COLUMNS = ('大項目', '中項目', '小項目', 'Prompt')
+
+
+class MasterStore:
+    """マスターデータの列指向インメモリストア"""
+
+    def __init__(self, path=MASTER_FILE):
+        self.path = path
+        # 列ごとの配列（行IDは全列で共通）
+        self.majors = []
+        self.middles = []
+        self.smalls = []
+        self.prompts = []
+        # 削除済み行は0（commit時に詰める）
+        self.alive = bytearray()
+        # (大項目, 中項目, 小項目) -> 行IDリスト
+        self._key_index = {}
+        # Prompt -> 行IDリスト
+        self._prompt_index = {}
+        self._live_count = 0
+        # 派生列: 名前 -> (行から値を求める関数, 行ID順の値リスト)
+        self._derived = {}
+        self.dirty = False
+
+    # ============================================
+    # 読み込み
+    # ============================================
+
+    @classmethod
+    def load(cls, path=MASTER_FILE):
+        """TSVファイルを読み込んでストアを作成"""
+        store = cls(path)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                store.extend(csv.reader(f, delimiter='\t'))
+        store.dirty = False
+        return store
+
+    def replace(self, rows):
+        """全行を入れ替える（並べ替え・統合の結果を反映する場合）"""
+        path = self.path
+        self.__init__(path)
+        self.extend(rows)
+
+    def extend(self, rows):
+        """4列以上の行をまとめて追加（5列目以降は無視）"""
+        intern = sys.intern
+        for row in rows:
+            if len(row) >= 4:
+                self._append(intern(row[0]), intern(row[1]), row[2], row[3])
+        self.dirty = True
+
+    def _append(self, major, middle, small, prompt):
+        row_id = len(self.majors)
+        self.majors.append(major)
+        self.middles.append(middle)
+        self.smalls.append(small)
+        self.prompts.append(prompt)
+        self.alive.append(1)
+        self._key_index.setdefault((major, middle, small), []).append(row_id)
+        self._prompt_index.setdefault(prompt, []).append(row_id)
+        self._live_count += 1
+        for func, values in self._derived.values():
+            values.append(func((major, middle, small, prompt)))
+        return row_id
+
+    # ============================================
+    # 参照
+    # ============================================
+
+    def __len__(self):
+        return self._live_count
+
+    def __iter__(self):
+        """有効な行を (大項目, 中項目, 小項目, Prompt) のタプルで返す"""
+        for row_id in self.ids():
+            yield self.row(row_id)
+
+    def ids(self):
+        """有効な行IDを順番に返す"""
+        alive = self.alive
+        return (row_id for row_id in range(len(alive)) if alive[row_id])
+
+    def row(self, row_id):
+        """行IDに対応する (大項目, 中項目, 小項目, Prompt) を返す"""
+        return (self.majors[row_id], self.middles[row_id],
+                self.smalls[row_id], self.prompts[row_id])
+
+    def find(self, major, middle, small):
+        """(大項目, 中項目, 小項目) が一致する行IDのリスト"""
+        return list(self._key_index.get((major, middle, small), ()))
+
+    def find_prompt(self, prompt):
+        """Promptが一致する行IDのリスト"""
+        return list(self._prompt_index.get(prompt, ()))
+
+    def contains(self, major, middle, small, prompt=None):
+        """同じキー（Prompt指定時はPromptも一致）の行が存在するか"""
+        for row_id in self._key_index.get((major, middle, small), ()):
+            if prompt is None or self.prompts[row_id] == prompt:
+                return True
+        return False
+
+    def query(self, major=None, middle=None, where=None):
+        """
+        条件に一致する行IDのリストを返す
+
+        major / middle は完全一致、where は (大項目, 中項目, 小項目, Prompt) を
+        受け取って真偽値を返す関数
+        """
+        majors = self.majors
+        middles = self.middles
+        result = []
+        for row_id in self.ids():
+            if major is not None and majors[row_id] != major:
+                continue
+            if middle is not None and middles[row_id] != middle:
+                continue
+            if where is not None and not where(self.row(row_id)):
+                continue
+            result.append(row_id)
+        return result
+
+    def derived(self, name, func):
+        """
+        行から求める派生列（行ID順のリスト）を返す
+
+        初回に全行分を計算してキャッシュし、以降は追加・更新された行だけを計算し直す
+        """
+        entry = self._derived.get(name)
+        if entry is None:
+            entry = self._derived[name] = (
+                func, [func(self.row(row_id)) for row_id in range(len(self.majors))])
+        return entry[1]
+
+    def categories(self):
+        """大項目 -> 中項目セット の対応（出現順）"""
+        categories = OrderedDict()
+        for row_id in self.ids():
+            categories.setdefault(self.majors[row_id], set()).add(self.middles[row_id])
+        return categories
+
+    # ============================================
+    # 更新
+    # ============================================
+
+    def append(self, major, middle, small, prompt):
+        """行を追加して行IDを返す"""
+        self.dirty = True
+        return self._append(sys.intern(major), sys.intern(middle), small, prompt)
+
+    def update(self, row_id, major=None, middle=None, small=None, prompt=None):
+        """指定した列だけを書き換える"""
+        old_major, old_middle, old_small, old_prompt = self.row(row_id)
+        new_major = old_major if major is None else sys.intern(major)
+        new_middle = old_middle if middle is None else sys.intern(middle)
+        new_small = old_small if small is None else small
+        new_prompt = old_prompt if prompt is None else prompt
+
+        old_key = (old_major, old_middle, old_small)
+        new_key = (new_major, new_middle, new_small)
+        if old_key != new_key:
+            self._unindex(self._key_index, old_key, row_id)
+            self._key_index.setdefault(new_key, []).append(row_id)
+        if old_prompt != new_prompt:
+            self._unindex(self._prompt_index, old_prompt, row_id)
+            self._prompt_index.setdefault(new_prompt, []).append(row_id)
+
+        self.majors[row_id] = new_major
+        self.middles[row_id] = new_middle
+        self.smalls[row_id] = new_small
+        self.prompts[row_id] = new_prompt
+        for func, values in self._derived.values():
+            values[row_id] = func(self.row(row_id))
+        self.dirty = True
+
+    def delete(self, row_id):
+        """行を削除（行IDはcommitまで維持される）"""
+        if not self.alive[row_id]:
+            return
+        major, middle, small, prompt = self.row(row_id)
+        self._unindex(self._key_index, (major, middle, small), row_id)
+        self._unindex(self._prompt_index, prompt, row_id)
+        self.alive[row_id] = 0
+        self._live_count -= 1
+        self.dirty = True
+
+    @staticmethod
+    def _unindex(index, key, row_id):
+        ids = index.get(key)
+        if ids is None:
+            return
+        ids.remove(row_id)
+        if not ids:
+            del index[key]
+
+    # ============================================
+    # 書き込み
+    # ============================================
+
+    def write(self, f):
+        """有効な行をファイルオブジェクトにTSVとして書き込む"""
+        writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+        writer.writerows(self)
+
+    def to_tsv(self, path):
+        """有効な行を一時ファイル経由でアトミックに書き込む"""
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            self.write(f)
+        os.replace(temp_path, path)
+
+    def commit(self, path=None):
+        """変更をTSVに書き戻し、削除済み行を詰める"""
+        target = path or self.path
+        if not self.dirty and target == self.path:
+            return False
+        self.to_tsv(target)
+        self.compact()
+        self.dirty = False
+        return True
+
+    def compact(self):
+        """削除済み行を取り除いて行IDを振り直す"""
+        if self._live_count == len(self.alive):
+            return
+        rows = list(self)
+        self.__init__(self.path)
+        for major, middle, small, prompt in rows:
+            self._append(major, middle, small, prompt)
@@ -1,36 +1,31 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-with open('マスターデータ.tsv', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+from character_aliases import CharacterAliasIndex, resolve_character
+from character_names import get_character_name
+from master_store import MasterStore
 
-# 既存のキャラクター()系エントリを収集
-existing_characters = set()
-reproduction_characters = []
-other_lines = []
+store = MasterStore.load()
 
-for line in lines:
-    parts = line.strip().split('\t')
-    if len(parts) >= 3:
-        if parts[0].startswith('キャラクター('):
-            # 既存のキャラクター()系エントリ
-            key = (parts[1], parts[2])  # (作品名, キャラ名)
-            existing_characters.add(key)
-            other_lines.append(line)
-        elif parts[0] == 'キャラクター再現':
-            # 再現エントリを収集
-            reproduction_characters.append((parts[1], parts[2]))
-        else:
-            other_lines.append(line)
-    else:
-        other_lines.append(line)
+# 既存のキャラクター()系エントリを収集し、別名インデックスを作成
+existing_characters = {(middle, small) for major, middle, small, _ in store
+                       if major.startswith('キャラクター(')}
+aliases = CharacterAliasIndex.from_store(store)
+
+# 再現エントリを収集して削除
+reproduction_characters = []
+for row_id in store.query(major='キャラクター再現'):
+    _, series, character, prompt = store.row(row_id)
+    reproduction_characters.append((series, character, prompt))
+    store.delete(row_id)
 
 # 再現エントリから移行すべきキャラクターを特定
 to_migrate = []
-for series, character in reproduction_characters:
+for series, character, prompt in reproduction_characters:
     key = (series, character)
     if key not in existing_characters:
-        to_migrate.append(key)
+        existing_characters.add(key)
+        to_migrate.append((series, character, prompt))
 
 print(f"移行対象キャラクター: {len(to_migrate)}名")
 
@@ -59,33 +54,39 @@ def estimate_gender(series, character):
     else:
         return '女性'  # デフォルト
 
+def simple_prompt(series, character, prompt):
+    """
+    通常版のプロンプトを求める
+
+    再現プロンプトから抽出したキャラクター名（または日本語名）が既存のキャラクター行の
+    タグに対応付けられればそのタグを使い、なければ名前と作品名から生成する
+    """
+    match = resolve_character(aliases, series, character, get_character_name(series, character, prompt))
+    if match is not None:
+        return match.tag, True
+    if '(' in character:
+        # 既に作品名が含まれている場合
+        return f"{character.lower().replace(' ', '_')}", False
+    # 作品名を追加
+    series_short = series.lower().replace(' ', '_').replace('！', '').replace('!', '')
+    char_name = character.lower().replace(' ', '_')
+    return f"{char_name} ({series_short})", False
+
 # 移行エントリを生成
-migrated_lines = []
 migrated_count = 0
+matched_count = 0
 
-for series, character in to_migrate:
+for series, character, prompt in to_migrate:
     gender = estimate_gender(series, character)
-    # シンプルなプロンプト形式に変換
-    if '(' in character:
-        # 既に作品名が含まれている場合
-        prompt = f"{character.lower().replace(' ', '_')}"
-    else:
-        # 作品名を追加
-        series_short = series.lower().replace(' ', '_').replace('！', '').replace('!', '')
-        char_name = character.lower().replace(' ', '_')
-        prompt = f"{char_name} ({series_short})"
-    
-    migrated_line = f"キャラクター({gender})\t{series}\t{character}\t{prompt}\n"
-    migrated_lines.append(migrated_line)
+    simple, matched = simple_prompt(series, character, prompt)
+    store.append(f"キャラクター({gender})", series, character, simple)
     migrated_count += 1
-    print(f"移行: {character} ({gender}) - {series}")
-
-# 新しいファイルを作成（キャラクター再現を除外し、移行分を追加）
-final_lines = other_lines + migrated_lines
+    matched_count += matched
+    print(f"移行: {character} ({gender}) - {series}: {simple}{'（既存タグ）' if matched else ''}")
 
-with open('マスターデータ.tsv', 'w', encoding='utf-8') as f:
-    f.writelines(final_lines)
+# キャラクター再現を除外し、移行分を追加した内容で書き戻す
+store.commit()
 
 print(f"\n処理完了:")
 print(f"- キャラクター再現項目を全削除")
-print(f"- {migrated_count}名をキャラクター()系に移行")
\ No newline at end of file
+print(f"- {migrated_count}名をキャラクター()系に移行（既存タグに対応付け {matched_count}名）")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+マスターデータのほぼ重複したプロンプトの検出（MinHash + LSH）
+
+sort_and_clean.sh（consolidate.py）は完全一致の行しか取り除けないため、
+空白・"_" の違い、タグの順序、強調の括弧だけが違うプロンプトが溜まっていく。
+ここでは各行の Prompt を tag_vectors.py で正規化したタグの集合にし、
+MinHash の署名を帯（band）に分けたバケットで候補の組だけを求めてから
+Jaccard係数を計算するため、全行の総当たり（行数の2乗）をせずにクラスタを報告できる。
+
+    python3 near_duplicates.py
+    python3 near_duplicates.py --threshold 0.7 --major 服装
+    python3 near_duplicates.py --across-categories   # 別のカテゴリにある同じ・似たPromptも表示
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from master_store import MASTER_FILE, MasterStore
+from tag_vectors import store_vectors
+
+# 既定の類似度（Jaccard係数）の下限
+DEFAULT_THRESHOLD = 0.8
+# 署名の長さ = BANDS * ROWS_PER_BAND。一致率が (1/BANDS)^(1/ROWS_PER_BAND) ≒ 0.5 を超える組が候補になりやすい
+BANDS = 16
+ROWS_PER_BAND = 4
+
+# ハッシュ族 h(x) = (a * x + b) mod PRIME
+PRIME = (1 << 61) - 1
+SEED = 20250701
+
+
+class MinHasher:
+    """タグIDの集合 -> MinHash署名（タグごとのハッシュ値はキャッシュする）"""
+
+    def __init__(self, num_perm=BANDS * ROWS_PER_BAND, seed=SEED):
+        rng = random.Random(seed)
+        self.params = [(rng.randrange(1, PRIME), rng.randrange(PRIME)) for _ in range(num_perm)]
+        self._tag_hashes = {}
+
+    def _hashes(self, tag_id):
+        hashes = self._tag_hashes.get(tag_id)
+        if hashes is None:
+            x = tag_id + 1
+            hashes = self._tag_hashes[tag_id] = tuple((a * x + b) % PRIME for a, b in self.params)
+        return hashes
+
+    def signature(self, tag_set):
+        """各ハッシュ関数での最小値のタプル"""
+        hashes = [self._hashes(tag_id) for tag_id in tag_set]
+        if len(hashes) == 1:
+            return hashes[0]
+        return tuple(map(min, *hashes))
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+def candidate_pairs(signatures, scopes, bands=BANDS, rows_per_band=ROWS_PER_BAND):
+    """
+    署名の帯ごとのバケットで、同じ範囲（scopes）にあり少なくとも1つの帯が一致する組 (i, j) の集合を返す
+    """
+    pairs = set()
+    for band in range(bands):
+        start = band * rows_per_band
+        buckets = defaultdict(list)
+        for index, signature in enumerate(signatures):
+            buckets[(scopes[index], signature[start:start + rows_per_band])].append(index)
+        for members in buckets.values():
+            for position, i in enumerate(members):
+                for j in members[position + 1:]:
+                    pairs.add((i, j))
+    return pairs
+
+
+def find_near_duplicates(store, threshold=DEFAULT_THRESHOLD, major=None, across_categories=False,
+                         bands=BANDS, rows_per_band=ROWS_PER_BAND):
+    """
+    タグ集合のJaccard係数が threshold 以上の行をまとめたクラスタを返す
+
+    比較は同じ (大項目, 中項目) の行どうしで行う（別のカテゴリに同じPromptを置くのは意図的なことが多いため）。
+    across_categories=True なら全行を比較する。
+    同じタグ集合の行はまず1つにまとめ、異なるタグ集合どうしだけを MinHash/LSH で比較する。
+    クラスタは行IDのリストで、行数の多い順に並ぶ
+    """
+    vectors = store_vectors(store)
+    # (範囲, タグ集合) -> 行IDリスト
+    groups = defaultdict(list)
+    for row_id in store.query(major=major):
+        tag_set = vectors[row_id].tag_set()
+        if tag_set:
+            scope = None if across_categories else (store.majors[row_id], store.middles[row_id])
+            groups[(scope, tag_set)].append(row_id)
+
+    keys = list(groups)
+    scopes = [scope for scope, _ in keys]
+    tag_sets = [tag_set for _, tag_set in keys]
+    hasher = MinHasher(bands * rows_per_band)
+    signatures = [hasher.signature(tag_set) for tag_set in tag_sets]
+
+    # 組み合わせの確認と Union-Find によるクラスタ化
+    parent = list(range(len(tag_sets)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in candidate_pairs(signatures, scopes, bands, rows_per_band):
+        if jaccard(tag_sets[i], tag_sets[j]) >= threshold:
+            parent[root(i)] = root(j)
+
+    clusters = defaultdict(list)
+    for index, key in enumerate(keys):
+        clusters[root(index)].extend(groups[key])
+    result = [sorted(row_ids) for row_ids in clusters.values() if len(row_ids) > 1]
+    result.sort(key=lambda row_ids: (-len(row_ids), row_ids[0]))
+    return result
+
+
+def print_clusters(store, clusters, limit=None):
+    vectors = store_vectors(store)
+    for number, row_ids in enumerate(clusters[:limit], 1):
+        base = vectors[row_ids[0]].tag_set()
+        print(f"\n## クラスタ {number}（{len(row_ids)}行）")
+        for row_id in row_ids:
+            major, middle, small, prompt = store.row(row_id)
+            similarity = jaccard(base, vectors[row_id].tag_set())
+            print(f"  {similarity:.2f}  {major} / {middle} / {small}: {prompt[:100]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ほぼ重複したプロンプトの検出（MinHash/LSH）')
+    parser.add_argument('file', nargs='?', default=MASTER_FILE, help='対象のTSV（既定: マスターデータ.tsv）')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='重複とみなすタグ集合のJaccard係数の下限')
+    parser.add_argument('--major', help='この大項目の行だけを比較')
+    parser.add_argument('--across-categories', action='store_true',
+                        help='大項目・中項目が異なる行どうしも比較')
+    parser.add_argument('--bands', type=int, default=BANDS, help='LSHの帯の数')
+    parser.add_argument('--rows-per-band', type=int, default=ROWS_PER_BAND, help='1つの帯の署名の長さ')
+    parser.add_argument('--limit', type=int, help='表示するクラスタ数の上限')
+    args = parser.parse_args()
+
+    store = MasterStore.load(args.file)
+    start = time.perf_counter()
+    clusters = find_near_duplicates(store, args.threshold, args.major, args.across_categories,
+                                    args.bands, args.rows_per_band)
+    elapsed = time.perf_counter() - start
+
+    print_clusters(store, clusters, args.limit)
+    print(f"\nクラスタ {len(clusters)}件 / 対象行 {sum(len(row_ids) for row_ids in clusters)}行"
+          f"（{len(store)}行中、{elapsed:.2f}秒）")
+
+
+if __name__ == '__main__':
+    main()
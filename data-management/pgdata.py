@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+データ管理ツールの共通コマンド
+
+個別のスクリプト（generate_master.py・consolidate.py・import_additions.py など）の処理を
+サブコマンドとして1つにまとめたもの。パスはすべてリポジトリからの相対位置で決まり、
+各サブコマンドのモジュール（分類キーワード・翻訳辞書など）はそのサブコマンドを実行するときだけ読み込む。
+
+"+" で区切って複数のサブコマンドを続けて実行でき、マスターデータは1回だけ読み込んで共有する。
+変更は最後（または generate・backup の前）にまとめて書き込み、バックアップもその前に1回だけ作る。
+
+    python3 pgdata.py import + consolidate + generate
+    python3 pgdata.py --dry-run translate ja-en --major 服装 + dedupe
+    python3 pgdata.py stats --tags 20
+    python3 pgdata.py backup list
+    python3 pgdata.py --backend sqlite db search 笑顔
+
+--backend sqlite を指定すると、マスターデータをSQLiteのコピー（master_db.py）経由で読み込み、
+書き込み後にコピーも更新する（正本は常にTSV）。
+
+共通オプション（--master・--backend・計測用のオプション）は最初のサブコマンド名の前に指定する。
+--dry-run・--no-backup・--verbose はどのサブコマンドに書いても全体に適用される。
+"""
+
+import argparse
+import importlib
+import os
+import sys
+from collections import Counter
+
+from master_store import BASE_DIR, MASTER_FILE, MasterStore
+from run_report import RunReport, add_arguments
+
+CHAIN_SEPARATOR = '+'
+
+
+class Context:
+    """連続して実行するサブコマンドで共有する状態（マスターデータ・書き込み・計測）"""
+
+    def __init__(self, master_file, report, dry_run=False, no_backup=False, backend='tsv', db_file=None):
+        self.master_file = master_file
+        self.report = report
+        self.dry_run = dry_run
+        self.no_backup = no_backup
+        self.backend = backend
+        self.db_file = db_file
+        self._store = None
+        self._db = None
+        self._backed_up = False
+        # 最初に変更したサブコマンドの名前（バックアップのラベルに使う）
+        self._changed_by = None
+
+    @property
+    def store(self):
+        """マスターデータ（初回参照時に読み込む）"""
+        if self._store is None:
+            with self.report.stage('load'):
+                if self.backend == 'sqlite':
+                    self._store = self.db.load_store(self.master_file)
+                else:
+                    self._store = MasterStore.load(self.master_file)
+        return self._store
+
+    @property
+    def db(self):
+        """マスターデータのSQLiteコピー（TSVが変わっていれば取り込み直す）"""
+        return self.sync_db()
+
+    def sync_db(self):
+        """SQLiteのコピーをTSVの内容に合わせて返す"""
+        if self._db is None:
+            from master_db import MasterDB
+            self._db = MasterDB(self.db_file) if self.db_file else MasterDB()
+        with self.report.stage('db-sync'):
+            self._db.sync(self.master_file)
+        return self._db
+
+    def changed(self, command):
+        """サブコマンドがストアを変更したことを記録"""
+        if self._changed_by is None:
+            self._changed_by = command
+
+    def backup(self, label):
+        """処理前のバックアップ（1回の実行で1回だけ）"""
+        if self.no_backup or self._backed_up:
+            return
+        from backup_store import backup_file
+        with self.report.stage('backup'):
+            snapshot_id = backup_file(self.master_file, label)
+        self._backed_up = True
+        print(f"バックアップ作成: {snapshot_id}")
+
+    def save(self):
+        """未保存の変更をマスターデータに書き込む（--dry-run なら書き込まない）"""
+        if self._store is None or not self._store.dirty:
+            return False
+        if self.dry_run:
+            return False
+        self.backup(f"before_{self._changed_by or 'pgdata'}")
+        with self.report.stage('write'):
+            self._store.commit()
+        print(f"{os.path.basename(self.master_file)}を更新しました")
+        if self.backend == 'sqlite':
+            self.sync_db()
+        return True
+
+
+def load(module_name):
+    """サブコマンドのモジュールを実行時に読み込む"""
+    return importlib.import_module(module_name)
+
+
+# ============================================
+# サブコマンド
+# ============================================
+# 各サブコマンドは (説明, 引数を追加する関数, 実行する関数)。
+# 引数の定義では重いモジュールを読み込まない
+
+def generate_arguments(parser):
+    parser.add_argument('--format', choices=['compact', 'legacy'], default='compact', help='default-master.jsの形式')
+    parser.add_argument('--force', action='store_true', help='マニフェストを無視してすべて再生成')
+
+
+def run_generate(ctx, args):
+    if ctx.dry_run:
+        print("--dry-run のため生成は行いません")
+        return
+    generate_master = load('generate_master')
+    ctx.save()
+    generate_master.generate(ctx.master_file, generate_master.OUTPUT_FILE, BASE_DIR,
+                             args.format, args.force, ctx.report)
+
+
+def consolidate_arguments(parser):
+    pass
+
+
+def run_consolidate(ctx, args):
+    before, after = load('consolidate').consolidate(ctx.store)
+    ctx.changed('consolidate')
+    ctx.report.count('consolidate_removed', before - after)
+    print(f"ソート・統合: {before} 行 -> {after} 行")
+
+
+def import_arguments(parser):
+    parser.add_argument('file', nargs='?', help='追加希望のTSV（既定: data-management/追加希望.tsv）')
+
+
+def run_import(ctx, args):
+    import_additions = load('import_additions')
+    wish_file = args.file or import_additions.WISH_FILE
+    with open(wish_file, 'r', encoding='utf-8') as f:
+        wish_lines = f.readlines()
+
+    classifier = import_additions.StagedClassifier()
+    result = import_additions.import_wish_lines(ctx.store, wish_lines, classifier, ctx.report)
+    for name, count in zip(classifier.names, result.added):
+        print(f"{name}: {count}個の項目を抽出しました")
+    print(f"マスターデータと重複: {result.duplicates}個 / 未登録: {len(result.unregistered)}個")
+    ctx.report.count('import_added', result.total_added)
+    ctx.report.count('import_unregistered', len(result.unregistered))
+    if not wish_lines or ctx.dry_run:
+        return
+
+    # 追加希望.tsv のクリアと未登録項目.tsv への移動はマスターデータと同時に書き込む
+    ctx.changed('import')
+    ctx.backup('before_import')
+    unregistered_file = os.path.join(os.path.dirname(os.path.abspath(wish_file)), '未登録項目.tsv')
+    with ctx.report.stage('write'):
+        import_additions.commit_import(ctx.store, result, wish_file, unregistered_file)
+    print(f"マスターデータに{result.total_added}個の項目を追加し、追加希望をクリアしました")
+
+
+def translate_arguments(parser):
+    parser.add_argument('direction', choices=['en-ja', 'ja-en'],
+                        help='en-ja: 小項目を日本語に / ja-en: Promptを英語に')
+    parser.add_argument('--file', help='対象行を列挙したTSV（省略時は --major / --middle で絞り込んだ全行）')
+    parser.add_argument('--major', help='対象の大項目')
+    parser.add_argument('--middle', help='対象の中項目')
+    parser.add_argument('--partial', action='store_true', help='一部のタグしか訳せなかった行も書き換える')
+
+
+def run_translate(ctx, args):
+    tag_translator = load('tag_translator')
+    store = ctx.store
+    if args.file:
+        row_ids = tag_translator.read_target_rows(store, args.file)
+    else:
+        row_ids = store.query(major=args.major, middle=args.middle)
+    _, column, _ = tag_translator.DIRECTIONS[args.direction]
+
+    before = {row_id: store.row(row_id)[column] for row_id in row_ids}
+    translated, incomplete = tag_translator.translate_rows(store, row_ids, args.direction, args.partial)
+    for row_id in row_ids:
+        after = store.row(row_id)[column]
+        if after != before[row_id]:
+            ctx.report.detail(f"翻訳: {before[row_id]} -> {after}")
+    for row_id, unresolved in incomplete:
+        ctx.report.detail(f"翻訳辞書なし（要手動確認）: {before[row_id]}  [{', '.join(unresolved)}]")
+    print(f"翻訳: 対象 {len(row_ids)} 行 / 翻訳 {translated} 行 / 要手動確認 {len(incomplete)} 行")
+    ctx.report.count('translated', translated)
+    if translated:
+        ctx.changed('tag_translation')
+
+
+def classify_arguments(parser):
+    parser.add_argument('--default', choices=['女性', '男性', '人外'],
+                        help='レジストリにない作品に使う性別（省略時は変更しない）')
+    parser.add_argument('--mismatches', action='store_true',
+                        help='変更せず、推定した性別と現在の大項目が食い違う行を表示')
+    parser.add_argument('--min-confidence', type=float, default=0.5, help='--mismatches で表示する確信度の下限')
+
+
+def run_classify(ctx, args):
+    if args.mismatches:
+        analysis = load('analyze_character_gender')
+        characters = analysis.analyze_character_gender(ctx.store)
+        analysis.print_mismatches(analysis.find_mismatches(characters, args.min_confidence))
+        return
+
+    gender_registry = load('gender_registry')
+    changed, unmapped = gender_registry.apply_registry(
+        ctx.store, gender_registry.GenderRegistry.load(), args.default)
+    for row_id, before in changed:
+        major, middle, small, _ = ctx.store.row(row_id)
+        ctx.report.detail(f"{middle} / {small}: {before} -> {major}")
+    print(f"性別分類: 変更 {len(changed)} 行 / レジストリ未登録の作品 {len(unmapped)} 件")
+    ctx.report.count('classified', len(changed))
+    if changed:
+        ctx.changed('gender_registry')
+
+
+def dedupe_arguments(parser):
+    parser.add_argument('--threshold', type=float, help='重複とみなすタグ集合のJaccard係数の下限（既定 0.8）')
+    parser.add_argument('--major', help='この大項目の行だけを比較')
+    parser.add_argument('--across-categories', action='store_true', help='大項目・中項目が異なる行どうしも比較')
+    parser.add_argument('--limit', type=int, help='表示するクラスタ数の上限')
+
+
+def run_dedupe(ctx, args):
+    near_duplicates = load('near_duplicates')
+    threshold = near_duplicates.DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+    clusters = near_duplicates.find_near_duplicates(ctx.store, threshold, args.major, args.across_categories)
+    near_duplicates.print_clusters(ctx.store, clusters, args.limit)
+    print(f"ほぼ重複: クラスタ {len(clusters)}件 / {sum(len(row_ids) for row_ids in clusters)}行")
+    ctx.report.count('duplicate_clusters', len(clusters))
+
+
+def backup_arguments(parser):
+    parser.add_argument('backup_args', nargs=argparse.REMAINDER,
+                        help='backup_store.py の引数（snapshot / list / restore / prune / import-legacy）')
+
+
+def run_backup(ctx, args):
+    # 未保存の変更があれば先に書き込み、スナップショットに含める
+    ctx.save()
+    load('backup_store').main(args.backup_args or ['list'])
+
+
+def db_arguments(parser):
+    parser.add_argument('db_args', nargs=argparse.REMAINDER,
+                        help='master_db.py の引数（import / export / search / duplicates / registry）')
+
+
+def run_db(ctx, args):
+    # 未保存の変更があれば先に書き込み、取り込み直した内容を対象にする
+    ctx.save()
+    db_args = ['--master', ctx.master_file]
+    if ctx.db_file:
+        db_args += ['--db', ctx.db_file]
+    load('master_db').main(db_args + (args.db_args or ['import']))
+
+
+def stats_arguments(parser):
+    parser.add_argument('--tags', type=int, default=0, metavar='N', help='出現行数の多いタグを N 件表示')
+
+
+def run_stats(ctx, args):
+    store = ctx.store
+    categories = store.categories()
+    rows = Counter(store.majors[row_id] for row_id in store.ids())
+    print(f"行数: {len(store)} / 大項目: {len(categories)} / 中項目: {sum(len(m) for m in categories.values())}")
+    for major, count in rows.most_common():
+        print(f"  {count:6d}  {major}（中項目 {len(categories[major])}）")
+
+    if args.tags:
+        tag_vectors = load('tag_vectors')
+        vectors = tag_vectors.store_vectors(store)
+        tag_rows = Counter()
+        for row_id in store.ids():
+            tag_rows.update(vectors[row_id].tag_set())
+        print(f"\n異なるタグ: {len(tag_rows)}種")
+        for tag_id, count in tag_rows.most_common(args.tags):
+            print(f"  {count:6d}  {tag_vectors.VOCABULARY.tag(tag_id)}")
+
+
+COMMANDS = {
+    'generate': ('default-master.js・シャード・検索インデックス・カテゴリ一覧を生成', generate_arguments, run_generate),
+    'consolidate': ('ソート・重複削除・同一プロンプト項目の統合', consolidate_arguments, run_consolidate),
+    'import': ('追加希望.tsvを分類してマスターデータに取り込む', import_arguments, run_import),
+    'translate': ('小項目・Promptをタグ単位で翻訳', translate_arguments, run_translate),
+    'classify': ('キャラクターの性別分類（gender_registry.tsv）を反映', classify_arguments, run_classify),
+    'dedupe': ('ほぼ重複したプロンプトを表示', dedupe_arguments, run_dedupe),
+    'backup': ('バックアップストアの操作', backup_arguments, run_backup),
+    'db': ('マスターデータのSQLiteコピーの操作', db_arguments, run_db),
+    'stats': ('マスターデータの件数・タグの集計', stats_arguments, run_stats),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='pgdata', description='データ管理ツール（"+" で区切って複数のサブコマンドを続けて実行）')
+    parser.add_argument('--master', default=MASTER_FILE, help='マスターデータ（既定: data-management/マスターデータ.tsv）')
+    parser.add_argument('--backend', choices=['tsv', 'sqlite'], default='tsv',
+                        help='マスターデータの読み込み元（sqlite: master_db.py のコピー経由）')
+    parser.add_argument('--db', help='SQLiteのコピー（既定: data-management/master_data.sqlite）')
+    parser.add_argument('--dry-run', action='store_true', help='結果を表示するだけで書き込まない')
+    parser.add_argument('--no-backup', action='store_true', help='書き込み前のバックアップを作成しない')
+    add_arguments(parser)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (help_text, add_command_arguments, _) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        add_command_arguments(command_parser)
+        # 全体に適用する指定はサブコマンドの後にも書けるようにする（省略時は全体の既定値を上書きしない）
+        command_parser.add_argument('--dry-run', action='store_true', default=argparse.SUPPRESS,
+                                    help='結果を表示するだけで書き込まない（全体に適用）')
+        command_parser.add_argument('--no-backup', action='store_true', default=argparse.SUPPRESS,
+                                    help='書き込み前のバックアップを作成しない（全体に適用）')
+        command_parser.add_argument('-v', '--verbose', action='store_true', default=argparse.SUPPRESS,
+                                    help='行ごとの詳細を表示（全体に適用）')
+    return parser
+
+
+def split_chain(argv):
+    """引数を "+" で区切ってサブコマンドごとのリストにする"""
+    chain = [[]]
+    for arg in argv:
+        if arg == CHAIN_SEPARATOR:
+            chain.append([])
+        else:
+            chain[-1].append(arg)
+    return [segment for segment in chain if segment]
+
+
+def main(argv=None):
+    parser = build_parser()
+    segments = split_chain(sys.argv[1:] if argv is None else argv)
+    if not segments:
+        parser.print_help()
+        return
+
+    # 実行前にすべての引数を検査する（途中のサブコマンドの引数誤りで書き込みが半端にならないように）
+    commands = [parser.parse_args(segment) for segment in segments]
+    options = commands[0]
+    # 書き込み・表示に関わる指定は、どのサブコマンドの前に書かれていても全体に適用する
+    for flag in ('dry_run', 'no_backup', 'verbose'):
+        setattr(options, flag, any(getattr(args, flag) for args in commands))
+    report = RunReport.from_args('pgdata', options)
+    ctx = Context(options.master, report, options.dry_run, options.no_backup, options.backend, options.db)
+
+    for args in commands:
+        if len(commands) > 1:
+            print(f"\n== {args.command} ==")
+        _, _, run = COMMANDS[args.command]
+        with report.stage(args.command):
+            run(ctx, args)
+
+    ctx.save()
+    report.finish(options.master)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+データ管理スクリプト共通の計測と実行レポート
+
+各コマンドは RunReport を通して処理段階ごとの実行時間・件数を記録し、終了時に1行の要約を表示して、
+主な出力ファイルと同じフォルダの .run-reports/<コマンド名>.json に機械可読のレポートを書き出す。
+行ごとの詳細（"翻訳: ..." など）は detail() で出力し、--verbose を指定したときだけ表示する。
+
+    report = RunReport.from_args('consolidate', args)
+    with report.stage('load'):
+        store = MasterStore.load(path)
+    report.count('rows', len(store))
+    report.finish(path)
+
+--memory で段階ごとの tracemalloc のピーク、--profile で cProfile の結果も記録する
+（どちらも処理が遅くなるため既定では無効）。
+"""
+
+import cProfile
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+RUN_REPORT_DIR = '.run-reports'
+REPORT_VERSION = 1
+
+
+def add_arguments(parser):
+    """計測用のオプションを argparse のパーサーに追加"""
+    group = parser.add_argument_group('計測')
+    group.add_argument('-v', '--verbose', action='store_true', help='行ごとの詳細を表示')
+    group.add_argument('--memory', action='store_true',
+                       help='処理段階ごとのメモリのピークを計測（tracemalloc、処理が遅くなる）')
+    group.add_argument('--profile', metavar='PATH', help='cProfile の結果を保存するファイル')
+    group.add_argument('--no-report', action='store_true', help='実行レポートを書き出さない')
+
+
+class RunReport:
+    """処理段階の実行時間・メモリのピーク・件数の記録"""
+
+    def __init__(self, command, verbose=False, memory=False, profile=None, write=True):
+        self.command = command
+        self.verbose = verbose
+        self.memory = memory
+        self.profile = profile
+        self.write = write
+        self.started = datetime.now()
+        self.stages = []
+        self.counts = {}
+        self._start = time.perf_counter()
+        self._profiler = None
+        if profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    @classmethod
+    def from_args(cls, command, args):
+        """add_arguments で追加したオプションから作成"""
+        return cls(command, verbose=args.verbose, memory=args.memory,
+                   profile=args.profile, write=not args.no_report)
+
+    @contextmanager
+    def stage(self, name):
+        """with ブロックの実行時間（--memory 指定時はメモリのピークも）を記録"""
+        tracing = self.memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = {'name': name, 'seconds': round(time.perf_counter() - start, 4)}
+            if self.memory:
+                entry['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 1)
+                if tracing:
+                    tracemalloc.stop()
+            self.stages.append(entry)
+
+    def count(self, name, n=1):
+        """件数のカウンタに n を加える"""
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def detail(self, message):
+        """行ごとの詳細（--verbose 指定時のみ表示）"""
+        if self.verbose:
+            print(message)
+
+    @property
+    def seconds(self):
+        return time.perf_counter() - self._start
+
+    def as_dict(self):
+        return {
+            'version': REPORT_VERSION,
+            'command': self.command,
+            'argv': sys.argv[1:],
+            'started': self.started.isoformat(timespec='seconds'),
+            'seconds': round(self.seconds, 4),
+            'stages': self.stages,
+            'counts': self.counts,
+            'python': platform.python_version(),
+            'profile': self.profile,
+        }
+
+    def summary(self):
+        """段階ごとの時間の1行の要約"""
+        parts = []
+        for entry in self.stages:
+            text = f"{entry['name']} {entry['seconds']:.2f}秒"
+            if 'peak_mb' in entry:
+                text += f"（{entry['peak_mb']} MB）"
+            parts.append(text)
+        return f"計測: {' / '.join(parts)}（合計 {self.seconds:.2f}秒）" if parts else ''
+
+    def finish(self, output_path=None):
+        """
+        要約を表示し、プロファイルとレポートを書き出す
+
+        レポートは output_path（主な出力ファイル）と同じフォルダの .run-reports/ に保存し、そのパスを返す
+        """
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.profile)
+            self._profiler = None
+        summary = self.summary()
+        if summary:
+            print(summary)
+        if not self.write or output_path is None:
+            return None
+
+        report_dir = os.path.join(os.path.dirname(os.path.abspath(output_path)), RUN_REPORT_DIR)
+        os.makedirs(report_dir, exist_ok=True)
+        report_path = os.path.join(report_dir, f'{self.command}.json')
+        with open(report_path, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(self.as_dict(), f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        return report_path
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文字列の文字種（ラテン文字・ひらがな・カタカナ・漢字・数字・記号）の構成を求めるモジュール
+
+各文字をUnicodeのブロックで分類した変換表を一度だけ作り、str.translate で
+1文字1記号に置き換えてから記号ごとに数えるため、正規表現の置換を繰り返さずに済む。
+
+マスターデータの列ごとの構成は MasterStore の派生列としてキャッシュし、
+「Promptが主に日本語の行」のような条件で行IDを取り出せる。
+"""
+
+import sys
+from collections import namedtuple
+
+# 分類記号
+LATIN = 'L'
+HIRAGANA = 'H'
+KATAKANA = 'K'
+CJK = 'C'
+DIGIT = 'D'
+SPACE = ' '
+SYMBOL = 'P'
+# 上記以外（制御文字など、ASCII の変換表でのみ使う）
+OTHER = 'O'
+
+# (開始, 終了, 分類)。後の範囲が優先される
+RANGES = [
+    (0x0021, 0x007E, SYMBOL),
+    (0x0041, 0x005A, LATIN),
+    (0x0061, 0x007A, LATIN),
+    (0x0030, 0x0039, DIGIT),
+    (0x00A1, 0x00BF, SYMBOL),
+    (0x00C0, 0x024F, LATIN),
+    (0x00D7, 0x00D7, SYMBOL),
+    (0x00F7, 0x00F7, SYMBOL),
+    (0x2000, 0x206F, SYMBOL),
+    (0x2190, 0x2BFF, SYMBOL),
+    (0x3000, 0x303F, SYMBOL),
+    (0x3005, 0x3007, CJK),       # 々〆〇
+    (0x3040, 0x309F, HIRAGANA),
+    (0x30A0, 0x30FF, KATAKANA),  # 長音記号「ー」を含む
+    (0x30FB, 0x30FB, SYMBOL),    # 中黒「・」
+    (0x31F0, 0x31FF, KATAKANA),
+    (0x3400, 0x4DBF, CJK),
+    (0x4E00, 0x9FFF, CJK),
+    (0xF900, 0xFAFF, CJK),
+    (0xFF01, 0xFF5E, SYMBOL),
+    (0xFF10, 0xFF19, DIGIT),
+    (0xFF21, 0xFF3A, LATIN),
+    (0xFF41, 0xFF5A, LATIN),
+    (0xFF61, 0xFF65, SYMBOL),
+    (0xFF66, 0xFF9F, KATAKANA),
+]
+
+
+def _build_table():
+    table = {}
+    for start, end, kind in RANGES:
+        for code in range(start, end + 1):
+            table[code] = kind
+    for char in ' \t\r\n\u3000\u00a0':
+        table[ord(char)] = SPACE
+    return table
+
+
+TABLE = _build_table()
+# ASCIIのみの文字列用（bytes.translate は str.translate より大幅に速い）
+ASCII_TABLE = bytes(ord(TABLE.get(code, OTHER)) for code in range(256))
+
+
+class ScriptProfile(namedtuple('ScriptProfile',
+                               'latin hiragana katakana cjk digit symbol other')):
+    """文字種ごとの文字数（空白は数えない）"""
+
+    __slots__ = ()
+
+    @property
+    def japanese(self):
+        return self.hiragana + self.katakana + self.cjk
+
+    @property
+    def total(self):
+        return sum(self)
+
+    def ratio(self, count):
+        """空白以外の文字数に対する割合"""
+        total = self.total
+        return count / total if total else 0.0
+
+    def is_mostly_english(self):
+        """ラテン文字が半分を超え、3文字以上"""
+        total = sum(self)
+        return total >= 3 and self[0] * 2 > total
+
+    def is_mostly_japanese(self):
+        """ひらがな・カタカナ・漢字が半分を超え、2文字以上"""
+        total = sum(self)
+        return total >= 2 and (self[1] + self[2] + self[3]) * 2 > total
+
+
+def profile(text):
+    """文字列の文字種構成を1回の変換で求める"""
+    if not text:
+        return EMPTY
+    if text.isascii():
+        mapped = text.encode('ascii').translate(ASCII_TABLE)
+        latin = mapped.count(b'L')
+        digit = mapped.count(b'D')
+        symbol = mapped.count(b'P')
+        other = len(mapped) - mapped.count(b' ') - latin - digit - symbol
+        return ScriptProfile(latin, 0, 0, 0, digit, symbol, other)
+    mapped = text.translate(TABLE)
+    latin = mapped.count(LATIN)
+    hiragana = mapped.count(HIRAGANA)
+    katakana = mapped.count(KATAKANA)
+    cjk = mapped.count(CJK)
+    digit = mapped.count(DIGIT)
+    symbol = mapped.count(SYMBOL)
+    other = len(mapped) - mapped.count(SPACE) - latin - hiragana - katakana - cjk - digit - symbol
+    return ScriptProfile(latin, hiragana, katakana, cjk, digit, symbol, other)
+
+
+EMPTY = ScriptProfile(0, 0, 0, 0, 0, 0, 0)
+
+
+def is_mostly_english(text):
+    return profile(text).is_mostly_english()
+
+
+def is_mostly_japanese(text):
+    return profile(text).is_mostly_japanese()
+
+
+def has_latin(text):
+    return profile(text).latin > 0
+
+
+def has_japanese(text):
+    return profile(text).japanese > 0
+
+
+# ============================================
+# マスターデータの派生列
+# ============================================
+
+# 列名 -> MasterStore の列番号
+COLUMNS = {'大項目': 0, '中項目': 1, '小項目': 2, 'Prompt': 3}
+
+
+def profile_column(store, column):
+    """列の文字種構成（行ID順のリスト）。ストアの派生列としてキャッシュされる"""
+    index = COLUMNS[column]
+    return store.derived(('script_profile', column), lambda row: profile(row[index]))
+
+
+def select(store, **conditions):
+    """
+    列ごとの条件をすべて満たす行IDを返す
+
+    条件は ScriptProfile を受け取る関数（例: ScriptProfile.is_mostly_japanese）で、
+    列名は 大項目 / 中項目 / 小項目 / Prompt
+
+        select(store, 小項目=ScriptProfile.is_mostly_japanese, Prompt=ScriptProfile.is_mostly_japanese)
+    """
+    columns = [(profile_column(store, column), predicate)
+               for column, predicate in conditions.items()]
+    return [row_id for row_id in store.ids()
+            if all(predicate(profiles[row_id]) for profiles, predicate in columns)]
+
+
+def main():
+    """引数の文字列の文字種構成を表示"""
+    for text in sys.argv[1:]:
+        print(f"{text}: {profile(text)}")
+
+
+if __name__ == '__main__':
+    main()
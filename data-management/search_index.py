@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+マスターデータの文字バイグラム転置インデックスを生成するモジュール
+
+拡張機能の Search() は 大項目+中項目+小項目+Prompt を連結して小文字化した文字列に
+キーワードが含まれるかを調べる。このインデックスは同じ連結文字列のバイグラムから
+行IDを引けるようにし、部分一致チェックの前に候補行を絞り込むために使う。
+
+キーは小文字化した文字列と、NFKC正規化＋小文字化した文字列の両方から作る
+（検索語側は小文字化のみで引けるため、NFKCで表記が変わる行も取りこぼさない）。
+n-gramはコードポイント単位（拡張機能側も Array.from で同じ単位に分割する）。
+"""
+
+import json
+import unicodedata
+
+GRAM_SIZE = 2
+
+
+def normalize(text):
+    """インデックスキー用の正規化（NFKC + 小文字化）"""
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+def row_text(major, middle, small, prompt):
+    """Search() と同じ連結順の検索対象文字列"""
+    return major + middle + small + prompt
+
+
+def text_grams(text, size=GRAM_SIZE):
+    """検索対象文字列から重複なしのn-gram集合を作る"""
+    grams = set()
+    for variant in {text.lower(), normalize(text)}:
+        for i in range(len(variant) - size + 1):
+            grams.add(variant[i:i + size])
+    return grams
+
+
+def build_postings(rows, size=GRAM_SIZE):
+    """
+    n-gram -> 行IDリスト（昇順）の辞書を作る
+
+    rows は (大項目, 中項目, 小項目, Prompt) のイテラブルで、
+    列挙順がそのまま行IDになる
+    """
+    postings = {}
+    for row_id, row in enumerate(rows):
+        for gram in text_grams(row_text(*row), size):
+            ids = postings.get(gram)
+            if ids is None:
+                postings[gram] = [row_id]
+            else:
+                ids.append(row_id)
+    return postings
+
+
+def build_search_index(rows, version, build, size=GRAM_SIZE):
+    """
+    検索インデックスのJSON文字列を生成
+
+    build は対応するシャードの build（シャードの index.json と同じ値）。
+    行IDリストは差分（先頭は絶対値）で格納してサイズを抑える
+    """
+    rows = list(rows)
+    postings = build_postings(rows, size)
+    grams = {}
+    for gram in sorted(postings):
+        ids = postings[gram]
+        grams[gram] = [ids[0]] + [ids[i] - ids[i - 1] for i in range(1, len(ids))]
+    return (
+        f'{{"version":{version},"build":"{build}","gram":{size},"total":{len(rows)},"grams":'
+        + json.dumps(grams, ensure_ascii=False, separators=(',', ':'))
+        + '}\n'
+    )
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+カンマ区切りのプロンプト（タグリスト）をタグ単位で翻訳するエンジン
+
+拡張機能の PromptEditor と同じく "," でタグに分け、各タグから強調・重み
+（{tag} / [tag] / (tag:1.2) / tag:1.2 / 1.2::tag::）を外した本体だけを翻訳して、
+強調・重み・区切りの空白は元のまま組み立て直す。
+
+タグ本体はまず辞書の完全一致（大文字小文字・"_" と空白の違いは無視）で引き、
+見つからなければ辞書の全フレーズを入れたトライで左から最長一致で置き換える。
+英数字の途中では一致させないため、"sandwich" が "sand" として訳されることはない。
+タグ本体ごとの訳は翻訳メモリ（translation_memory.py）に保存し、次回からはそのまま使う。
+
+    python3 tag_translator.py ja-en --file japanese_prompt_items_to_fix.tsv
+    python3 tag_translator.py en-ja --major エフェクト --dry-run
+"""
+
+import argparse
+import re
+
+from backup_store import backup_file
+from master_store import MASTER_FILE, MasterStore
+from run_report import RunReport, add_arguments
+from script_profile import has_japanese, has_latin
+from translation_dict import english_to_japanese, japanese_to_english
+from translation_memory import open_memory
+
+# PromptEditor.init と同じ区切り
+TAG_SEPARATOR = ','
+
+# NovelAI形式の数値重み（1.2::tag::）
+NAI_WEIGHT = re.compile(r'^-?\d+(?:\.\d+)?::(.*)::$', re.S)
+# SD形式の重み（(tag:1.2) の内側、または tag:1.2）
+SD_WEIGHT = re.compile(r':-?\d+(?:\.\d+)?$')
+# PromptEditor.isSpecialPrompt と同じ（[from:to:step] はそのまま残す）
+SPECIAL_PROMPT = re.compile(r'^\[.*:.*:.*\]$', re.S)
+
+OPEN_BRACKETS = '{[('
+CLOSE_BRACKETS = {'{': '}', '[': ']', '(': ')'}
+
+# 訳せなかった部分のうち、これだけなら訳し終えたとみなす文字
+FILLER = re.compile(r'^[\s\-_/・]*$')
+
+# 翻訳方向 -> (辞書の読み込み関数, 対象列, 翻訳元の言語の文字を含むか)
+# 翻訳元の言語の文字を含まないタグは翻訳済みとしてそのまま残す
+DIRECTIONS = {
+    'en-ja': (english_to_japanese, 2, has_latin),
+    'ja-en': (japanese_to_english, 3, has_japanese),
+}
+
+
+def split_emphasis(tag):
+    """
+    タグを (前置き, 本体, 後置き) に分ける
+
+    前置き・後置きには前後の空白、強調の括弧、重みが入り、
+    前置き + 本体 + 後置き は元のタグと一致する
+    """
+    stripped = tag.strip()
+    if not stripped or SPECIAL_PROMPT.match(stripped):
+        return tag, '', ''
+    start = tag.index(stripped)
+    lead, trail = tag[:start], tag[start + len(stripped):]
+
+    body = stripped
+    head = tail = ''
+
+    match = NAI_WEIGHT.match(body)
+    if match:
+        head = body[:match.start(1)]
+        tail = body[match.end(1):]
+        body = match.group(1)
+
+    # 対応する開き括弧・閉じ括弧を外側から外す（"lass (pokemon bw)" の括弧は残す）
+    opened = 0
+    while (opened < len(body) - opened - 1 and body[opened] in OPEN_BRACKETS
+           and body[len(body) - opened - 1] == CLOSE_BRACKETS[body[opened]]):
+        opened += 1
+    if opened:
+        head += body[:opened]
+        tail = body[len(body) - opened:] + tail
+        body = body[opened:len(body) - opened]
+
+    match = SD_WEIGHT.search(body)
+    if match and match.start() > 0:
+        tail = body[match.start():] + tail
+        body = body[:match.start()]
+
+    return lead + head, body, tail + trail
+
+
+def fold(text):
+    """照合用の正規化（casefold・"_" を空白に）。位置を対応させるため文字数は変えない"""
+    chars = []
+    for char in text:
+        folded = char.casefold()
+        chars.append(folded if len(folded) == 1 else char)
+    return ''.join(chars).replace('_', ' ')
+
+
+def is_word_char(char):
+    return char.isascii() and char.isalnum()
+
+
+class TagResult:
+    """1つのプロンプトの翻訳結果"""
+
+    def __init__(self, text, unresolved):
+        self.text = text
+        # 訳せなかったタグ本体
+        self.unresolved = unresolved
+
+    @property
+    def complete(self):
+        return not self.unresolved
+
+
+class TagTranslator:
+    """翻訳辞書のフレーズでタグリストを翻訳する"""
+
+    def __init__(self, dictionary, source=None, memory=None, direction=None):
+        self.dictionary = dictionary
+        self.source = source
+        # 翻訳メモリ（指定時はタグ本体の訳を保存・再利用する）
+        self.memory = memory
+        self.direction = direction
+        self._trie = {}
+        # タグ本体 -> (訳, 訳し終えたか)
+        self._cache = {}
+        # 正規化すると同じになるフレーズは、完全一致の検索と同じく小文字のキーを優先
+        phrases = sorted(dictionary.items(), key=lambda item: fold(item[0]) != item[0])
+        for phrase, translation in phrases:
+            key = fold(phrase.strip())
+            if key:
+                self._insert(key, translation)
+
+    def _insert(self, key, translation):
+        node = self._trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(None, translation)
+
+    def _longest_match(self, text, start):
+        """start から始まる最長一致の (終了位置, 訳)。英数字の途中で終わるものは除く"""
+        node = self._trie
+        best = None
+        for end in range(start, len(text)):
+            node = node.get(text[end])
+            if node is None:
+                break
+            if None in node and (end + 1 == len(text) or not (
+                    is_word_char(text[end]) and is_word_char(text[end + 1]))):
+                best = (end + 1, node[None])
+        return best
+
+    def translate_tag(self, body):
+        """タグ本体を翻訳して (訳, 訳し終えたか) を返す"""
+        cached = self._cache.get(body)
+        if cached is not None:
+            return cached
+
+        if self.memory is not None:
+            cached = self.memory.lookup(self.direction, body, self.dictionary.revision)
+            if cached is not None:
+                self._cache[body] = cached
+                return cached
+
+        result = self._translate_body(body)
+        self._cache[body] = result
+        if self.memory is not None:
+            self.memory.remember(self.direction, body, result[0], result[1],
+                                 self.dictionary.revision, 'dictionary')
+        return result
+
+    def _translate_body(self, body):
+        translation = self.dictionary.get(body)
+        if translation is None:
+            translation = self.dictionary.get(re.sub(r'\s+', ' ', body.replace('_', ' ')))
+        if translation is not None:
+            return translation, True
+        return self._translate_phrases(body)
+
+    def _translate_phrases(self, body):
+        text = fold(body)
+        pieces = []
+        unmatched = []
+        position = 0
+        gap_start = 0
+
+        def flush_gap(end):
+            gap = body[gap_start:end]
+            if gap:
+                pieces.append(gap)
+                if not FILLER.match(gap):
+                    unmatched.append(gap)
+
+        while position < len(text):
+            match = None
+            if position == 0 or not (is_word_char(text[position - 1])
+                                     and is_word_char(text[position])):
+                match = self._longest_match(text, position)
+            if match is None:
+                position += 1
+                continue
+            flush_gap(position)
+            end, translation = match
+            # 区切りなしで続く訳語（日本語 -> 英語）の間には空白を入れる
+            if pieces and is_word_char(pieces[-1][-1:]) and is_word_char(translation[:1]):
+                pieces.append(' ')
+            pieces.append(translation)
+            position = gap_start = end
+        flush_gap(len(body))
+
+        if len(pieces) == 1 and not unmatched and pieces[0] == body:
+            return body, False
+        return ''.join(pieces), not unmatched
+
+    def translate(self, prompt):
+        """プロンプト全体をタグ単位で翻訳して TagResult を返す"""
+        tags = []
+        unresolved = []
+        for tag in prompt.split(TAG_SEPARATOR):
+            head, body, tail = split_emphasis(tag)
+            if not body or (self.source and not self.source(body)):
+                tags.append(tag)
+                continue
+            translation, complete = self.translate_tag(body)
+            if not complete:
+                unresolved.append(body)
+            tags.append(head + translation + tail)
+        return TagResult(TAG_SEPARATOR.join(tags), unresolved)
+
+
+# 方向ごとの翻訳器（同じプロセス内で共有）
+_translators = {}
+
+
+def get_translator(direction):
+    """'en-ja' / 'ja-en' の翻訳器を返す"""
+    translator = _translators.get(direction)
+    if translator is None:
+        load, _, source = DIRECTIONS[direction]
+        translator = _translators[direction] = TagTranslator(
+            load(), source, open_memory(), direction)
+    return translator
+
+
+def read_target_rows(store, path):
+    """対象行を列挙したTSV（find_*.py の出力形式）に一致する行IDを返す"""
+    row_ids = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.rstrip('\n').split('\t')
+            if len(parts) < 4:
+                continue
+            for row_id in store.find(parts[0], parts[1], parts[2]):
+                if store.prompts[row_id] == parts[3]:
+                    row_ids.append(row_id)
+    return row_ids
+
+
+def translate_rows(store, row_ids, direction, partial=False):
+    """
+    行の対象列（en-ja は小項目、ja-en はPrompt）をまとめて翻訳してストアを更新
+
+    (翻訳した行数, 訳しきれなかった行の (行ID, 未翻訳タグ) リスト) を返す。
+    翻訳元の言語の文字を含まない行は対象外。partial=False の場合、訳しきれなかった行は変更しない
+    """
+    translator = get_translator(direction)
+    _, column, source = DIRECTIONS[direction]
+    translated = 0
+    incomplete = []
+
+    for row_id in row_ids:
+        original = store.row(row_id)[column]
+        if not source(original):
+            continue
+        result = translator.translate(original)
+        if not result.complete:
+            incomplete.append((row_id, result.unresolved))
+            if not partial:
+                continue
+        if result.text == original:
+            continue
+        if column == 2:
+            store.update(row_id, small=result.text)
+        else:
+            store.update(row_id, prompt=result.text)
+        translated += 1
+
+    return translated, incomplete
+
+
+def main():
+    parser = argparse.ArgumentParser(description='プロンプト・小項目をタグ単位で一括翻訳')
+    parser.add_argument('direction', choices=sorted(DIRECTIONS),
+                        help='en-ja: 小項目を日本語に / ja-en: Promptを英語に')
+    parser.add_argument('--file', help='対象行を列挙したTSV（省略時は --major / --middle で絞り込んだ全行）')
+    parser.add_argument('--major', help='対象の大項目')
+    parser.add_argument('--middle', help='対象の中項目')
+    parser.add_argument('--partial', action='store_true', help='一部のタグしか訳せなかった行も書き換える')
+    parser.add_argument('--dry-run', action='store_true', help='翻訳結果を表示するだけで書き込まない')
+    parser.add_argument('--no-backup', action='store_true', help='処理前のバックアップを作成しない')
+    add_arguments(parser)
+    args = parser.parse_args()
+    # --dry-run は翻訳結果の確認が目的なので、行ごとの結果を常に表示する
+    args.verbose = args.verbose or args.dry_run
+    report = RunReport.from_args('tag_translator', args)
+
+    with report.stage('load'):
+        store = MasterStore.load(MASTER_FILE)
+        if args.file:
+            row_ids = read_target_rows(store, args.file)
+        else:
+            row_ids = store.query(major=args.major, middle=args.middle)
+    _, column, _ = DIRECTIONS[args.direction]
+
+    before = {row_id: store.row(row_id)[column] for row_id in row_ids}
+    with report.stage('translate'):
+        translated, incomplete = translate_rows(store, row_ids, args.direction, args.partial)
+    report.count('rows', len(row_ids))
+    report.count('translated', translated)
+    report.count('incomplete', len(incomplete))
+
+    for row_id in row_ids:
+        after = store.row(row_id)[column]
+        if after != before[row_id]:
+            report.detail(f"翻訳: {before[row_id]} -> {after}")
+    for row_id, unresolved in incomplete:
+        report.detail(f"翻訳辞書なし（要手動確認）: {before[row_id]}  [{', '.join(unresolved)}]")
+
+    print(f"\n対象 {len(row_ids)} 行 / 翻訳 {translated} 行 / 要手動確認 {len(incomplete)} 行")
+    memory_report = open_memory().report()
+    if memory_report:
+        print(memory_report)
+
+    if not args.dry_run and translated:
+        if not args.no_backup:
+            with report.stage('backup'):
+                snapshot_id = backup_file(MASTER_FILE, 'before_tag_translation')
+            print(f"バックアップ作成: {snapshot_id}")
+        with report.stage('write'):
+            store.commit()
+        print("マスターデータ.tsvを更新しました")
+    report.finish(MASTER_FILE)
+
+
+if __name__ == '__main__':
+    main()
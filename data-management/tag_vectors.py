@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+プロンプトをタグIDの配列（タグベクトル）に変換するモジュール
+
+"ore no imouto ga ..., 1girl, kousaka_kirino, orange hair|brown hair, (pink hairclip)" のような
+プロンプトを一度だけ解析し、各タグを正規化してプロセス共通の語彙でIDに置き換える。
+強調の段数、"|" の候補グループ、重みも失わずに1行1つの array('Q') に詰めて保持するため、
+分析処理（性別推定・名前抽出・重複検出など）は正規表現を使わずに整数の配列で処理できる。
+
+強調は {} と () を +1、[] を -1 として数え、カンマをまたぐ括弧（"{1girl, name, series}"）にも対応する。
+重みは "(tag:1.2)" / "tag:1.2" / "1.2::tag::" の形式を読み取る。
+
+マスターデータの各行のタグベクトルは MasterStore の派生列としてキャッシュされる。
+
+    python3 tag_vectors.py "1girl, {{kousaka_kirino}}, orange hair|brown hair, (pink hairclip:1.2)"
+    python3 tag_vectors.py --stats
+"""
+
+import argparse
+import re
+import sys
+import time
+from array import array
+
+from master_store import MASTER_FILE, MasterStore
+
+# NovelAI形式の数値重み（1.2::tag::）
+NAI_WEIGHT = re.compile(r'^(-?\d+(?:\.\d+)?)::(.*?)(?:::)?$', re.S)
+# SD形式の重み（tag:1.2）
+SD_WEIGHT = re.compile(r'^(.*?):(-?\d+(?:\.\d+)?)$', re.S)
+
+OPENERS = {'{': 1, '(': 1, '[': -1}
+CLOSERS = {'}': '{', ')': '(', ']': '['}
+
+# 1エントリ（64bit）の構成: タグID 32bit | 重み×100 16bit | 候補グループ 8bit | 強調+128 8bit
+ID_SHIFT = 32
+WEIGHT_SHIFT = 16
+GROUP_SHIFT = 8
+EMPHASIS_OFFSET = 128
+DEFAULT_WEIGHT = 100
+
+
+def normalize_tag(text):
+    """語彙のキー（小文字化・"_" を空白に・連続空白を1つに）"""
+    return ' '.join(text.lower().replace('_', ' ').split())
+
+
+class TagVocabulary:
+    """正規化したタグ <-> 整数ID"""
+
+    def __init__(self):
+        self.ids = {}
+        self.tags = []
+
+    def __len__(self):
+        return len(self.tags)
+
+    def intern(self, tag):
+        """タグのIDを返す（未登録なら登録）"""
+        tag_id = self.ids.get(tag)
+        if tag_id is None:
+            tag_id = self.ids[tag] = len(self.tags)
+            self.tags.append(sys.intern(tag))
+        return tag_id
+
+    def get(self, tag):
+        """登録済みタグのID（なければNone）"""
+        return self.ids.get(normalize_tag(tag))
+
+    def tag(self, tag_id):
+        return self.tags[tag_id]
+
+
+# プロセス共通の語彙
+VOCABULARY = TagVocabulary()
+
+
+class TagVector:
+    """1つのプロンプトのタグ列（64bit整数の配列）"""
+
+    __slots__ = ('entries',)
+
+    def __init__(self, entries=None):
+        self.entries = entries if entries is not None else array('Q')
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        """(タグID, 強調の段数, 重み, 候補グループ) を順に返す"""
+        for entry in self.entries:
+            yield (entry >> ID_SHIFT,
+                   (entry & 0xFF) - EMPHASIS_OFFSET,
+                   ((entry >> WEIGHT_SHIFT) & 0xFFFF) / 100,
+                   (entry >> GROUP_SHIFT) & 0xFF)
+
+    def __eq__(self, other):
+        return isinstance(other, TagVector) and self.entries == other.entries
+
+    def __hash__(self):
+        return hash(self.entries.tobytes())
+
+    def append(self, tag_id, emphasis=0, weight=1.0, group=0):
+        emphasis = max(-EMPHASIS_OFFSET, min(EMPHASIS_OFFSET - 1, emphasis))
+        weight = max(0, min(0xFFFF, round(weight * 100)))
+        self.entries.append((tag_id << ID_SHIFT) | (weight << WEIGHT_SHIFT)
+                            | ((group & 0xFF) << GROUP_SHIFT) | (emphasis + EMPHASIS_OFFSET))
+
+    def ids(self):
+        """タグIDのリスト（出現順）"""
+        return [entry >> ID_SHIFT for entry in self.entries]
+
+    def tag_set(self):
+        """タグIDの集合（順序・強調・重みを無視した比較用）"""
+        return frozenset(entry >> ID_SHIFT for entry in self.entries)
+
+    def alternatives(self):
+        """候補グループごとのタグIDのリスト（"a|b" は1グループ）"""
+        groups = []
+        last = None
+        for entry in self.entries:
+            group = (entry >> GROUP_SHIFT) & 0xFF
+            if group != last:
+                groups.append([])
+                last = group
+            groups[-1].append(entry >> ID_SHIFT)
+        return groups
+
+    def split_first(self):
+        """(先頭の候補グループのタグID, 残りのタグID) を返す（先頭タグは多くの場合キャラクター名）"""
+        entries = self.entries
+        if not entries:
+            return [], []
+        first_group = (entries[0] >> GROUP_SHIFT) & 0xFF
+        count = 1
+        while count < len(entries) and (entries[count] >> GROUP_SHIFT) & 0xFF == first_group:
+            count += 1
+        return ([entry >> ID_SHIFT for entry in entries[:count]],
+                [entry >> ID_SHIFT for entry in entries[count:]])
+
+    def emphasized(self, minimum=1):
+        """強調の段数が minimum 以上のタグID（出現順）"""
+        return [entry >> ID_SHIFT for entry in self.entries
+                if (entry & 0xFF) - EMPHASIS_OFFSET >= minimum]
+
+    def tags(self, vocabulary=VOCABULARY):
+        """正規化したタグ文字列のリスト"""
+        return [vocabulary.tags[entry >> ID_SHIFT] for entry in self.entries]
+
+
+def _split_weight(body):
+    """タグ本体から重みを取り出して (本体, 重み) を返す"""
+    if ':' not in body:
+        return body, 1.0
+    match = NAI_WEIGHT.match(body)
+    if match:
+        return match.group(2), float(match.group(1))
+    match = SD_WEIGHT.match(body)
+    if match and match.group(1):
+        return match.group(1), float(match.group(2))
+    return body, 1.0
+
+
+def parse_prompt(prompt, vocabulary=VOCABULARY):
+    """
+    プロンプトを TagVector に変換
+
+    カンマで区切った各タグの前後の括弧で強調の深さを更新し、タグの強調の段数は
+    タグを開いた時点の {} / () の深さから [] の深さを引いたものとする
+    """
+    entries = array('Q')
+    intern = vocabulary.intern
+    depth = {'{': 0, '(': 0, '[': 0}
+    group = 0
+
+    for part in prompt.split(','):
+        body = part.strip()
+        if not body:
+            continue
+
+        # 前の開き括弧
+        start = 0
+        while start < len(body) and body[start] in OPENERS:
+            depth[body[start]] += 1
+            start += 1
+        if start:
+            body = body[start:]
+        emphasis = depth['{'] + depth['('] - depth['[']
+
+        # 後の閉じ括弧（"name (series)" の括弧は本体に残す）
+        end = len(body)
+        while end > 0 and body[end - 1] in CLOSERS:
+            opener = CLOSERS[body[end - 1]]
+            if opener == '(' and body.count('(', 0, end) >= body.count(')', 0, end):
+                break
+            depth[opener] = max(0, depth[opener] - 1)
+            end -= 1
+        if end < len(body):
+            body = body[:end]
+
+        body, weight = _split_weight(body.strip())
+        # 強調・重みはエントリに入る範囲に丸める
+        low = (max(0, min(0xFFFF, round(weight * 100))) << WEIGHT_SHIFT
+               | (group & 0xFF) << GROUP_SHIFT
+               | max(0, min(0xFF, emphasis + EMPHASIS_OFFSET)))
+        added = False
+        for alternative in body.split('|'):
+            alternative = normalize_tag(alternative)
+            if alternative:
+                entries.append(intern(alternative) << ID_SHIFT | low)
+                added = True
+        if added:
+            group += 1
+
+    return TagVector(entries)
+
+
+def store_vectors(store):
+    """マスターデータの各行（行ID順）の TagVector。ストアの派生列としてキャッシュされる"""
+    return store.derived('tag_vectors', lambda row: parse_prompt(row[3]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='プロンプトのタグベクトル化')
+    parser.add_argument('prompts', nargs='*', help='解析するプロンプト')
+    parser.add_argument('--stats', action='store_true', help='マスターデータ全体の解析結果を集計')
+    args = parser.parse_args()
+
+    for prompt in args.prompts:
+        vector = parse_prompt(prompt)
+        for tag_id, emphasis, weight, group in vector:
+            print(f"[{group}] {VOCABULARY.tag(tag_id)}  強調 {emphasis:+d}  重み {weight:g}")
+
+    if args.stats:
+        store = MasterStore.load(MASTER_FILE)
+        start = time.perf_counter()
+        vectors = store_vectors(store)
+        elapsed = time.perf_counter() - start
+        total = sum(len(vector) for vector in vectors)
+        size = sum(vector.entries.itemsize * len(vector.entries) for vector in vectors)
+        print(f"{len(vectors)}行 / タグ {total}個（異なるタグ {len(VOCABULARY)}種） / "
+              f"配列 {size // 1024} KB / 解析 {elapsed * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+全データのタグ語彙と出現統計
+
+マスターデータ.tsv・追加希望.tsv・未登録項目.tsv を1行ずつ読み、Prompt を tag_vectors.py で
+正規化したタグに分けて共通の語彙に登録しながら、タグごとに次の値を集計する。
+
+- 出現回数（同じ行に2回あれば2回）と出現行数
+- 大項目ごとの出現行数
+- 最初に現れた位置（ファイルと行番号）
+
+結果は data-management/tag-vocabulary.json（Git管理外）に出力し、分類・翻訳・入力補完から
+タグ文字列の分割をやり直さずに参照できるようにする（TagStats.load で読み込める）。
+集計元のTSVのほうが新しい場合、top・show は集計し直してから表示する。
+
+    python3 tag_vocabulary.py build
+    python3 tag_vocabulary.py top --major 服装 -n 20
+    python3 tag_vocabulary.py show "long hair" 1girl
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+from import_additions import UNREGISTERED_FILE, WISH_FILE
+from master_store import MASTER_FILE
+from tag_vectors import VOCABULARY, normalize_tag, parse_prompt
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+VOCABULARY_FILE = os.path.join(BASE_DIR, 'tag-vocabulary.json')
+VOCABULARY_VERSION = 1
+
+# 集計する TSV（この順に読み、最初に現れた位置もこの順で決まる）
+SOURCES = (MASTER_FILE, WISH_FILE, UNREGISTERED_FILE)
+
+
+def read_rows(path):
+    """
+    TSVを1行ずつ読み、(行番号, 大項目, Prompt) を返す
+
+    4列以上の行は 大項目, 中項目, 小項目, Prompt、2〜3列の行（追加希望.tsv の省略形）は
+    最後の列を Prompt とし、大項目は空文字列とする
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            parts = line.rstrip('\r\n').split('\t')
+            if len(parts) >= 4:
+                yield line_num, parts[0], parts[3]
+            elif len(parts) >= 2:
+                yield line_num, '', parts[-1]
+
+
+class TagStats:
+    """タグ -> 出現回数・出現行数・大項目ごとの行数・最初に現れた位置"""
+
+    def __init__(self, sources=()):
+        self.sources = [os.path.basename(path) for path in sources]
+        self.tags = []
+        self.ids = {}
+        self.counts = []
+        self.rows = []
+        self.majors = []
+        # (ファイル番号, 行番号)
+        self.first_seen = []
+
+    @classmethod
+    def build(cls, sources=SOURCES, vocabulary=VOCABULARY):
+        """TSVを順に読んで集計する（タグIDは語彙 vocabulary のもの）"""
+        stats = cls(sources)
+        # 語彙のタグID -> この集計での番号（語彙には他の処理で登録されたタグもあるため分ける）
+        indexes = {}
+        for source_index, path in enumerate(sources):
+            for line_num, major, prompt in read_rows(path):
+                for tag_id, count in Counter(parse_prompt(prompt, vocabulary).ids()).items():
+                    index = indexes.get(tag_id)
+                    if index is None:
+                        index = indexes[tag_id] = len(stats.tags)
+                        stats.tags.append(vocabulary.tag(tag_id))
+                        stats.ids[vocabulary.tag(tag_id)] = index
+                        stats.counts.append(0)
+                        stats.rows.append(0)
+                        stats.majors.append(Counter())
+                        stats.first_seen.append((source_index, line_num))
+                    stats.counts[index] += count
+                    stats.rows[index] += 1
+                    if major:
+                        stats.majors[index][major] += 1
+        return stats
+
+    def __len__(self):
+        return len(self.tags)
+
+    def get(self, tag):
+        """タグ（正規化前でもよい）の (出現回数, 出現行数, 大項目 Counter, (ファイル名, 行番号))。なければNone"""
+        index = self.ids.get(normalize_tag(tag))
+        if index is None:
+            return None
+        source_index, line_num = self.first_seen[index]
+        return (self.counts[index], self.rows[index], self.majors[index],
+                (self.sources[source_index], line_num))
+
+    def top(self, major=None, limit=20):
+        """出現行数の多いタグ（major 指定時はその大項目での行数）を (タグ, 行数) のリストで返す"""
+        if major is None:
+            counts = self.rows
+        else:
+            counts = [majors.get(major, 0) for majors in self.majors]
+        order = sorted((index for index, count in enumerate(counts) if count),
+                       key=lambda index: (-counts[index], self.tags[index]))
+        return [(self.tags[index], counts[index]) for index in order[:limit]]
+
+    # ============================================
+    # 出力・読み込み
+    # ============================================
+
+    def to_json(self):
+        """
+        出力用のJSON文字列
+
+        タグは出現行数の多い順に並べ、大項目は文字列テーブルの番号で
+        [大項目番号, 行数, 大項目番号, 行数, ...] の平たい配列にする
+        """
+        order = sorted(range(len(self.tags)), key=lambda index: (-self.rows[index], self.tags[index]))
+        major_names = sorted({major for majors in self.majors for major in majors})
+        major_ids = {major: major_id for major_id, major in enumerate(major_names)}
+
+        def flatten_majors(majors):
+            flat = []
+            for major, count in sorted(majors.items(), key=lambda item: (-item[1], item[0])):
+                flat += [major_ids[major], count]
+            return flat
+
+        data = {
+            'version': VOCABULARY_VERSION,
+            'sources': self.sources,
+            'majors': major_names,
+            'tags': [self.tags[index] for index in order],
+            'counts': [self.counts[index] for index in order],
+            'rows': [self.rows[index] for index in order],
+            'tagMajors': [flatten_majors(self.majors[index]) for index in order],
+            'firstSeen': [list(self.first_seen[index]) for index in order],
+        }
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+    @classmethod
+    def load(cls, path=VOCABULARY_FILE):
+        """to_json で出力したファイルを読み込む"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != VOCABULARY_VERSION:
+            raise ValueError(f"{os.path.basename(path)}: 未対応のバージョンです: {data.get('version')}")
+        stats = cls()
+        stats.sources = data['sources']
+        stats.tags = data['tags']
+        stats.ids = {tag: index for index, tag in enumerate(stats.tags)}
+        stats.counts = data['counts']
+        stats.rows = data['rows']
+        major_names = data['majors']
+        stats.majors = [Counter({major_names[flat[i]]: flat[i + 1] for i in range(0, len(flat), 2)})
+                        for flat in data['tagMajors']]
+        stats.first_seen = [tuple(position) for position in data['firstSeen']]
+        return stats
+
+
+def is_fresh(path=VOCABULARY_FILE):
+    """語彙ファイルが集計元のどのTSVよりも新しいか"""
+    if not os.path.exists(path):
+        return False
+    built = os.path.getmtime(path)
+    return all(os.path.getmtime(source) <= built for source in SOURCES if os.path.exists(source))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='タグ語彙と出現統計')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='TSVを集計して語彙ファイルを出力')
+    build_parser.add_argument('--output', default=VOCABULARY_FILE, help='出力先')
+
+    top_parser = subparsers.add_parser('top', help='出現行数の多いタグを表示')
+    top_parser.add_argument('--major', help='この大項目での出現行数で並べる')
+    top_parser.add_argument('-n', type=int, default=20, help='表示件数')
+
+    show_parser = subparsers.add_parser('show', help='タグの統計を表示')
+    show_parser.add_argument('tags', nargs='+')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        stats = TagStats.build()
+        content = stats.to_json()
+        with open(args.output, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(content)
+        print(f"出力しました: {args.output}（タグ {len(stats)}種、{len(content.encode('utf-8')) // 1024} KB）")
+        return
+
+    stats = TagStats.load() if is_fresh(VOCABULARY_FILE) else TagStats.build()
+    if args.command == 'top':
+        for tag, count in stats.top(args.major, args.n):
+            print(f"{count:6d}  {tag}")
+    elif args.command == 'show':
+        for tag in args.tags:
+            entry = stats.get(tag)
+            if entry is None:
+                print(f"{tag}: 未登録")
+                continue
+            count, rows, majors, (source, line_num) = entry
+            distribution = '、'.join(f"{major} {n}" for major, n in majors.most_common(5))
+            print(f"{tag}: {count}回 / {rows}行（{distribution}） 初出 {source}:{line_num}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻訳辞書（translations/*.tsv）の読み込みと検索
+
+辞書は「原語<TAB>訳語」の TSV で管理し（# で始まる行はコメント）、同じ原語が複数あれば
+後の行が優先される。読み込んだ辞書は translations/.cache/ に marshal 形式で保存し、
+TSV が更新されていなければ次回からはキャッシュを読み込むだけで使える。
+
+検索は完全一致を優先し、見つからなければ大文字小文字を区別しない（casefold）一致を試す。
+"""
+
+import hashlib
+import marshal
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TRANSLATIONS_DIR = os.path.join(BASE_DIR, 'translations')
+CACHE_DIR = os.path.join(TRANSLATIONS_DIR, '.cache')
+
+EN_JA_FILE = os.path.join(TRANSLATIONS_DIR, 'en_ja.tsv')
+JA_EN_FILE = os.path.join(TRANSLATIONS_DIR, 'ja_en.tsv')
+
+# キャッシュ形式を変えたら上げる
+CACHE_VERSION = 2
+
+# パス -> 読み込み済みの辞書（同じプロセス内で共有）
+_loaded = {}
+
+
+class TranslationDictionary:
+    """原語 -> 訳語 の辞書（完全一致 + casefold 一致）"""
+
+    def __init__(self, entries=None, folded=None, revision=''):
+        self.entries = dict(entries or {})
+        self.folded = folded if folded is not None else self._fold(self.entries)
+        # 辞書TSVの内容ハッシュ（翻訳メモリの有効判定に使う）
+        self.revision = revision
+
+    @staticmethod
+    def _fold(entries):
+        """casefold したキーの辞書（小文字のみのキーを優先）"""
+        folded = {}
+        for key, value in entries.items():
+            folded_key = key.casefold()
+            if folded_key not in folded or key == folded_key:
+                folded[folded_key] = value
+        return folded
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, text):
+        return text in self.entries or text.casefold() in self.folded
+
+    def get(self, text, default=None):
+        """訳語を返す（見つからなければ default）"""
+        value = self.entries.get(text)
+        if value is None:
+            value = self.folded.get(text.casefold())
+        return default if value is None else value
+
+    def translate(self, text):
+        """訳語を返す（見つからなければ元の文字列）"""
+        return self.get(text, text)
+
+    def items(self):
+        return self.entries.items()
+
+
+def read_tsv(path):
+    """辞書TSVを読み込んで (原語 -> 訳語 の辞書, 内容ハッシュ) を返す"""
+    entries = {}
+    with open(path, 'rb') as f:
+        data = f.read()
+    for line_num, line in enumerate(data.decode('utf-8').split('\n'), 1):
+        line = line.rstrip('\r')
+        if not line or line.startswith('#'):
+            continue
+        parts = line.split('\t')
+        if len(parts) != 2:
+            raise ValueError(f"{os.path.basename(path)}:{line_num}: 2列のTSVではありません: {line}")
+        entries[parts[0]] = parts[1]
+    return entries, hashlib.sha1(data).hexdigest()[:12]
+
+
+def _cache_path(path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(CACHE_DIR, name + '.marshal')
+
+
+def _read_cache(path, stat):
+    try:
+        with open(_cache_path(path), 'rb') as f:
+            version, mtime_ns, size, revision, entries, folded = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != CACHE_VERSION or mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+        return None
+    return TranslationDictionary(entries, folded, revision)
+
+
+def _write_cache(path, stat, dictionary):
+    cache_path = _cache_path(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temp_path = cache_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            marshal.dump((CACHE_VERSION, stat.st_mtime_ns, stat.st_size, dictionary.revision,
+                          dictionary.entries, dictionary.folded), f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # キャッシュが書けなくても辞書は使える
+        pass
+
+
+def load_dictionary(path):
+    """辞書TSVを読み込む（プロセス内・ディスク上のキャッシュを利用）"""
+    path = os.path.abspath(path)
+    dictionary = _loaded.get(path)
+    if dictionary is not None:
+        return dictionary
+
+    stat = os.stat(path)
+    dictionary = _read_cache(path, stat)
+    if dictionary is None:
+        entries, revision = read_tsv(path)
+        dictionary = TranslationDictionary(entries, revision=revision)
+        _write_cache(path, stat, dictionary)
+
+    _loaded[path] = dictionary
+    return dictionary
+
+
+def english_to_japanese():
+    """英語 -> 日本語 辞書"""
+    return load_dictionary(EN_JA_FILE)
+
+
+def japanese_to_english():
+    """日本語 -> 英語 辞書"""
+    return load_dictionary(JA_EN_FILE)
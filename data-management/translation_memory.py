@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻訳スクリプト共通の翻訳メモリ（SQLite）
+
+正規化した原文と翻訳方向（'en-ja' / 'ja-en'）をキーに訳文を保存し、
+同じ文字列を再び翻訳するときは辞書・トライの照合を行わずにメモリから返す。
+
+- 辞書から求めた訳には辞書TSVの内容ハッシュ（revision）を記録し、辞書が変わったら使わない
+- 手動・外部サービスの訳は revision なしで保存し、常に有効
+- 訳せなかった結果も保存するので、訳せない文字列も毎回照合し直さない
+- ヒット・ミス数は実行ごとに集計し、累計を stats テーブルに保存する
+- export で拡張機能用の検索表（assets/master/translation-memory.json）を出力する
+
+    python3 translation_memory.py stats
+    python3 translation_memory.py export
+    python3 translation_memory.py add ja-en 見える空気 "visible air"
+    python3 translation_memory.py prune
+"""
+
+import argparse
+import atexit
+import json
+import os
+import re
+import sqlite3
+import unicodedata
+from datetime import datetime
+
+from translation_dict import english_to_japanese, japanese_to_english
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MEMORY_FILE = os.path.join(BASE_DIR, 'translation_memory.sqlite')
+EXPORT_FILE = os.path.join(os.path.dirname(BASE_DIR), 'assets', 'master', 'translation-memory.json')
+EXPORT_VERSION = 1
+
+# 翻訳方向 -> 辞書の読み込み関数
+DICTIONARIES = {
+    'en-ja': english_to_japanese,
+    'ja-en': japanese_to_english,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory (
+    direction TEXT NOT NULL,
+    source_key TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    complete INTEGER NOT NULL,
+    revision TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    PRIMARY KEY (direction, source_key)
+);
+CREATE TABLE IF NOT EXISTS stats (
+    direction TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL,
+    misses INTEGER NOT NULL
+);
+"""
+
+
+def normalize_key(text):
+    """メモリのキー（NFKC・小文字化・"_" を空白に・連続空白を1つに）。拡張機能側と同じ正規化"""
+    text = unicodedata.normalize('NFKC', text).lower().replace('_', ' ')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class TranslationMemory:
+    """翻訳メモリ。書き込みは flush() でまとめて反映する"""
+
+    def __init__(self, path=MEMORY_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        # 方向 -> {キー: (訳文, 訳し終えたか, revision)}（初回参照時に読み込む）
+        self._entries = {}
+        # 未保存の行
+        self._pending = {}
+        self.hits = {}
+        self.misses = {}
+
+    def _load(self, direction):
+        entries = self._entries.get(direction)
+        if entries is None:
+            entries = self._entries[direction] = {}
+            rows = self.conn.execute(
+                'SELECT source_key, target, complete, revision FROM memory WHERE direction = ?',
+                (direction,))
+            for key, target, complete, revision in rows:
+                entries[key] = (target, bool(complete), revision)
+        return entries
+
+    def lookup(self, direction, text, revision=''):
+        """
+        保存済みの (訳文, 訳し終えたか) を返す（なければNone）
+
+        revision を指定した場合、別の revision の辞書で求めた訳は使わない
+        """
+        entry = self._load(direction).get(normalize_key(text))
+        if entry is not None and (not entry[2] or entry[2] == revision):
+            self.hits[direction] = self.hits.get(direction, 0) + 1
+            return entry[0], entry[1]
+        self.misses[direction] = self.misses.get(direction, 0) + 1
+        return None
+
+    def remember(self, direction, text, target, complete=True, revision='', origin='manual'):
+        """訳文を保存（flush まではメモリ上のみ）"""
+        key = normalize_key(text)
+        if not key:
+            return
+        self._load(direction)[key] = (target, complete, revision)
+        self._pending[(direction, key)] = (
+            direction, key, text, target, int(complete), revision, origin,
+            datetime.now().isoformat(timespec='seconds'))
+
+    def flush(self):
+        """未保存の訳文と今回のヒット・ミス数を書き込む"""
+        with self.conn:
+            if self._pending:
+                self.conn.executemany(
+                    'INSERT OR REPLACE INTO memory VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    self._pending.values())
+                self._pending.clear()
+            for direction in set(self.hits) | set(self.misses):
+                self.conn.execute(
+                    'INSERT INTO stats VALUES (?, ?, ?) ON CONFLICT(direction) DO UPDATE SET '
+                    'hits = hits + excluded.hits, misses = misses + excluded.misses',
+                    (direction, self.hits.get(direction, 0), self.misses.get(direction, 0)))
+        self.hits.clear()
+        self.misses.clear()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def report(self):
+        """今回の実行のヒット・ミス数を表示用の文字列で返す"""
+        lines = []
+        for direction in sorted(set(self.hits) | set(self.misses)):
+            hits = self.hits.get(direction, 0)
+            misses = self.misses.get(direction, 0)
+            rate = hits / (hits + misses) * 100
+            lines.append(f"翻訳メモリ {direction}: ヒット {hits} / ミス {misses}（ヒット率 {rate:.1f}%）")
+        return '\n'.join(lines)
+
+    def summary(self):
+        """方向ごとの (件数, 累計ヒット, 累計ミス)"""
+        counts = dict(self.conn.execute(
+            'SELECT direction, COUNT(*) FROM memory GROUP BY direction'))
+        totals = {direction: (hits, misses) for direction, hits, misses
+                  in self.conn.execute('SELECT direction, hits, misses FROM stats')}
+        return {direction: (counts.get(direction, 0),) + totals.get(direction, (0, 0))
+                for direction in sorted(set(counts) | set(totals))}
+
+    def prune(self, revisions):
+        """辞書が更新されて使われなくなった訳を削除し、削除件数を返す"""
+        removed = 0
+        with self.conn:
+            for direction, revision in revisions.items():
+                cursor = self.conn.execute(
+                    "DELETE FROM memory WHERE direction = ? AND revision != '' AND revision != ?",
+                    (direction, revision))
+                removed += cursor.rowcount
+        self._entries.clear()
+        return removed
+
+    def export_entries(self, direction):
+        """訳し終えた訳文の {キー: 訳文}"""
+        return {key: target for key, target in self.conn.execute(
+            'SELECT source_key, target FROM memory WHERE direction = ? AND complete = 1 '
+            'ORDER BY source_key', (direction,))}
+
+
+_memory = None
+
+
+def open_memory():
+    """プロセス共通の翻訳メモリを開く（終了時に自動で flush）"""
+    global _memory
+    if _memory is None:
+        _memory = TranslationMemory()
+        atexit.register(_memory.close)
+    return _memory
+
+
+def build_export(memory):
+    """拡張機能用の検索表（辞書 + 翻訳メモリ）のJSON文字列を生成"""
+    directions = {}
+    for direction, load in sorted(DICTIONARIES.items()):
+        entries = {}
+        for source, target in load().items():
+            key = normalize_key(source)
+            if key:
+                entries.setdefault(key, target)
+        entries.update(memory.export_entries(direction))
+        # 原文のままの訳は拡張機能では役に立たないので含めない
+        directions[direction] = {key: target for key, target in sorted(entries.items())
+                                 if normalize_key(target) != key}
+    return json.dumps({'version': EXPORT_VERSION, 'directions': directions},
+                      ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='翻訳メモリの管理')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('stats', help='件数と累計ヒット・ミス数を表示')
+
+    export_parser = subparsers.add_parser('export', help='拡張機能用の検索表を出力')
+    export_parser.add_argument('--output', default=EXPORT_FILE, help='出力先')
+
+    add_parser = subparsers.add_parser('add', help='訳文を手動で登録')
+    add_parser.add_argument('direction', choices=sorted(DICTIONARIES))
+    add_parser.add_argument('source')
+    add_parser.add_argument('target')
+
+    subparsers.add_parser('prune', help='古い辞書で求めた訳を削除')
+
+    args = parser.parse_args()
+    memory = TranslationMemory()
+
+    if args.command == 'stats':
+        for direction, (count, hits, misses) in memory.summary().items():
+            total = hits + misses
+            rate = hits / total * 100 if total else 0.0
+            print(f"{direction}: {count}件 / 累計ヒット {hits} / 累計ミス {misses}（ヒット率 {rate:.1f}%）")
+    elif args.command == 'export':
+        content = build_export(memory)
+        with open(args.output, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(content)
+        print(f"出力しました: {args.output}（{len(content.encode('utf-8')) // 1024} KB）")
+    elif args.command == 'add':
+        memory.remember(args.direction, args.source, args.target)
+        print(f"登録しました: {args.source} -> {args.target}")
+    elif args.command == 'prune':
+        revisions = {direction: load().revision for direction, load in DICTIONARIES.items()}
+        print(f"{memory.prune(revisions)}件を削除しました")
+
+    memory.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,10 @@ const AppState = {
   config: {
     toolVersion: 5,
     masterVersion: 0,
+    // 保存済みのマスターのリリース番号（差分パッケージの適用元、不明ならnull）
+    masterRelease: null,
+    // マスターの取得元（"default" | "shards" | "import"）
+    masterSource: "default",
   },
 
   // データ
@@ -52,10 +52,11 @@ const categoryData = {
       // 重複チェック用のMapを使用（高速化）
       const uniqueKeys = [new Map(), new Map(), new Map()];
 
-      // データソースを結合
+      // データソースを結合（未読み込みのシャードはインデックスの大項目・中項目を使う）
       const allItems = [
         ...AppState.data.localPromptList,
         ...AppState.data.masterPrompts,
+        ...MasterShards.categoryItems(),
       ];
 
       // バッチ処理で効率化
@@ -274,12 +274,15 @@ async function validateAndActivateGenerateButton() {
 
 /**
  * マスタープロンプトを保存
+ * シャード読み込みモードでは行データは同梱のシャードから読むため、バージョンのみ保存
  */
 async function saveMasterPrompt() {
   try {
     await Storage.set({
-      masterPrompts: AppState.data.masterPrompts,
+      masterPrompts: MasterShards.lazy ? [] : AppState.data.masterPrompts,
       masterVersion: AppState.config.masterVersion,
+      masterRelease: AppState.config.masterRelease,
+      masterSource: AppState.config.masterSource,
     });
   } catch (error) {
     console.error("Failed to save master prompts:", error);
@@ -287,40 +290,208 @@ async function saveMasterPrompt() {
   }
 }
 
+// 一括版マスター（シャードが読み込めない場合のみ読み込む）
+const DEFAULT_MASTER_PATH = "assets/master/default-master.js";
+let defaultMasterLoading = null;
+
+/**
+ * 一括版の default-master.js を読み込む（初回のみ）
+ * サイドパネルは通常シャードを使うため、シャードのインデックスが読み込めない場合にだけ呼ぶ
+ * @returns {Promise<boolean>} defaultMaster が使用可能か
+ */
+function loadDefaultMaster() {
+  if (typeof defaultMaster !== "undefined") {
+    return Promise.resolve(true);
+  }
+  if (!defaultMasterLoading) {
+    defaultMasterLoading = new Promise((resolve) => {
+      const script = document.createElement("script");
+      script.src = DEFAULT_MASTER_PATH;
+      script.onload = () => resolve(typeof defaultMaster !== "undefined");
+      script.onerror = () => {
+        console.warn("Failed to load default master:", DEFAULT_MASTER_PATH);
+        defaultMasterLoading = null;
+        resolve(false);
+      };
+      document.head.appendChild(script);
+    });
+  }
+  return defaultMasterLoading;
+}
+
+/**
+ * 同梱されているマスターのバージョンを取得
+ * @returns {number|null}
+ */
+function getBundledMasterVersion() {
+  if (MasterShards.index) {
+    return MasterShards.getVersion();
+  }
+  return typeof defaultMaster !== "undefined" ? defaultMaster.version : null;
+}
+
+/**
+ * 同梱マスターのリリース番号を取得
+ * @returns {number|null}
+ */
+function getBundledMasterRelease() {
+  const release = MasterDelta.getRelease();
+  if (release != null) {
+    return release;
+  }
+  return typeof defaultMaster !== "undefined" && defaultMaster.release != null
+    ? defaultMaster.release
+    : null;
+}
+
+/**
+ * ストレージに保存済みの行（インポートしたマスター、シャードがない環境の同梱マスター）を
+ * 差分パッケージで最新リリースに更新
+ * 変更のあった行だけを書き換え、全行の再構築は行わない（シャード読み込み中は同梱の行を直接読むため不要）
+ * @returns {Promise<boolean>} 更新したか（差分で更新できない場合はfalse）
+ */
+async function updateMasterPromptsByDelta() {
+  const source = AppState.config.masterSource;
+  if ((source !== "import" && source !== "default") || MasterShards.lazy) {
+    return false;
+  }
+  await MasterDelta.loadIndex();
+  const storedRelease = AppState.config.masterRelease;
+  const bundledRelease = getBundledMasterRelease();
+  if (storedRelease == null || bundledRelease == null || storedRelease >= bundledRelease) {
+    return false;
+  }
+
+  const result = await MasterDelta.update(AppState.data.masterPrompts, storedRelease);
+  if (result == null) {
+    return false;
+  }
+  AppState.config.masterRelease = bundledRelease;
+  console.log(
+    `Updated ${source} master prompts from release ${storedRelease} to ${bundledRelease} ` +
+      `(${result.touched} rows, ${result.skipped} edited keys kept)`
+  );
+  return true;
+}
+
+/**
+ * 同梱マスターでマスタープロンプトを初期化
+ * シャードがあれば必要な大項目だけを遅延読み込みし、なければ読み込み済みのdefaultMasterを展開
+ * @returns {boolean} 初期化できたか
+ */
+function resetMasterPromptsToBundled() {
+  if (MasterShards.index) {
+    MasterShards.enable();
+    AppState.data.masterPrompts = [];
+    AppState.config.masterSource = "shards";
+  } else if (typeof defaultMaster !== "undefined" && defaultMaster.data) {
+    MasterShards.disable();
+    AppState.data.masterPrompts = expandDefaultMaster(defaultMaster);
+    AppState.config.masterSource = "default";
+  } else {
+    return false;
+  }
+  AppState.config.masterVersion = getBundledMasterVersion();
+  AppState.config.masterRelease = getBundledMasterRelease();
+  return true;
+}
+
+/**
+ * defaultMasterをマスタープロンプト配列に展開
+ * version 3（format: "compact"）は strings テーブル + 行タプル、
+ * それ以前は行ごとのオブジェクト形式
+ * @param {Object} master - defaultMaster
+ * @returns {Array} マスタープロンプト配列
+ */
+function expandDefaultMaster(master) {
+  const rows = master.data;
+  const prompts = new Array(rows.length);
+
+  if (master.format === "compact") {
+    const strings = master.strings;
+    for (let i = 0; i < rows.length; i++) {
+      const row = rows[i];
+      prompts[i] = {
+        prompt: row[3],
+        data: { 0: strings[row[0]], 1: strings[row[1]], 2: row[2] },
+        url: row[4] || "",
+      };
+    }
+  } else {
+    for (let i = 0; i < rows.length; i++) {
+      const data = rows[i];
+      prompts[i] = {
+        prompt: data[3],
+        data: { 0: data[0], 1: data[1], 2: data[2] },
+        url: data[4],
+      };
+    }
+  }
+
+  return prompts;
+}
+
 /**
  * マスタープロンプトを読み込み
  */
 async function loadMasterPrompt() {
   try {
-    const result = await Storage.get(["masterPrompts", "masterVersion"]);
+    const result = await Storage.get([
+      "masterPrompts",
+      "masterVersion",
+      "masterRelease",
+      "masterSource",
+    ]);
+    const hasShards = await MasterShards.loadIndex();
+    if (!hasShards) {
+      // シャードがない・読み込めない場合は一括版で初期化する
+      await loadDefaultMaster();
+    }
+    await MasterDelta.loadIndex();
+
+    // インポートしたマスター（またはシャードがない環境で保存済みのもの）はストレージを使う
+    const useStored =
+      result.masterPrompts &&
+      result.masterPrompts.length > 0 &&
+      (!hasShards || result.masterSource === "import");
 
-    if (result.masterPrompts && result.masterPrompts.length > 0) {
+    if (useStored) {
       AppState.data.masterPrompts = result.masterPrompts;
+      AppState.config.masterSource = result.masterSource || "default";
       console.log(`Loaded ${result.masterPrompts.length} master prompts from storage`);
-    } else {
-      // ストレージにデータがない場合、defaultMasterから初期化
-      console.log("No master prompts in storage, loading from defaultMaster");
-      if (typeof defaultMaster !== 'undefined' && defaultMaster.data) {
-        AppState.data.masterPrompts = [];
-        defaultMaster.data.forEach((data) => {
-          AppState.data.masterPrompts.push({
-            prompt: data[3],
-            data: { 0: data[0], 1: data[1], 2: data[2] },
-            url: data[4],
-          });
-        });
-        AppState.config.masterVersion = defaultMaster.version;
-        console.log(`Initialized ${AppState.data.masterPrompts.length} master prompts from defaultMaster`);
-        
-        // 初期化したデータを保存
+
+      if (result.masterVersion != null) {
+        AppState.config.masterVersion = result.masterVersion;
+      }
+      AppState.config.masterRelease = result.masterRelease ?? null;
+
+      // 保存済みの行は差分パッケージで最新リリースに更新
+      if (await updateMasterPromptsByDelta()) {
         await saveMasterPrompt();
+        debouncedCategoryUpdate();
+      }
+    } else if (resetMasterPromptsToBundled()) {
+      if (MasterShards.lazy) {
+        console.log(
+          `Master prompts will be loaded on demand (${MasterShards.index.total} rows in ${MasterShards.index.shards.length} shards)`
+        );
       } else {
-        console.warn("defaultMaster not available");
+        console.log(`Initialized ${AppState.data.masterPrompts.length} master prompts from defaultMaster`);
       }
-    }
 
-    if (result.masterVersion != null) {
-      AppState.config.masterVersion = result.masterVersion;
+      // 初期化した状態を保存（シャードの場合はストレージに残る古い行データを破棄）
+      const storedRows = result.masterPrompts ? result.masterPrompts.length : 0;
+      const needsSave =
+        result.masterVersion !== AppState.config.masterVersion ||
+        (result.masterRelease ?? null) !== AppState.config.masterRelease ||
+        result.masterSource !== AppState.config.masterSource ||
+        (MasterShards.lazy ? storedRows > 0 : storedRows === 0);
+      if (needsSave) {
+        await saveMasterPrompt();
+        debouncedCategoryUpdate();
+      }
+    } else {
+      console.warn("defaultMaster not available");
     }
   } catch (error) {
     console.error("Failed to load master prompts:", error);
@@ -659,11 +830,15 @@ function RegistItem(item, skipSave = false) {
  * @returns {Array} 検索結果
  */
 function Search(search, data) {
+  // シャード読み込みモードでは、呼び出し側で MasterShards.ensureForSearch を待っておくこと
+  // マスターは検索インデックスで候補行を絞り込む（使えない場合は全件）
+  const masterIds = search ? MasterSearchIndex.lookup(search) : null;
+  const masterPrompts = masterIds
+    ? MasterShards.getRows(masterIds)
+    : AppState.data.masterPrompts;
+
   // ローカルとマスターのプロンプトを結合
-  const prompts = [
-    ...AppState.data.localPromptList,
-    ...AppState.data.masterPrompts,
-  ];
+  const prompts = [...AppState.data.localPromptList, ...masterPrompts];
   let filtered = prompts;
 
   // カテゴリーでフィルタリング
@@ -676,6 +851,7 @@ function Search(search, data) {
   }
 
   // キーワード検索
+  const keyword = search.toLowerCase();
   const searchResults = filtered.filter((item) => {
     const searchTarget = (
       item.data[0] +
@@ -683,7 +859,7 @@ function Search(search, data) {
       item.data[2] +
       item.prompt
     ).toLowerCase();
-    return searchTarget.includes(search.toLowerCase());
+    return searchTarget.includes(keyword);
   });
 
   return searchResults;
@@ -0,0 +1,196 @@
+/**
+ * master-delta.js - マスターデータの差分パッケージ
+ * generate_master.py が出力する assets/master/delta/ の index.json と delta-<from>-<to>.json を読み込み、
+ * ストレージに保存済みの行（インポートしたマスターなど）を、全行を作り直さずに最新リリースまで更新する
+ * 保存済みの行が前のリリースと一致するキーだけを書き換え、利用者が編集したキーはそのまま残す
+ */
+const MasterDelta = {
+  BASE_PATH: "assets/master/delta/",
+
+  // index.json の内容（読み込めない場合はnull）
+  index: null,
+
+  /**
+   * インデックスを読み込み
+   * @returns {Promise<boolean>} 読み込めたか
+   */
+  async loadIndex() {
+    if (this.index) return true;
+    try {
+      const response = await fetch(
+        chrome.runtime.getURL(this.BASE_PATH + "index.json")
+      );
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      this.index = await response.json();
+      return true;
+    } catch (error) {
+      console.log("Master delta index not available:", error.message);
+      this.index = null;
+      return false;
+    }
+  },
+
+  /**
+   * 配布されている最新のリリース番号
+   * @returns {number|null}
+   */
+  getRelease() {
+    return this.index ? this.index.release : null;
+  },
+
+  /**
+   * fromRelease から最新リリースまでに当てる差分の一覧
+   * @param {number} fromRelease - 保存済みの行のリリース番号
+   * @returns {Array|null} 差分のエントリー（途中の差分が残っていなければnull）
+   */
+  chain(fromRelease) {
+    if (!this.index || fromRelease == null) return null;
+    const entries = [];
+    let release = fromRelease;
+    while (release < this.index.release) {
+      const entry = this.index.deltas.find((delta) => delta.from === release);
+      if (!entry) return null;
+      entries.push(entry);
+      release = entry.to;
+    }
+    return release === this.index.release ? entries : null;
+  },
+
+  /**
+   * マスタープロンプト配列を最新リリースに更新
+   * すべての差分を読み込めた場合のみ当てる（途中で失敗しても配列は変更しない）
+   * @param {Array} prompts - マスタープロンプト配列（その場で書き換える）
+   * @param {number} fromRelease - prompts のリリース番号
+   * @returns {Promise<{touched: number, skipped: number}|null>}
+   *   追加・削除・変更した行数と、編集済みのため残したキーの数（差分で更新できない場合はnull）
+   */
+  async update(prompts, fromRelease) {
+    if (!(await this.loadIndex())) return null;
+    const entries = this.chain(fromRelease);
+    if (!entries) return null;
+
+    let deltas;
+    try {
+      deltas = await Promise.all(
+        entries.map(async (entry) => {
+          const response = await fetch(
+            chrome.runtime.getURL(this.BASE_PATH + entry.file)
+          );
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          return response.json();
+        })
+      );
+    } catch (error) {
+      console.warn("Failed to load master delta:", error);
+      return null;
+    }
+
+    const result = { touched: 0, skipped: 0 };
+    for (const delta of deltas) {
+      const { touched, skipped } = this.apply(prompts, delta);
+      result.touched += touched;
+      result.skipped += skipped;
+    }
+    return result;
+  },
+
+  /**
+   * 1つの差分をマスタープロンプト配列に当てる
+   * 差分の各キー（大項目・中項目・小項目）の行が前のPromptの並びと一致する場合だけ新しい並びに合わせ、
+   * 余った行は削除、足りない行はそのキー（なければ同じ中項目）の最後の行の後に追加する
+   * @param {Array} prompts - マスタープロンプト配列（その場で書き換える）
+   * @param {Object} delta - delta-<from>-<to>.json の内容
+   * @returns {{touched: number, skipped: number}} 追加・削除・変更した行数と、一致せず残したキーの数
+   */
+  apply(prompts, delta) {
+    const keyOf = (major, middle, small) => `${major}\t${middle}\t${small}`;
+    const keys = new Set(delta.rows.map((row) => keyOf(row[0], row[1], row[2])));
+    const categories = new Set(delta.rows.map((row) => `${row[0]}\t${row[1]}`));
+
+    // 差分に含まれるキーの行位置と、中項目ごとの最後の行位置だけを集める
+    const positions = new Map();
+    const categoryEnds = new Map();
+    for (let i = 0; i < prompts.length; i++) {
+      const data = prompts[i].data;
+      const key = keyOf(data[0], data[1], data[2]);
+      if (keys.has(key)) {
+        if (!positions.has(key)) positions.set(key, []);
+        positions.get(key).push(i);
+      }
+      const category = `${data[0]}\t${data[1]}`;
+      if (categories.has(category)) {
+        categoryEnds.set(category, i);
+      }
+    }
+
+    // 削除・挿入は位置の大きい順に行い、前の位置がずれないようにする
+    const splices = [];
+    let touched = 0;
+    let skipped = 0;
+    delta.rows.forEach(([major, middle, small, newPrompts, oldPrompts], order) => {
+      const existing = positions.get(keyOf(major, middle, small)) || [];
+      // 前のリリースから編集されているキーは上書きしない
+      if (
+        oldPrompts &&
+        (existing.length !== oldPrompts.length ||
+          existing.some((index, i) => prompts[index].prompt !== oldPrompts[i]))
+      ) {
+        skipped++;
+        return;
+      }
+      const shared = Math.min(existing.length, newPrompts.length);
+      for (let i = 0; i < shared; i++) {
+        const item = prompts[existing[i]];
+        if (item.prompt !== newPrompts[i]) {
+          item.prompt = newPrompts[i];
+          touched++;
+        }
+      }
+      for (let i = shared; i < existing.length; i++) {
+        splices.push({ index: existing[i], order: -1, items: null });
+        touched++;
+      }
+      if (newPrompts.length > shared) {
+        const last = existing.length
+          ? existing[existing.length - 1]
+          : categoryEnds.get(`${major}\t${middle}`);
+        const items = newPrompts.slice(shared).map((prompt) => ({
+          prompt,
+          data: { 0: major, 1: middle, 2: small },
+          url: "",
+        }));
+        splices.push({
+          index: last == null ? prompts.length : last + 1,
+          order,
+          items,
+        });
+        touched += items.length;
+      }
+    });
+
+    // 同じ位置では削除を先に、追加は差分の後ろのキーから（結果が差分の順になるように）
+    splices.sort(
+      (a, b) =>
+        b.index - a.index ||
+        (a.items ? 1 : 0) - (b.items ? 1 : 0) ||
+        b.order - a.order
+    );
+    for (const { index, items } of splices) {
+      if (items) {
+        prompts.splice(index, 0, ...items);
+      } else {
+        prompts.splice(index, 1);
+      }
+    }
+    return { touched, skipped };
+  },
+};
+
+// グローバルに公開
+if (typeof window !== "undefined") {
+  window.MasterDelta = MasterDelta;
+}
@@ -0,0 +1,264 @@
+/**
+ * master-shards.js - マスターデータのシャード遅延読み込み
+ * generate_master.py が出力する assets/master/shards/ の index.json を起動時に読み込み、
+ * 大項目ごとのシャードはカテゴリー選択・検索で必要になった時点で読み込む
+ */
+const MasterShards = {
+  BASE_PATH: "assets/master/shards/",
+
+  // index.json の内容（読み込めない場合はnull）
+  index: null,
+
+  // シャードから読み込むモードか（インポートしたマスターを使う場合はfalse）
+  lazy: false,
+
+  // 読み込み済みの大項目
+  _loaded: new Set(),
+
+  // 大項目 -> 展開済みの行（シャード内の順）
+  _rows: new Map(),
+
+  // シャードごとの先頭行ID（検索インデックスの行IDはシャード順の通し番号）
+  _offsets: [],
+
+  // 読み込み中のPromise（同じシャードの二重読み込み防止）
+  _pending: new Map(),
+
+  /**
+   * インデックスを読み込み
+   * @returns {Promise<boolean>} 読み込めたか
+   */
+  async loadIndex() {
+    if (this.index) return true;
+    try {
+      const response = await fetch(
+        chrome.runtime.getURL(this.BASE_PATH + "index.json")
+      );
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      this.index = await response.json();
+
+      let offset = 0;
+      this._offsets = this.index.shards.map((shard) => {
+        const start = offset;
+        offset += shard.count;
+        return start;
+      });
+      return true;
+    } catch (error) {
+      console.log("Master shard index not available:", error.message);
+      this.index = null;
+      return false;
+    }
+  },
+
+  /**
+   * シャードの内容から求めたビルドID（検索インデックスとの対応確認用）
+   * @returns {string|null}
+   */
+  getBuild() {
+    return this.index ? this.index.build ?? null : null;
+  },
+
+  /**
+   * シャードで配布されているマスターのバージョン
+   * @returns {number|null}
+   */
+  getVersion() {
+    return this.index ? this.index.version : null;
+  },
+
+  /**
+   * シャード読み込みモードを開始（読み込み済み状態をリセット）
+   */
+  enable() {
+    this.lazy = true;
+    this._loaded.clear();
+    this._rows.clear();
+    this._pending.clear();
+  },
+
+  /**
+   * シャード読み込みモードを終了（インポートしたマスターを使う場合）
+   */
+  disable() {
+    this.lazy = false;
+    this._loaded.clear();
+    this._rows.clear();
+    this._pending.clear();
+  },
+
+  /**
+   * 大項目のシャードが読み込み済みか
+   * @param {string} major - 大項目
+   * @returns {boolean}
+   */
+  isLoaded(major) {
+    return !this.lazy || this._loaded.has(major);
+  },
+
+  /**
+   * 大項目のシャードを読み込んでマスタープロンプトに追加
+   * @param {string} major - 大項目
+   * @returns {Promise<void>}
+   */
+  async ensureCategory(major) {
+    if (!this.lazy || !this.index || this._loaded.has(major)) return;
+
+    const entry = this.index.shards.find((shard) => shard.major === major);
+    if (!entry) return;
+
+    if (!this._pending.has(major)) {
+      this._pending.set(major, this._loadShard(entry));
+    }
+    await this._pending.get(major);
+  },
+
+  /**
+   * すべてのシャードを読み込み
+   * @returns {Promise<void>}
+   */
+  async ensureAll() {
+    if (!this.lazy || !this.index) return;
+    await Promise.all(
+      this.index.shards.map((shard) => this.ensureCategory(shard.major))
+    );
+  },
+
+  /**
+   * 検索条件に必要なシャードを読み込み
+   * 大項目が指定されていればそのシャードのみ、キーワードのみの場合は
+   * 検索インデックスの候補行を含むシャードのみ、絞り込めなければすべて
+   * @param {Array} categories - カテゴリーフィルター
+   * @param {string} keyword - 検索キーワード
+   * @returns {Promise<void>}
+   */
+  async ensureForSearch(categories, keyword = "") {
+    if (categories && categories[0]) {
+      await this.ensureCategory(categories[0]);
+      return;
+    }
+
+    if (keyword && this.lazy && (await MasterSearchIndex.load())) {
+      const ids = MasterSearchIndex.lookup(keyword);
+      if (ids) {
+        await this.ensureIds(ids);
+        return;
+      }
+    }
+
+    await this.ensureAll();
+  },
+
+  /**
+   * 行IDを含むシャードを読み込み
+   * @param {number[]} ids - 行ID（昇順）
+   * @returns {Promise<void>}
+   */
+  async ensureIds(ids) {
+    const majors = new Set();
+    ids.forEach((id) => {
+      const shard = this._shardForId(id);
+      if (shard) majors.add(shard.major);
+    });
+    await Promise.all([...majors].map((major) => this.ensureCategory(major)));
+  },
+
+  /**
+   * 行IDに対応するマスタープロンプトを取得（未読み込みのシャードの行は除く）
+   * @param {number[]} ids - 行ID（昇順）
+   * @returns {Array} マスタープロンプト
+   */
+  getRows(ids) {
+    const items = [];
+    ids.forEach((id) => {
+      const shard = this._shardForId(id);
+      if (!shard) return;
+      const rows = this._rows.get(shard.major);
+      if (rows) {
+        items.push(rows[id - this._offsets[shard.position]]);
+      }
+    });
+    return items;
+  },
+
+  /**
+   * 行IDからシャード情報を二分探索
+   * @param {number} id - 行ID
+   * @returns {Object|null} { major, position }
+   */
+  _shardForId(id) {
+    if (!this.index) return null;
+    let low = 0;
+    let high = this._offsets.length - 1;
+    while (low < high) {
+      const mid = (low + high + 1) >> 1;
+      if (this._offsets[mid] <= id) {
+        low = mid;
+      } else {
+        high = mid - 1;
+      }
+    }
+    const shard = this.index.shards[low];
+    if (!shard || id >= this._offsets[low] + shard.count) return null;
+    return { major: shard.major, position: low };
+  },
+
+  /**
+   * カテゴリー一覧用の項目（シャード未読み込みでも大項目・中項目を提供）
+   * @returns {Array} { data: [大項目, 中項目] } の配列
+   */
+  categoryItems() {
+    if (!this.lazy || !this.index) return [];
+    const items = [];
+    this.index.shards.forEach((shard) => {
+      shard.middles.forEach((middle) => {
+        items.push({ data: [shard.major, middle] });
+      });
+    });
+    return items;
+  },
+
+  /**
+   * シャードを取得して展開
+   * @param {Object} entry - index.json のシャード情報
+   */
+  async _loadShard(entry) {
+    try {
+      const response = await fetch(
+        chrome.runtime.getURL(this.BASE_PATH + entry.file)
+      );
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      const shard = await response.json();
+      const strings = shard.strings;
+      const target = AppState.data.masterPrompts;
+      const rows = new Array(shard.data.length);
+
+      for (let i = 0; i < shard.data.length; i++) {
+        const row = shard.data[i];
+        rows[i] = {
+          prompt: row[2],
+          data: { 0: shard.major, 1: strings[row[0]], 2: row[1] },
+          url: "",
+        };
+        target.push(rows[i]);
+      }
+
+      this._rows.set(entry.major, rows);
+      this._loaded.add(entry.major);
+      console.log(`Loaded master shard: ${entry.major} (${shard.data.length})`);
+    } catch (error) {
+      console.error(`Failed to load master shard: ${entry.major}`, error);
+    } finally {
+      this._pending.delete(entry.major);
+    }
+  },
+};
+
+// グローバルに公開
+if (typeof window !== "undefined") {
+  window.MasterShards = MasterShards;
+}
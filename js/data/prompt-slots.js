@@ -190,8 +190,29 @@ class PromptSlotManager {
     return true;
   }
 
+  /**
+   * 抽出モードのスロットが参照するマスターのシャードを読み込む
+   * シャード読み込みモードでは masterPrompts に読み込み済みの大項目しかないため、抽出の前に待つ
+   */
+  async ensureExtractionSources() {
+    const slots = this.slots.filter(
+      (slot) => slot.mode === "random" || slot.mode === "sequential"
+    );
+    if (slots.length === 0) return;
+
+    // 大項目を指定していないスロットはマスター全体から抽出する
+    if (slots.some((slot) => !slot.category || !slot.category.big)) {
+      await MasterShards.ensureAll();
+      return;
+    }
+    await Promise.all(
+      slots.map((slot) => MasterShards.ensureCategory(slot.category.big))
+    );
+  }
+
   /**
    * 要素を抽出
+   * 呼び出し側で ensureExtractionSources を待っておくこと
    * @param {Object} slot - 対象スロット
    * @returns {string} 抽出された要素のプロンプト
    */
@@ -521,6 +542,7 @@ class PromptSlotManager {
 
   /**
    * すべての使用中スロットのプロンプトを結合（修正版）
+   * 抽出モードのスロットがある場合は、先に ensureExtractionSources を待っておくこと
    */
   getCombinedPrompt() {
     const usedSlots = this.slots.filter((slot) => {
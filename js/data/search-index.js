@@ -0,0 +1,145 @@
+/**
+ * search-index.js - マスターデータの検索インデックス
+ * generate_master.py が出力する assets/master/search-index.json（文字バイグラム -> 行ID）を使い、
+ * Search() の部分一致チェックの前にマスターの候補行を絞り込む
+ */
+const MasterSearchIndex = {
+  PATH: "assets/master/search-index.json",
+
+  // n-gram -> 行IDの差分リスト（未読み込みの場合はnull）
+  grams: null,
+  gramSize: 2,
+  build: null,
+
+  // 復元済みの行IDリスト
+  _decoded: new Map(),
+
+  // 読み込み中のPromise
+  _loading: null,
+
+  /**
+   * インデックスを読み込み（初回のみ取得）
+   * @returns {Promise<boolean>} 使用可能か
+   */
+  async load() {
+    if (this.grams) return true;
+    if (!this._loading) {
+      this._loading = (async () => {
+        try {
+          const response = await fetch(chrome.runtime.getURL(this.PATH));
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          const index = await response.json();
+          this.grams = index.grams;
+          this.gramSize = index.gram;
+          this.build = index.build ?? null;
+          this._decoded.clear();
+        } catch (error) {
+          console.log("Master search index not available:", error.message);
+        } finally {
+          this._loading = null;
+        }
+      })();
+    }
+    await this._loading;
+    return this.grams !== null;
+  },
+
+  /**
+   * インデックスが現在のマスター（シャード）と対応しているか
+   * 形式のバージョンではなく、シャードの内容から求めたビルドIDで比べる
+   * @returns {boolean}
+   */
+  isUsable() {
+    return (
+      this.grams !== null &&
+      MasterShards.lazy &&
+      this.build !== null &&
+      this.build === MasterShards.getBuild()
+    );
+  },
+
+  /**
+   * キーワードを含む可能性のあるマスター行IDを返す
+   * @param {string} keyword - 検索キーワード
+   * @returns {number[]|null} 行ID（昇順）。絞り込めない場合はnull
+   */
+  lookup(keyword) {
+    if (!this.isUsable()) return null;
+
+    // インデックスと同じくコードポイント単位で分割する（サロゲートペアを分けない）
+    const chars = Array.from(keyword.toLowerCase());
+    if (chars.length < this.gramSize) return null;
+
+    const lists = [];
+    const seen = new Set();
+    for (let i = 0; i + this.gramSize <= chars.length; i++) {
+      const gram = chars.slice(i, i + this.gramSize).join("");
+      if (seen.has(gram)) continue;
+      seen.add(gram);
+
+      const ids = this._postings(gram);
+      if (!ids) return [];
+      lists.push(ids);
+    }
+
+    // 短いリストから順に積集合を取る
+    lists.sort((a, b) => a.length - b.length);
+    let result = lists[0];
+    for (let i = 1; i < lists.length && result.length > 0; i++) {
+      result = this._intersect(result, lists[i]);
+    }
+    return result;
+  },
+
+  /**
+   * n-gramの行IDリストを復元（差分 -> 絶対値）
+   * @param {string} gram
+   * @returns {number[]|null}
+   */
+  _postings(gram) {
+    if (this._decoded.has(gram)) return this._decoded.get(gram);
+
+    const deltas = this.grams[gram];
+    if (!deltas) return null;
+
+    const ids = new Array(deltas.length);
+    let current = 0;
+    for (let i = 0; i < deltas.length; i++) {
+      current += deltas[i];
+      ids[i] = current;
+    }
+    this._decoded.set(gram, ids);
+    return ids;
+  },
+
+  /**
+   * 昇順リストの積集合
+   * @param {number[]} a
+   * @param {number[]} b
+   * @returns {number[]}
+   */
+  _intersect(a, b) {
+    const result = [];
+    let i = 0;
+    let j = 0;
+    while (i < a.length && j < b.length) {
+      if (a[i] === b[j]) {
+        result.push(a[i]);
+        i++;
+        j++;
+      } else if (a[i] < b[j]) {
+        i++;
+      } else {
+        j++;
+      }
+    }
+    return result;
+  },
+};
+
+// グローバルに公開
+if (typeof window !== "undefined") {
+  window.MasterSearchIndex = MasterSearchIndex;
+}
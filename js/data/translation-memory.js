@@ -0,0 +1,116 @@
+/**
+ * translation-memory.js - 翻訳メモリ
+ * data-management/translation_memory.py が出力する assets/master/translation-memory.json
+ * （正規化した原文 -> 訳文）を使い、登録済みのキーワードは翻訳APIを呼ばずに訳す。
+ * APIで翻訳した結果もセッション中は保持し、同じキーワードで再度APIを呼ばない
+ */
+const TranslationMemory = {
+  PATH: "assets/master/translation-memory.json",
+
+  // 方向（"en-ja" / "ja-en"）-> { 正規化した原文: 訳文 }（未読み込みの場合はnull）
+  directions: null,
+
+  // サービス名・方向・正規化した原文 -> APIの訳文
+  _session: new Map(),
+
+  // 読み込み中のPromise
+  _loading: null,
+
+  // ヒット・ミス数
+  stats: { hits: 0, misses: 0 },
+
+  /**
+   * 翻訳メモリを読み込み（初回のみ取得）
+   * @returns {Promise<boolean>} 使用可能か
+   */
+  async load() {
+    if (this.directions) return true;
+    if (!this._loading) {
+      this._loading = (async () => {
+        try {
+          const response = await fetch(chrome.runtime.getURL(this.PATH));
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          const memory = await response.json();
+          this.directions = memory.directions;
+        } catch (error) {
+          console.log("Translation memory not available:", error.message);
+        } finally {
+          this._loading = null;
+        }
+      })();
+    }
+    await this._loading;
+    return this.directions !== null;
+  },
+
+  /**
+   * メモリのキー（translation_memory.py の normalize_key と同じ正規化）
+   * @param {string} text
+   * @returns {string}
+   */
+  normalize(text) {
+    return text
+      .normalize("NFKC")
+      .toLowerCase()
+      .replace(/_/g, " ")
+      .replace(/\s+/g, " ")
+      .trim();
+  },
+
+  /**
+   * キーワードの翻訳方向（正規化後に英数字のみなら英語 -> 日本語）
+   * @param {string} keyword
+   * @returns {string}
+   */
+  directionOf(keyword) {
+    return /^[a-z0-9\s:]+$/.test(this.normalize(keyword)) ? "en-ja" : "ja-en";
+  },
+
+  /**
+   * 翻訳メモリから訳文を取得
+   * @param {string} keyword - キーワード
+   * @returns {string|null}
+   */
+  lookup(keyword) {
+    const entries = this.directions?.[this.directionOf(keyword)];
+    const translation = entries ? entries[this.normalize(keyword)] : undefined;
+    if (translation === undefined) {
+      this.stats.misses++;
+      return null;
+    }
+    this.stats.hits++;
+    return translation;
+  },
+
+  /**
+   * セッション中にAPIで翻訳した訳文を取得
+   * @param {string} serviceName - サービス名
+   * @param {string} keyword - キーワード
+   * @returns {string|undefined}
+   */
+  getSession(serviceName, keyword) {
+    return this._session.get(this._sessionKey(serviceName, keyword));
+  },
+
+  /**
+   * APIで翻訳した訳文を保持
+   * @param {string} serviceName - サービス名
+   * @param {string} keyword - キーワード
+   * @param {string} translation - 訳文
+   */
+  rememberSession(serviceName, keyword, translation) {
+    if (!translation || translation === keyword) return;
+    this._session.set(this._sessionKey(serviceName, keyword), translation);
+  },
+
+  _sessionKey(serviceName, keyword) {
+    return `${serviceName}\t${this.directionOf(keyword)}\t${this.normalize(keyword)}`;
+  },
+};
+
+// グローバルに公開
+if (typeof window !== "undefined") {
+  window.TranslationMemory = TranslationMemory;
+}
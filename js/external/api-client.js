@@ -341,27 +341,26 @@ async function translateDeepl(keyword, translateEvent) {
 
 /**
  * マスター辞書ダウンロード（互換性維持版）
+ * 保存済みの行は差分パッケージで更新し、差分で更新できない場合のみ同梱マスターで作り直す
  * @param {string} jsonURL - ダウンロードURL
  */
-function masterDicDownload(jsonURL) {
+async function masterDicDownload(jsonURL) {
   // グローバル変数の参照を維持
   const masterVersion = AppState.config.masterVersion;
-  const currentMasterVersion = defaultMaster.version;
-
-  if (masterVersion !== currentMasterVersion) {
-    console.log("Updating master dictionary...");
-
-    AppState.config.masterVersion = currentMasterVersion;
-    AppState.data.masterPrompts = [];
-
-    // 元のコードと同じ処理
-    jsonLoop(defaultMaster.data, (data) => {
-      AppState.data.masterPrompts.push({
-        prompt: data[3],
-        data: { 0: data[0], 1: data[1], 2: data[2] },
-        url: data[4],
-      });
-    });
+  const currentMasterVersion = getBundledMasterVersion();
+  const versionChanged =
+    currentMasterVersion != null && masterVersion !== currentMasterVersion;
+  const updatedByDelta = await updateMasterPromptsByDelta();
+
+  if (versionChanged || updatedByDelta) {
+    if (updatedByDelta) {
+      if (currentMasterVersion != null) {
+        AppState.config.masterVersion = currentMasterVersion;
+      }
+    } else {
+      console.log("Updating master dictionary...");
+      resetMasterPromptsToBundled();
+    }
 
     saveMasterPrompt();
     categoryData.update();
@@ -73,12 +73,15 @@ class DictionaryHandler {
         textId: "#masterDicText",
         openText: "▼要素辞書(マスタ)　※ここをクリックで開閉",
         closeText: "▶要素辞書(マスタ)　※ここをクリックで開閉",
-        createFunc: () =>
-          this.app.listManager.createList(
+        createFunc: async () => {
+          // マスター一覧はすべてのシャードが必要
+          await MasterShards.ensureAll();
+          return this.app.listManager.createList(
             "master",
             AppState.data.masterPrompts,
             "#masterDicList"
-          ),
+          );
+        },
       },
     };
 
@@ -113,6 +113,11 @@ class FileHandler {
         break;
 
       case "Master":
+        // インポートしたマスターはシャードではなくストレージから読む
+        // 現在の同梱リリースを基準として記録し、以降のリリースの差分を当てられるようにする
+        MasterShards.disable();
+        AppState.config.masterSource = "import";
+        AppState.config.masterRelease = getBundledMasterRelease();
         AppState.data.masterPrompts = [];
         data.data.forEach((item) => {
           AppState.data.masterPrompts.push({
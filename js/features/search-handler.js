@@ -21,9 +21,14 @@ class SearchHandler {
     AppState.data.searchCategory = categories;
     await saveCategory();
 
+    // 検索対象の大項目（キーワードのみの場合は候補行を含む大項目）のシャードを読み込み
+    await MasterShards.ensureForSearch(categories, keyword);
+
+    // 検索は一度だけ行い、結果を表示処理に渡す
+    const results = Search(keyword, categories);
+
     // ローディング表示の制御（翻訳が必要な場合のみ表示）
-    const needsTranslation =
-      keyword && Search(keyword, categories).length === 0;
+    const needsTranslation = keyword && results.length === 0;
     const showLoading = options.showLoading !== false && needsTranslation;
 
     if (showLoading) {
@@ -31,7 +36,7 @@ class SearchHandler {
       await ErrorHandler.handleAsync(
         async () => {
           AppState.ui.isSearching = true;
-          await this.doSearch(keyword, categories);
+          await this.doSearch(keyword, categories, results);
           AppState.ui.isSearching = false;
         },
         "検索処理",
@@ -40,7 +45,7 @@ class SearchHandler {
     } else {
       // ローディング不要な場合は直接実行
       AppState.ui.isSearching = true;
-      await this.doSearch(keyword, categories);
+      await this.doSearch(keyword, categories, results);
       AppState.ui.isSearching = false;
     }
   }
@@ -49,11 +54,14 @@ class SearchHandler {
    * 検索処理の実行
    * @param {string} keyword - 検索キーワード
    * @param {Array} categories - カテゴリーフィルター
+   * @param {Array} [results] - 検索済みの結果（省略時はここで検索）
    */
-  async doSearch(keyword, categories) {
+  async doSearch(keyword, categories, results = null) {
     ListBuilder.clearList("#promptList");
 
-    const results = Search(keyword, categories);
+    if (!results) {
+      results = Search(keyword, categories);
+    }
 
     if (results.length > 0) {
       await this.app.listManager.createList("search", results, "#promptList", {
@@ -88,6 +96,22 @@ class SearchHandler {
     const translationPromises = [];
     const results = [];
 
+    // 翻訳メモリに登録済みのキーワードは翻訳APIを呼ばない
+    await TranslationMemory.load();
+    const memorized = TranslationMemory.lookup(keyword);
+    if (memorized) {
+      if (isSearchElement) {
+        isSearchElement.innerHTML = "";
+      }
+      await this.app.listManager.createList(
+        "search",
+        [this.createTranslationResult(keyword, "翻訳メモリ", memorized)],
+        "#promptList",
+        { isSave: true }
+      );
+      return;
+    }
+
     // Google翻訳
     translationPromises.push(
       this.translateWithService(keyword, "Google", translateGoogle).then(
@@ -123,23 +147,47 @@ class SearchHandler {
    * @returns {Promise<Object>} 翻訳結果
    */
   async translateWithService(keyword, serviceName, translateFunc) {
+    // セッション中に同じキーワードを翻訳済みならAPIを呼ばない
+    const cached = TranslationMemory.getSession(serviceName, keyword);
+    if (cached) {
+      return this.createTranslationResult(keyword, `${serviceName}翻訳`, cached);
+    }
+
     return new Promise((resolve) => {
       translateFunc(keyword, (translatedText) => {
-        const isAlphanumeric = /^[a-zA-Z0-9\s:]+$/.test(keyword);
-        const data = isAlphanumeric
-          ? {
-              prompt: keyword,
-              data: { 0: "", 1: `${serviceName}翻訳`, 2: translatedText },
-            }
-          : {
-              prompt: translatedText,
-              data: { 0: "", 1: `${serviceName}翻訳`, 2: keyword },
-            };
-        resolve(data);
+        TranslationMemory.rememberSession(serviceName, keyword, translatedText);
+        resolve(
+          this.createTranslationResult(
+            keyword,
+            `${serviceName}翻訳`,
+            translatedText
+          )
+        );
       });
     });
   }
 
+  /**
+   * 翻訳結果の検索結果項目を作成
+   * @param {string} keyword - 翻訳したキーワード
+   * @param {string} label - 中項目に表示する翻訳元
+   * @param {string} translatedText - 訳文
+   * @returns {Object} 検索結果項目
+   */
+  createTranslationResult(keyword, label, translatedText) {
+    // 表示の向きは従来どおり入力そのものの文字種で決める（翻訳メモリのキーとは別）
+    const isAlphanumeric = /^[a-zA-Z0-9\s:]+$/.test(keyword);
+    return isAlphanumeric
+      ? {
+          prompt: keyword,
+          data: { 0: "", 1: label, 2: translatedText },
+        }
+      : {
+          prompt: translatedText,
+          data: { 0: "", 1: label, 2: keyword },
+        };
+  }
+
   /**
    * カテゴリー検索をリセット
    */
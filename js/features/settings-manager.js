@@ -31,6 +31,7 @@ class SettingsManager {
           categoryData: allData.categoryData || [[], [], []],
           masterPrompts: allData.masterPrompts || [],
           masterVersion: allData.masterVersion || 0,
+          masterRelease: allData.masterRelease ?? null,
         },
         ui: {
           currentPrompt: allData.generatePrompt || "",
@@ -112,6 +113,8 @@ class SettingsManager {
       if (includeMaster && importData.data?.masterPrompts) {
         dataToImport.masterPrompts = importData.data.masterPrompts;
         dataToImport.masterVersion = importData.data.masterVersion;
+        // 差分パッケージは同じリリースの行にだけ当てる（不明なら次回は全行を作り直す）
+        dataToImport.masterRelease = importData.data.masterRelease ?? null;
       }
 
       // 現在のプロンプト
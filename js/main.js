@@ -165,6 +165,16 @@ class PromptGeneratorApp {
 
       promptSlotManager.updateUI();
 
+      // 残りのマスターシャードはアイドル時に先読み（辞書一覧・編集タブのカテゴリー表示用）
+      if (MasterShards.lazy) {
+        const prefetch = () => MasterShards.ensureAll();
+        if (typeof requestIdleCallback === "function") {
+          requestIdleCallback(prefetch, { timeout: 3000 });
+        } else {
+          setTimeout(prefetch, 1000);
+        }
+      }
+
       // 自動Generate機能の初期化（NAIチェックを削除）
       setTimeout(() => {
         if (window.autoGenerateHandler) {
@@ -653,7 +663,8 @@ class PromptGeneratorApp {
     const generateButton = document.getElementById("GeneratoButton");
     if (generateButton) {
       // マウスオーバーで結合プレビューを表示
-      generateButton.addEventListener("mouseenter", () => {
+      generateButton.addEventListener("mouseenter", async () => {
+        await promptSlotManager.ensureExtractionSources();
         const combined = promptSlotManager.getCombinedPrompt();
         const usedSlots = promptSlotManager.getUsedSlots();
 
@@ -713,7 +724,8 @@ class PromptGeneratorApp {
 
     const masterDownload = document.getElementById("MasterDownload");
     if (masterDownload) {
-      masterDownload.addEventListener("click", () => {
+      masterDownload.addEventListener("click", async () => {
+        await MasterShards.ensureAll();
         jsonDownload(AppState.data.masterPrompts, "Elements");
       });
     }
@@ -852,8 +864,9 @@ class PromptGeneratorApp {
     });
   }
 
-  generatePrompt() {
-    // 使用中のスロットを結合
+  async generatePrompt() {
+    // 使用中のスロットを結合（抽出元のマスターを先に読み込む）
+    await promptSlotManager.ensureExtractionSources();
     const combinedPrompt = promptSlotManager.getCombinedPrompt();
 
     if (!combinedPrompt) {
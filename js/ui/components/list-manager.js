@@ -575,7 +575,8 @@ class PromptListManager {
     const weight = item[shaping].weight;
     const prompt = item.Value.toLowerCase().trim();
 
-    // カテゴリー検索
+    // カテゴリー検索（シャード読み込みモードでは該当しうるシャードを先に読み込む）
+    await MasterShards.ensureForSearch([], prompt);
     let category = null;
     const findCategory = (dataList) => {
       return (
@@ -778,8 +779,9 @@ class PromptListManager {
       );
     });
 
-    categoryInputs[2].on("change", function () {
+    categoryInputs[2].on("change", async function () {
       const inputValue = $(this).val();
+      await MasterShards.ensureCategory(categoryInputs[0].val());
 
       // マスターとローカル両方から検索（修正済み）
       const masterPrompt = AppState.data.masterPrompts.find(
@@ -211,12 +211,15 @@
             textId: "#masterDicText",
             openText: "▼要素辞書(マスタ)　※ここをクリックで開閉",
             closeText: "▶要素辞書(マスタ)　※ここをクリックで開閉",
-            createFunc: () =>
-              this.listManager.createList(
+            createFunc: async () => {
+              // マスター一覧はすべてのシャードが必要
+              await MasterShards.ensureAll();
+              return this.listManager.createList(
                 "master",
                 AppState.data.masterPrompts,
                 "#masterDicList"
-              ),
+              );
+            },
           },
         };
 
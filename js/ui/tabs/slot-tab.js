@@ -407,11 +407,14 @@
               categories.add(item.data[0]);
             }
           });
-          AppState.data.masterPrompts.forEach((item) => {
-            if (item.data && item.data[0]) {
-              categories.add(item.data[0]);
+          // シャード未読み込みの大項目はインデックスから補う
+          [...AppState.data.masterPrompts, ...MasterShards.categoryItems()].forEach(
+            (item) => {
+              if (item.data && item.data[0]) {
+                categories.add(item.data[0]);
+              }
             }
-          });
+          );
         }
 
         return Array.from(categories).sort();
@@ -428,11 +431,13 @@
             categories.add(item.data[1]);
           }
         });
-        AppState.data.masterPrompts.forEach((item) => {
-          if (item.data && item.data[0] === bigCategory && item.data[1]) {
-            categories.add(item.data[1]);
+        [...AppState.data.masterPrompts, ...MasterShards.categoryItems()].forEach(
+          (item) => {
+            if (item.data && item.data[0] === bigCategory && item.data[1]) {
+              categories.add(item.data[1]);
+            }
           }
-        });
+        );
 
         // まずクリアしてから追加
         select.innerHTML = '<option value="">すべて</option>';
@@ -538,10 +543,11 @@
       /**
        * 結合プレビューを表示（モーダルダイアログ版）
        */
-      showCombinePreview() {
+      async showCombinePreview() {
         const modal = document.getElementById("combine-preview-modal");
         if (!modal) return;
 
+        await this.slotManager.ensureExtractionSources();
         const combined = this.slotManager.getCombinedPrompt();
         const usedSlots = this.slotManager.getUsedSlots();
 